@@ -22,7 +22,10 @@ Key Features:
 import os
 import re
 import logging
-from typing import Dict, Any, List, Optional, Tuple
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError, as_completed
+from typing import Callable, Dict, Any, List, Optional, Tuple
 from datetime import datetime
 from dotenv import load_dotenv
 import anthropic
@@ -37,6 +40,7 @@ from src.tools.calculator_tool import CalculatorTool
 from src.tools.gurufocus_tool import GuruFocusTool
 from src.tools.web_search_tool import WebSearchTool
 from src.tools.sec_filing_tool import SECFilingTool
+from src.utils.retry import MAX_RETRIES as MAX_API_RETRIES, backoff_delay, is_retryable, with_retries
 
 # Load environment variables
 load_dotenv()
@@ -72,6 +76,27 @@ class WarrenBuffettAgent:
     CONTEXT_PRUNE_THRESHOLD = 100000  # Start pruning at 100K tokens (conservative for safety)
     MIN_RECENT_MESSAGES = 4  # Keep at least last 2 exchanges (user+assistant pairs)
 
+    # Deep dive: prior-year analyses run concurrently, this many at a time
+    # (DEEP_DIVE_CONCURRENCY overrides it per agent, see _parse_concurrency)
+    DEFAULT_DEEP_DIVE_CONCURRENCY = 3
+    DEEP_DIVE_CONCURRENCY = DEFAULT_DEEP_DIVE_CONCURRENCY
+
+    # Minimum seconds between partial-text updates while streaming a thesis
+    STREAM_UPDATE_INTERVAL = 0.05
+
+    # Tool dispatch
+    MAX_PARALLEL_TOOLS = 4  # Worker threads for independent tool calls in one turn
+    TOOL_NAME_MAP = {
+        "gurufocus_tool": "gurufocus",
+        "sec_filing_tool": "sec_filing",
+        "web_search_tool": "web_search",
+        "calculator_tool": "calculator"
+    }
+    PARALLEL_TOOLS_PROMPT = (
+        "When you need multiple independent pieces of information, call all the "
+        "relevant tools in a single response so they run in parallel."
+    )
+
     @property
     def current_year(self) -> int:
         """Get the current calendar year."""
@@ -116,7 +141,8 @@ class WarrenBuffettAgent:
         # Keep legacy client for anthropic-specific features (like error handling)
         self.api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
         if self.api_key:
-            self.client = anthropic.Anthropic(api_key=self.api_key)
+            # Retries are handled per turn in _run_react_loop (src.utils.retry)
+            self.client = anthropic.Anthropic(api_key=self.api_key, max_retries=0)
         else:
             self.client = None  # Will use LLM abstraction
 
@@ -130,6 +156,17 @@ class WarrenBuffettAgent:
         }
         logger.info(f"Initialized {len(self.tools)} tools successfully")
 
+        # Prior-year worker count for deep dives
+        concurrency = os.getenv("DEEP_DIVE_CONCURRENCY")
+        if concurrency is not None:
+            self.DEEP_DIVE_CONCURRENCY = self._parse_concurrency(concurrency)
+
+        # Claude API tool definitions, built on first use (see _get_tool_definitions)
+        self._tool_definitions: Optional[List[Dict[str, Any]]] = None
+
+        # Guards the token counters shared by concurrently running loops
+        self._usage_lock = threading.Lock()
+
         # Build system prompt with Buffett personality + tool descriptions
         self.system_prompt = self._build_system_prompt()
         logger.info(f"System prompt built ({len(self.system_prompt)} characters)")
@@ -144,37 +181,42 @@ class WarrenBuffettAgent:
         buffett_prompt = get_buffett_personality_prompt()
         tool_descriptions = get_tool_descriptions_for_prompt()
 
-        return f"{buffett_prompt}\n\n{tool_descriptions}"
+        return f"{buffett_prompt}\n\n{tool_descriptions}\n\n{self.PARALLEL_TOOLS_PROMPT}"
 
     def _get_tool_definitions(self) -> List[Dict[str, Any]]:
         """
         Convert basīrah tools to Claude API tool format.
 
+        Built once per instance: the tools' descriptions and schemas are
+        fixed, and the list is sent unchanged on every turn.
+
         Returns:
             List of tool definitions for Claude API
         """
-        return [
-            {
-                "name": "gurufocus_tool",
-                "description": self.tools["gurufocus"].description,
-                "input_schema": self.tools["gurufocus"].parameters
-            },
-            {
-                "name": "sec_filing_tool",
-                "description": self.tools["sec_filing"].description,
-                "input_schema": self.tools["sec_filing"].parameters
-            },
-            {
-                "name": "web_search_tool",
-                "description": self.tools["web_search"].description,
-                "input_schema": self.tools["web_search"].parameters
-            },
-            {
-                "name": "calculator_tool",
-                "description": self.tools["calculator"].description,
-                "input_schema": self.tools["calculator"].parameters
-            }
-        ]
+        if self._tool_definitions is None:
+            self._tool_definitions = [
+                {
+                    "name": "gurufocus_tool",
+                    "description": self.tools["gurufocus"].description,
+                    "input_schema": self.tools["gurufocus"].parameters
+                },
+                {
+                    "name": "sec_filing_tool",
+                    "description": self.tools["sec_filing"].description,
+                    "input_schema": self.tools["sec_filing"].parameters
+                },
+                {
+                    "name": "web_search_tool",
+                    "description": self.tools["web_search"].description,
+                    "input_schema": self.tools["web_search"].parameters
+                },
+                {
+                    "name": "calculator_tool",
+                    "description": self.tools["calculator"].description,
+                    "input_schema": self.tools["calculator"].parameters
+                }
+            ]
+        return self._tool_definitions
 
     def analyze_company(
         self,
@@ -295,6 +337,32 @@ class WarrenBuffettAgent:
         initial_message = self._get_quick_screen_prompt(ticker)
         return self._run_analysis_loop(ticker, initial_message)
 
+    def prefetch_deep_dive(self, ticker: str, years_to_analyze: int = 3) -> int:
+        """
+        Warm the SEC filing cache for a deep dive the user may start next.
+
+        Fetches the same full 10-Ks a deep dive reads first (most recent and
+        each prior year), so if the deep dive follows, its filing reads are
+        served from SECFilingTool's cache. Safe to discard: nothing else
+        depends on it having run.
+
+        Args:
+            ticker: Stock ticker
+            years_to_analyze: Years the deep dive would cover (1-10)
+
+        Returns:
+            int: Number of filings fetched successfully
+        """
+        requests_list = [{"ticker": ticker, "filing_type": "10-K", "section": "full"}]
+        requests_list += [
+            {"ticker": ticker, "filing_type": "10-K", "section": "full", "year": self.most_recent_fiscal_year - 1 - i}
+            for i in range(max(0, years_to_analyze - 1))
+        ]
+
+        logger.info(f"Prefetching {len(requests_list)} 10-K filings for {ticker}")
+        results = self.tools["sec_filing"].execute_batch(requests_list)
+        return sum(1 for r in results if r.get("success"))
+
     def _analyze_deep_dive_with_context_management(
         self,
         ticker: str,
@@ -994,6 +1062,9 @@ comparison.
         3. Create 2-3K token summary
         4. Return summary (NOT full text)
 
+        Years are independent until synthesis, so up to DEEP_DIVE_CONCURRENCY
+        of them are analyzed at the same time (see _analyze_prior_year).
+
         This prevents context overflow while maintaining historical perspective.
 
         Args:
@@ -1012,53 +1083,119 @@ comparison.
                 [2018, 2017, 2016]  # Missing years
             )
         """
-        summaries = []
-        missing_years = []  # Track years where 10-Ks weren't available
-        most_recent_year = self.most_recent_fiscal_year
+        years = [self.most_recent_fiscal_year - 1 - i for i in range(num_years)]  # 2023, 2022, etc.
+        if not years:
+            return [], []
+
+        # Each prior year is independent until synthesis, so years run
+        # concurrently; progress is reported from this thread as they finish
+        # (the callback may update UI that only the calling thread can touch)
+        workers = max(1, min(self.DEEP_DIVE_CONCURRENCY, num_years))
+        logger.info(f"  Analyzing {num_years} prior years ({workers} at a time)...")
+        if num_years > 1:
+            message = f"📅 Reading FY {years[-1]}-{years[0]} 10-Ks ({workers} at a time)..."
+        else:
+            message = f"📅 Year 2 of {years_to_analyze}: Reading FY {years[0]} 10-K..."
+        self._report_progress(stage="prior_years", progress=0.4, message=message)
 
-        for i in range(num_years):
-            year = most_recent_year - 1 - i  # 2023, 2022, etc. (starting from year before most recent)
-            year_number = i + 2  # Year 2 of total analysis (after most recent which is year 1)
+        results: Dict[int, Optional[Dict[str, Any]]] = {}
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="prior-year")
+        try:
+            futures = {
+                executor.submit(self._analyze_prior_year, ticker, year): year
+                for year in years
+            }
+            for future in as_completed(futures):
+                year = futures[future]
+                results[year] = future.result()
+
+                # Stage 2 covers 40-80% of total progress, split across prior years
+                done = len(results)
+                self._report_progress(
+                    stage="prior_years",
+                    progress=0.4 + (done / num_years) * 0.4,
+                    message=(
+                        f"✅ {done} of {num_years} prior years complete: FY {year} analyzed"
+                        if results[year] is not None
+                        else f"⏭️ {done} of {num_years} prior years complete: FY {year} 10-K not available"
+                    )
+                )
+        finally:
+            # If a year failed, drop the years still queued and wait for the
+            # running ones, so no ReAct loop keeps calling the API afterwards
+            executor.shutdown(wait=True, cancel_futures=True)
 
-            # Calculate progress within Stage 2 (40-80% overall)
-            # Stage 2 covers 40% of total progress, distributed across prior years
-            if num_years > 0:
-                year_progress_start = 0.4 + (i / num_years) * 0.4
-                year_progress_end = 0.4 + ((i + 1) / num_years) * 0.4
-            else:
-                year_progress_start = 0.4
-                year_progress_end = 0.8
+        summaries = [results[year] for year in years if results[year] is not None]
+        missing_years = [year for year in years if results[year] is None]
 
-            logger.info(f"  Checking availability of {year} 10-K for {ticker}...")
+        # Log summary of missing years
+        if missing_years:
+            logger.warning(f"Skipped {len(missing_years)} years due to unavailable 10-Ks: {', '.join(map(str, sorted(missing_years, reverse=True)))}")
 
-            # Pre-check if filing exists to avoid wasting iterations
-            try:
-                filing_check = self.tools["sec_filing"].execute(
-                    ticker=ticker,
-                    filing_type="10-K",
-                    section="full",
-                    year=year
-                )
+        return summaries, missing_years
 
-                if not filing_check.get("success"):
-                    logger.warning(f"  Skipping {year}: 10-K not available ({filing_check.get('error', 'unknown error')})")
-                    logger.info(f"  Note: This is common for companies spun off from parent companies or with limited filing history")
-                    missing_years.append(year)  # Track missing year
-                    continue
+    @classmethod
+    def _parse_concurrency(cls, value: str) -> int:
+        """
+        Parse a DEEP_DIVE_CONCURRENCY value.
 
-            except Exception as e:
-                logger.warning(f"  Skipping {year}: Unable to retrieve 10-K ({str(e)})")
-                missing_years.append(year)  # Track missing year
-                continue
+        Args:
+            value: Number of prior years to analyze at a time, as configured
 
-            logger.info(f"  Analyzing {year} 10-K for {ticker}...")
-            self._report_progress(
-                stage="prior_years",
-                progress=year_progress_start,
-                message=f"📅 Year {year_number} of {years_to_analyze}: Reading FY {year} 10-K..."
+        Returns:
+            The worker count (at least 1), or DEFAULT_DEEP_DIVE_CONCURRENCY if
+            value isn't an integer
+        """
+        try:
+            concurrency = int(value)
+        except ValueError:
+            logger.warning(
+                "Invalid DEEP_DIVE_CONCURRENCY=%r (must be an integer); using %s",
+                value, cls.DEFAULT_DEEP_DIVE_CONCURRENCY
+            )
+            return cls.DEFAULT_DEEP_DIVE_CONCURRENCY
+        if concurrency < 1:
+            logger.warning("DEEP_DIVE_CONCURRENCY=%r is below 1; using 1", value)
+            return 1
+        return concurrency
+
+    def _analyze_prior_year(self, ticker: str, year: int) -> Optional[Dict[str, Any]]:
+        """
+        Analyze one prior year's 10-K and summarize it (Stage 2 worker).
+
+        Runs on a worker thread of _analyze_prior_years, so it must not
+        report progress itself.
+
+        Args:
+            ticker: Stock ticker
+            year: Fiscal year to analyze
+
+        Returns:
+            Year summary dict, or None if the 10-K is not available
+        """
+        logger.info(f"  Checking availability of {year} 10-K for {ticker}...")
+
+        # Pre-check if filing exists to avoid wasting iterations
+        try:
+            filing_check = self.tools["sec_filing"].execute(
+                ticker=ticker,
+                filing_type="10-K",
+                section="full",
+                year=year
             )
 
-            prior_year_prompt = f"""I'd like you to analyze {ticker}'s {year} annual report (10-K).
+            if not filing_check.get("success"):
+                logger.warning(f"  Skipping {year}: 10-K not available ({filing_check.get('error', 'unknown error')})")
+                logger.info(f"  Note: This is common for companies spun off from parent companies or with limited filing history")
+                return None
+
+        except Exception as e:
+            logger.warning(f"  Skipping {year}: Unable to retrieve 10-K ({str(e)})")
+            return None
+
+        logger.info(f"  Analyzing {year} 10-K for {ticker}...")
+
+        prior_year_prompt = f"""I'd like you to analyze {ticker}'s {year} annual report (10-K).
 
 **CONTEXT:**
 
@@ -1127,42 +1264,29 @@ trends without overwhelming the context window.
 Focus on facts and metrics that matter for long-term investment decisions.
 """
 
-            # Analyze this prior year
-            result = self._run_analysis_loop(ticker, prior_year_prompt)
-
-            # Extract the summary from the response
-            summary_text = self._extract_summary_from_response(
-                result.get('thesis', ''),
-                year=year
-            )
-
-            # Extract key metrics
-            key_metrics = self._extract_metrics_from_summary(summary_text)
-
-            # Estimate tokens
-            token_estimate = len(summary_text) // 4
+        # Analyze this prior year
+        result = self._run_analysis_loop(ticker, prior_year_prompt)
 
-            summaries.append({
-                'year': year,
-                'summary': summary_text,
-                'key_metrics': key_metrics,
-                'token_estimate': token_estimate
-            })
+        # Extract the summary from the response
+        summary_text = self._extract_summary_from_response(
+            result.get('thesis', ''),
+            year=year
+        )
 
-            logger.info(f"  Created {year} summary: ~{token_estimate} tokens")
+        # Extract key metrics
+        key_metrics = self._extract_metrics_from_summary(summary_text)
 
-            # Report progress for this completed year
-            self._report_progress(
-                stage="prior_years",
-                progress=year_progress_end,
-                message=f"✅ Year {year_number} of {years_to_analyze} complete: FY {year} analyzed"
-            )
+        # Estimate tokens
+        token_estimate = len(summary_text) // 4
 
-        # Log summary of missing years
-        if missing_years:
-            logger.warning(f"Skipped {len(missing_years)} years due to unavailable 10-Ks: {', '.join(map(str, sorted(missing_years, reverse=True)))}")
+        logger.info(f"  Created {year} summary: ~{token_estimate} tokens")
 
-        return summaries, missing_years
+        return {
+            'year': year,
+            'summary': summary_text,
+            'key_metrics': key_metrics,
+            'token_estimate': token_estimate
+        }
 
     def _get_complete_thesis_prompt(
         self,
@@ -1629,8 +1753,16 @@ Now begin writing Section 1 and continue through Section 10 without stopping.
         logger.info(f"Synthesis prompt size: {prompt_chars:,} characters (~{prompt_tokens_est:,} tokens)")
         logger.info(f"MAX_TOKENS available for response: {self.MAX_TOKENS:,}")
 
-        # Run final synthesis
-        result = self._run_analysis_loop(ticker, synthesis_prompt)
+        # Run final synthesis, streaming the thesis text to the UI as it is written
+        on_text = None
+        if self._progress_callback:
+            on_text = lambda text: self._report_progress(
+                stage="synthesis",
+                progress=0.8,
+                message="🧠 Stage 3: Writing investment thesis...",
+                partial_text=text
+            )
+        result = self._run_analysis_loop(ticker, synthesis_prompt, on_text=on_text)
 
         # Parse decision from result
         decision_data = self._parse_decision(ticker, result.get('thesis', ''))
@@ -1674,7 +1806,13 @@ Now begin writing Section 1 and continue through Section 10 without stopping.
     # HELPER METHODS FOR PROGRESS REPORTING
     # ========================================================================
 
-    def _report_progress(self, stage: str, progress: float, message: str):
+    def _report_progress(
+        self,
+        stage: str,
+        progress: float,
+        message: str,
+        partial_text: Optional[str] = None
+    ):
         """
         Report progress to callback if provided.
 
@@ -1682,14 +1820,18 @@ Now begin writing Section 1 and continue through Section 10 without stopping.
             stage: Current stage (e.g., "current_year", "prior_years", "synthesis")
             progress: Progress as float 0.0-1.0 (0-100%)
             message: Human-readable status message
+            partial_text: Thesis text streamed so far (synthesis stage only)
         """
         if self._progress_callback:
+            progress_info = {
+                "stage": stage,
+                "progress": progress,
+                "message": message
+            }
+            if partial_text is not None:
+                progress_info["partial_text"] = partial_text
             try:
-                self._progress_callback({
-                    "stage": stage,
-                    "progress": progress,
-                    "message": message
-                })
+                self._progress_callback(progress_info)
             except Exception as e:
                 logger.warning(f"Progress callback failed: {e}")
 
@@ -1992,7 +2134,8 @@ Now begin writing Section 1 and continue through Section 10 without stopping.
     def _run_analysis_loop(
         self,
         ticker: str,
-        initial_message: str
+        initial_message: str,
+        on_text: Optional[Callable[[str], None]] = None
     ) -> Dict[str, Any]:
         """
         Smart ReAct loop that automatically chooses the best implementation.
@@ -2020,7 +2163,7 @@ Now begin writing Section 1 and continue through Section 10 without stopping.
         # For Claude: Use native Extended Thinking + Tool Use
         if provider_name == 'Claude' and self.client is not None:
             logger.info("Using Claude-native ReAct loop (Extended Thinking + Tool Use)")
-            return self._run_react_loop(ticker, initial_message)
+            return self._run_react_loop(ticker, initial_message, on_text=on_text)
 
         # For all other providers: Use Universal ReAct Loop
         logger.info(f"Using Universal ReAct loop with JSON tool calling")
@@ -2069,7 +2212,8 @@ Now begin writing Section 1 and continue through Section 10 without stopping.
     def _run_react_loop(
         self,
         ticker: str,
-        initial_message: str
+        initial_message: str,
+        on_text: Optional[Callable[[str], None]] = None
     ) -> Dict[str, Any]:
         """
         Run the ReAct (Reasoning + Acting) loop with Extended Thinking.
@@ -2083,6 +2227,9 @@ Now begin writing Section 1 and continue through Section 10 without stopping.
         Args:
             ticker: Stock ticker
             initial_message: Initial prompt to agent
+            on_text: Optional callback receiving the text written so far in
+                the current turn, as it streams (throttled to
+                STREAM_UPDATE_INTERVAL)
 
         Returns:
             dict: Analysis results with decision and thesis
@@ -2090,6 +2237,7 @@ Now begin writing Section 1 and continue through Section 10 without stopping.
         messages = [{"role": "user", "content": initial_message}]
         tool_calls_made = 0
         iteration = 0
+        api_retries = 0  # Transient API failures retried so far (bounded per loop)
 
         logger.info(f"Starting ReAct loop (max {self.MAX_ITERATIONS} iterations)")
 
@@ -2127,6 +2275,10 @@ Now begin writing Section 1 and continue through Section 10 without stopping.
                 input_tokens = 0
                 output_tokens = 0
 
+                # Text streamed so far this turn (for on_text)
+                streamed_text = ""
+                last_text_update = 0.0
+
                 logger.debug("Processing streaming response...")
 
                 for event in stream:
@@ -2171,6 +2323,12 @@ Now begin writing Section 1 and continue through Section 10 without stopping.
                             logger.debug(f"[Accumulated signature: {len(current_block['signature'])} chars]")
                         elif delta.type == "text_delta":
                             current_block["text"] += delta.text
+                            if on_text is not None:
+                                streamed_text += delta.text
+                                now = time.monotonic()
+                                if now - last_text_update >= self.STREAM_UPDATE_INTERVAL:
+                                    last_text_update = now
+                                    on_text(streamed_text)
                         elif delta.type == "input_json_delta":
                             # Accumulate JSON input for tool use
                             if "input_json" not in current_block:
@@ -2218,9 +2376,14 @@ Now begin writing Section 1 and continue through Section 10 without stopping.
                     elif event.type == "message_stop":
                         logger.debug("Stream completed")
 
-                # Update token usage
-                self._total_input_tokens += input_tokens
-                self._total_output_tokens += output_tokens
+                # Flush the tail that arrived inside the last throttle window
+                if on_text is not None and streamed_text:
+                    on_text(streamed_text)
+
+                # Update token usage (prior-year loops may run concurrently)
+                with self._usage_lock:
+                    self._total_input_tokens += input_tokens
+                    self._total_output_tokens += output_tokens
                 logger.debug(f"Tokens - Input: {input_tokens}, Output: {output_tokens}")
 
                 # Add assistant's response to conversation
@@ -2233,20 +2396,17 @@ Now begin writing Section 1 and continue through Section 10 without stopping.
 
                 # If agent used tools, execute them
                 if tool_uses:
-                    tool_results = []
+                    tool_calls_made += len(tool_uses)
+                    results = self._execute_tool_uses(tool_uses)
 
-                    for tool_use in tool_uses:
-                        tool_calls_made += 1
-                        result = self._execute_tool(
-                            tool_use.name,
-                            tool_use.input
-                        )
-
-                        tool_results.append({
+                    tool_results = [
+                        {
                             "type": "tool_result",
                             "tool_use_id": tool_use.id,
                             "content": str(result)
-                        })
+                        }
+                        for tool_use, result in zip(tool_uses, results)
+                    ]
 
                     # Add tool results to conversation
                     messages.append({
@@ -2302,11 +2462,6 @@ Now begin writing Section 1 and continue through Section 10 without stopping.
 
                 return decision_data
 
-            except anthropic.RateLimitError as e:
-                logger.warning(f"Rate limit hit: {e}")
-                # In production, you'd want to implement backoff/retry
-                raise
-
             except anthropic.BadRequestError as e:
                 # Handle "prompt is too long" errors
                 error_msg = str(e)
@@ -2334,6 +2489,19 @@ Now begin writing Section 1 and continue through Section 10 without stopping.
                     raise
 
             except anthropic.APIError as e:
+                # Rate limits, overload and dropped connections: wait and redo
+                # this turn (nothing from the failed stream was kept)
+                if is_retryable(e) and api_retries < MAX_API_RETRIES:
+                    delay = backoff_delay(api_retries)
+                    api_retries += 1
+                    logger.warning(
+                        f"Transient API error ({e}), retrying turn in {delay:.1f}s "
+                        f"({api_retries}/{MAX_API_RETRIES})"
+                    )
+                    time.sleep(delay)
+                    iteration -= 1  # The failed turn doesn't count towards MAX_ITERATIONS
+                    continue
+
                 logger.error(f"Anthropic API error: {e}")
                 raise
 
@@ -2359,6 +2527,69 @@ Now begin writing Section 1 and continue through Section 10 without stopping.
             }
         }
 
+    def _execute_tool_uses(self, tool_uses: List[Any]) -> List[Dict[str, Any]]:
+        """
+        Execute all tool calls from one model turn.
+
+        Independent calls run concurrently on a small thread pool; tools that
+        set ``serialize = True`` run one at a time afterwards. Results are
+        returned in the same order as ``tool_uses`` so each tool_result lines
+        up with its tool_use block.
+
+        Args:
+            tool_uses: Tool-use blocks with .name and .input attributes
+
+        Returns:
+            List of tool execution results, one per tool use
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(tool_uses)
+        parallel = []
+        serial = []
+        for index, tool_use in enumerate(tool_uses):
+            tool = self.tools.get(self.TOOL_NAME_MAP.get(tool_use.name))
+            if tool is not None and tool.serialize:
+                serial.append(index)
+            else:
+                parallel.append(index)
+
+        if len(parallel) == 1:
+            # Nothing to overlap with; skip the pool
+            serial.insert(0, parallel.pop())
+
+        if parallel:
+            executor = ThreadPoolExecutor(
+                max_workers=min(self.MAX_PARALLEL_TOOLS, len(parallel)),
+                thread_name_prefix="tool"
+            )
+            try:
+                futures = [
+                    (index, executor.submit(
+                        self._execute_tool, tool_uses[index].name, tool_uses[index].input
+                    ))
+                    for index in parallel
+                ]
+                for index, future in futures:
+                    tool_name = tool_uses[index].name
+                    tool = self.tools.get(self.TOOL_NAME_MAP.get(tool_name))
+                    timeout = tool.timeout_sec if tool is not None else None
+                    try:
+                        results[index] = future.result(timeout=timeout)
+                    except FutureTimeoutError:
+                        logger.warning(f"{tool_name} timed out after {timeout}s")
+                        results[index] = {
+                            "success": False,
+                            "error": f"Tool execution timed out after {timeout} seconds",
+                            "data": None
+                        }
+            finally:
+                # Don't block the turn on a call that already timed out
+                executor.shutdown(wait=False)
+
+        for index in serial:
+            results[index] = self._execute_tool(tool_uses[index].name, tool_uses[index].input)
+
+        return results
+
     def _execute_tool(
         self,
         tool_name: str,
@@ -2375,14 +2606,7 @@ Now begin writing Section 1 and continue through Section 10 without stopping.
             dict: Tool execution result
         """
         # Map tool names to tool instances
-        tool_map = {
-            "gurufocus_tool": "gurufocus",
-            "sec_filing_tool": "sec_filing",
-            "web_search_tool": "web_search",
-            "calculator_tool": "calculator"
-        }
-
-        tool_key = tool_map.get(tool_name)
+        tool_key = self.TOOL_NAME_MAP.get(tool_name)
         if not tool_key:
             logger.error(f"Unknown tool: {tool_name}")
             return {
@@ -2724,7 +2948,7 @@ if none meet your standards.
         messages = [{"role": "user", "content": comparison_prompt}]
 
         try:
-            response = self.client.messages.create(
+            response = with_retries(lambda: self.client.messages.create(
                 model=self.MODEL,
                 max_tokens=self.MAX_TOKENS,
                 system=self.system_prompt,
@@ -2733,7 +2957,7 @@ if none meet your standards.
                     "type": "enabled",
                     "budget_tokens": 5000
                 }
-            )
+            ))
 
             # Extract comparison text
             comparison_text = ""
@@ -6,15 +6,16 @@ Analyzes companies for Islamic finance compliance according to AAOIFI standards.
 
 import os
 import logging
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from datetime import datetime
 from dotenv import load_dotenv
-import anthropic
 
+from src.llm.clients import get_anthropic_client
 from src.tools.calculator_tool import CalculatorTool
 from src.tools.gurufocus_tool import GuruFocusTool
 from src.tools.web_search_tool import WebSearchTool
 from src.tools.sec_filing_tool import SECFilingTool
+from src.utils.retry import with_retries
 
 load_dotenv()
 
@@ -63,7 +64,7 @@ class ShariaScreener:
         if not self.api_key:
             raise ValueError("ANTHROPIC_API_KEY not found")
 
-        self.client = anthropic.Anthropic(api_key=self.api_key)
+        self.client = get_anthropic_client(self.api_key)
 
         # Initialize all 4 tools for data gathering
         logger.info("Initializing tools...")
@@ -75,35 +76,43 @@ class ShariaScreener:
         }
         logger.info(f"ShariaScreener initialized with {len(self.tools)} tools")
 
+        # Claude API tool definitions, built on first use (see _get_tool_definitions)
+        self._tool_definitions: Optional[List[Dict[str, Any]]] = None
+
     def _get_tool_definitions(self) -> List[Dict[str, Any]]:
         """
         Convert tools to Claude API format.
 
+        Built once per instance: the tools' descriptions and schemas are
+        fixed, and the list is sent unchanged on every turn.
+
         Returns:
             List of tool definitions for Claude API
         """
-        return [
-            {
-                "name": "gurufocus_tool",
-                "description": self.tools["gurufocus"].description,
-                "input_schema": self.tools["gurufocus"].parameters
-            },
-            {
-                "name": "sec_filing_tool",
-                "description": self.tools["sec_filing"].description,
-                "input_schema": self.tools["sec_filing"].parameters
-            },
-            {
-                "name": "web_search_tool",
-                "description": self.tools["web_search"].description,
-                "input_schema": self.tools["web_search"].parameters
-            },
-            {
-                "name": "calculator_tool",
-                "description": self.tools["calculator"].description,
-                "input_schema": self.tools["calculator"].parameters
-            }
-        ]
+        if self._tool_definitions is None:
+            self._tool_definitions = [
+                {
+                    "name": "gurufocus_tool",
+                    "description": self.tools["gurufocus"].description,
+                    "input_schema": self.tools["gurufocus"].parameters
+                },
+                {
+                    "name": "sec_filing_tool",
+                    "description": self.tools["sec_filing"].description,
+                    "input_schema": self.tools["sec_filing"].parameters
+                },
+                {
+                    "name": "web_search_tool",
+                    "description": self.tools["web_search"].description,
+                    "input_schema": self.tools["web_search"].parameters
+                },
+                {
+                    "name": "calculator_tool",
+                    "description": self.tools["calculator"].description,
+                    "input_schema": self.tools["calculator"].parameters
+                }
+            ]
+        return self._tool_definitions
 
     def _execute_tool(self, tool_name: str, tool_input: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -190,7 +199,8 @@ class ShariaScreener:
             for iteration in range(self.MAX_ITERATIONS):
                 logger.info(f"Iteration {iteration + 1}/{self.MAX_ITERATIONS}")
 
-                response = self.client.messages.create(
+                # Transient 429/5xx/overloaded errors are retried with backoff
+                response = with_retries(lambda: self.client.messages.create(
                     model=self.MODEL,
                     max_tokens=self.MAX_TOKENS,
                     messages=messages,
@@ -199,7 +209,7 @@ class ShariaScreener:
                         "type": "enabled",
                         "budget_tokens": self.THINKING_BUDGET
                     }
-                )
+                ))
 
                 total_input_tokens += response.usage.input_tokens
                 total_output_tokens += response.usage.output_tokens
@@ -5,16 +5,18 @@ This module provides translation of investment theses from English to Arabic
 using Claude API, with proper RTL formatting and preservation of key terms.
 """
 
-from anthropic import Anthropic
 import os
 from typing import Dict
 
+from src.llm.clients import get_anthropic_client
+from src.utils.retry import with_retries
+
 class ThesisTranslator:
     """Translates investment theses to Arabic with proper formatting."""
 
     def __init__(self):
         """Initialize the translator with Claude API."""
-        self.client = Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
+        self.client = get_anthropic_client(os.getenv("ANTHROPIC_API_KEY"))
         self.model = "claude-sonnet-4-5-20250929"
 
     def translate_to_arabic(self, thesis: str, ticker: str) -> Dict[str, any]:
@@ -52,7 +54,7 @@ THESIS TO TRANSLATE:
 Please provide ONLY the Arabic translation without any explanations or notes."""
 
         # Call Claude API
-        response = self.client.messages.create(
+        response = with_retries(lambda: self.client.messages.create(
             model=self.model,
             max_tokens=8000,
             temperature=0.3,  # Lower temperature for more consistent translation
@@ -60,7 +62,7 @@ Please provide ONLY the Arabic translation without any explanations or notes."""
                 "role": "user",
                 "content": prompt
             }]
-        )
+        ))
 
         # Extract translation
         translated_thesis = response.content[0].text
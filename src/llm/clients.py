@@ -0,0 +1,33 @@
+"""
+Shared API clients for basīrah.
+
+Each Anthropic client owns its own HTTP connection pool, so building one per
+agent, provider, translator, screener and cost estimator (several per
+Streamlit session) repeats the TCP/TLS handshake for every component. The
+client is thread-safe, so one instance per API key is shared process-wide.
+
+The SDK's own retries are turned off (max_retries=0): callers retry through
+src.utils.retry, and stacking both layers multiplies the attempts per call.
+"""
+
+from functools import lru_cache
+from typing import Optional
+
+from anthropic import Anthropic
+
+
+@lru_cache(maxsize=None)
+def get_anthropic_client(api_key: Optional[str]) -> Anthropic:
+    """
+    Get the process-wide Anthropic client for an API key.
+
+    Args:
+        api_key: Anthropic API key
+
+    Returns:
+        Anthropic: Shared client (created on first use, without SDK retries)
+    """
+    return Anthropic(api_key=api_key, max_retries=0)
+
+
+__all__ = ["get_anthropic_client"]
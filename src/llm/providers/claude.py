@@ -5,9 +5,9 @@ Claude (Anthropic) LLM provider.
 import os
 import logging
 from typing import List, Dict, Any
-from anthropic import Anthropic
-
 from src.llm.base import BaseLLMProvider, LLMMessage, LLMResponse
+from src.llm.clients import get_anthropic_client
+from src.utils.retry import with_retries
 
 logger = logging.getLogger(__name__)
 
@@ -49,7 +49,7 @@ class ClaudeProvider(BaseLLMProvider):
         if not api_key:
             raise ValueError("ANTHROPIC_API_KEY environment variable not set")
 
-        self.client = Anthropic(api_key=api_key)
+        self.client = get_anthropic_client(api_key)
 
         logger.info(f"Initialized ClaudeProvider with model: {self.model_id}")
 
@@ -77,13 +77,13 @@ class ClaudeProvider(BaseLLMProvider):
 
         try:
             # Call Anthropic API
-            response = self.client.messages.create(
+            response = with_retries(lambda: self.client.messages.create(
                 model=self.model_id,
                 max_tokens=max_tokens,
                 temperature=temperature,
                 system=system_prompt if system_prompt else None,
                 messages=formatted_messages
-            )
+            ))
 
             # Extract response
             content = response.content[0].text
@@ -8,7 +8,7 @@ import logging
 from typing import Optional
 import psycopg2
 from psycopg2.extras import RealDictCursor
-from psycopg2.pool import SimpleConnectionPool
+from psycopg2.pool import ThreadedConnectionPool
 from contextlib import contextmanager
 from dotenv import load_dotenv
 
@@ -24,13 +24,14 @@ class DatabaseManager:
 
     def __init__(self):
         """Initialize database connection pool."""
-        self.pool: Optional[SimpleConnectionPool] = None
+        # Thread-safe pool: history saves run on a background thread
+        self.pool: Optional[ThreadedConnectionPool] = None
         self._initialize_pool()
 
     def _initialize_pool(self):
         """Create connection pool."""
         try:
-            self.pool = SimpleConnectionPool(
+            self.pool = ThreadedConnectionPool(
                 minconn=1,
                 maxconn=10,
                 host=os.getenv("DB_HOST", "localhost"),
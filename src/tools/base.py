@@ -11,7 +11,7 @@ to ensure consistent interaction patterns and integration with the agent framewo
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 
 class Tool(ABC):
@@ -20,8 +20,18 @@ class Tool(ABC):
 
     Tools provide capabilities to the agent (data access, calculations, etc.)
     All tools must implement this interface for consistent agent interaction.
+
+    Attributes:
+        serialize: Set True on tools that must not run concurrently with other
+            tool calls from the same model turn (the agent runs them one at a
+            time after the parallel group).
+        timeout_sec: Optional wall-clock limit the agent applies when waiting
+            for a parallel call; None waits for the tool to finish.
     """
 
+    serialize: bool = False
+    timeout_sec: Optional[float] = None
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -22,12 +22,23 @@ References:
 """
 
 import os
+import re
+import math
 import time
+import atexit
 import logging
+import threading
+from functools import lru_cache
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Dict, Any, List, Tuple, Optional
-from datetime import datetime
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from dotenv import load_dotenv
+import numpy as np
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
 
 from src.tools.base import Tool
 
@@ -39,6 +50,122 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+# Process-wide HTTP session shared by all GuruFocusTool instances so that
+# keep-alive connections (and their TLS handshakes) outlive any one tool.
+# Only advertise Brotli when urllib3 can decode it (brotli package installed)
+_ACCEPT_ENCODING = "br, gzip" if "br" in ACCEPT_ENCODING else "gzip"
+
+_SESSION: Optional[requests.Session] = None
+_SESSION_LOCK = threading.Lock()
+
+# GuruFocus special value codes per gurufocus_api.md Section 3.2; the class
+# exposes them as GuruFocusTool.SPECIAL_VALUE_* for API compatibility
+_SPECIAL_NA = 9999  # Data not available
+_SPECIAL_NO_DEBT = 10000  # No debt OR negative equity
+_SPECIAL_SET = frozenset((_SPECIAL_NA, _SPECIAL_NO_DEBT))
+
+# Preformatted "[i]" path components for list indices in special-value paths
+_INDEX_STRS = tuple(f"[{i}]" for i in range(256))
+_INDEX_STRS_LEN = len(_INDEX_STRS)
+
+# Plain decimal number with optional sign and exponent
+_FLOAT_RE = re.compile(r"[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?")
+
+# Any number in exponent notation (e.g. 1e4, 1E+4, 9.999e3) in a raw body
+_EXPONENT_BYTES_RE = re.compile(rb"\d[eE][+-]?\d")
+
+
+@lru_cache(maxsize=4096)
+def _safe_float_str(value: str) -> Optional[float]:
+    """
+    Parse a string number, mapping special codes and junk to None.
+
+    Memoized because GuruFocus repeats the same placeholder strings
+    ("N/A", "-", "") across many fields; numbers never reach this path.
+    Strings are validated with _FLOAT_RE first so placeholders are
+    rejected without raising from float(). Only plain decimal/exponent
+    notation is accepted ("nan", "inf" and "1_000" are treated as invalid).
+
+    Args:
+        value: String to parse
+
+    Returns:
+        Float value or None if unparseable/special value
+    """
+    value = value.strip()
+    if not _FLOAT_RE.fullmatch(value):
+        return None
+    number = float(value)
+    return None if number in _SPECIAL_SET else number
+
+
+# In-flight fetches keyed by (ticker, endpoint, period, include_raw), shared by all instances
+_INFLIGHT: Dict[Tuple[str, str, str, bool], Future] = {}
+_INFLIGHT_LOCK = threading.Lock()
+
+
+class RateLimited(Exception):
+    """Raised when GuruFocus keeps answering 429 after all retries."""
+
+    CODE = "agent.rate_limited"
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+def _parse_retry_after(response: requests.Response) -> Optional[float]:
+    """
+    Read a 429 response's Retry-After header as seconds to wait.
+
+    Args:
+        response: HTTP response
+
+    Returns:
+        Seconds (delta-seconds or HTTP-date form), or None if absent/invalid
+    """
+    value = response.headers.get("Retry-After")
+    if not isinstance(value, str):
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def _get_session() -> requests.Session:
+    """
+    Return the shared GuruFocus HTTP session, creating it on first use.
+
+    Retries are handled by GuruFocusTool._make_request_with_retry, so the
+    adapter itself never retries (max_retries=0).
+
+    Returns:
+        requests.Session: Pooled session with GuruFocus default headers
+    """
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=0)
+            session.mount("https://", adapter)
+            session.headers.update({
+                'Accept': 'application/json',
+                'Accept-Encoding': _ACCEPT_ENCODING,
+                'User-Agent': 'basirah-agent/1.0'
+            })
+            atexit.register(session.close)
+            _SESSION = session
+        return _SESSION
+
+
 class GuruFocusTool(Tool):
     """
     GuruFocus API integration tool for fetching financial data.
@@ -63,14 +190,136 @@ class GuruFocusTool(Tool):
     MIN_INTERVAL = 1.5  # seconds between requests
     MAX_RETRIES = 3  # maximum retry attempts
 
+    # Rate-limit state shared across process restarts (GURUFOCUS_BUCKET_PERSIST=1)
+    BUCKET_STATE_PATH = os.path.join(
+        os.path.expanduser("~"), ".cache", "basirah", "gurufocus_bucket.json"
+    )
+
     # Special value codes per gurufocus_api.md Section 3.2
-    SPECIAL_VALUE_DATA_NA = 9999  # Data not available
-    SPECIAL_VALUE_NO_DEBT = 10000  # No debt OR negative equity
+    SPECIAL_VALUE_DATA_NA = _SPECIAL_NA  # Data not available
+    SPECIAL_VALUE_NO_DEBT = _SPECIAL_NO_DEBT  # No debt OR negative equity
 
     # Valid endpoints
     VALID_ENDPOINTS = ["summary", "financials", "keyratios", "valuation"]
     VALID_PERIODS = ["annual", "quarterly"]
 
+    # Validation lookups (lists above keep their order for the schema and messages)
+    _TICKER_RE = re.compile(r"[A-Z]{1,5}")
+    _VALID_ENDPOINT_SET = frozenset(VALID_ENDPOINTS)
+    _VALID_PERIOD_SET = frozenset(VALID_PERIODS)
+
+    # Field schemas: (output key, GuruFocus field) pairs, walked in one pass
+    # by _extract_fields / _extract_latest_fields.
+
+    # /summary endpoint
+    SUMMARY_PROFITABILITY_FIELDS = (
+        ("operating_margin", "operating_margin"),
+        ("net_margin", "net_margin"),
+        ("roic", "roic"),
+        ("roe", "roe"),
+        ("roa", "roa"),
+    )
+    SUMMARY_FINANCIAL_STRENGTH_FIELDS = (
+        ("financial_strength_score", "score"),
+        ("cash_to_debt", "cash_to_debt"),
+        ("equity_to_asset", "equity_to_asset"),
+        ("debt_to_equity", "debt_to_equity"),
+    )
+    SUMMARY_VALUATION_FIELDS = (
+        ("pe_ratio", "pe_ratio"),
+        ("pb_ratio", "pb_ratio"),
+        ("ps_ratio", "ps_ratio"),
+        ("peg_ratio", "peg_ratio"),
+        ("ev_ebitda", "ev_ebitda"),
+    )
+    SUMMARY_QUOTE_FIELDS = (
+        ("price", "price"),
+        ("market_cap", "market_cap"),
+        ("volume", "volume"),
+    )
+
+    # /financials endpoint (time series, most recent first)
+    FINANCIALS_LATEST_FIELDS = (
+        # Owner Earnings components
+        ("net_income", "Net Income"),
+        ("depreciation_amortization", "Depreciation & Amortization"),
+        ("capex", "Capital Expenditure"),
+        ("free_cash_flow", "Free Cash Flow"),
+        # ROIC components
+        ("operating_income", "Operating Income"),
+        ("total_assets", "Total Assets"),
+        ("total_liabilities", "Total Liabilities"),
+        ("cash_equivalents", "Cash and Cash Equivalents"),
+        ("total_debt", "Total Debt"),
+        # Additional balance sheet items
+        ("stockholders_equity", "Total Stockholders Equity"),
+        ("revenue", "Revenue"),
+    )
+    FINANCIALS_HISTORICAL_FIELDS = (
+        ("net_income", "Net Income"),
+        ("revenue", "Revenue"),
+        ("operating_income", "Operating Income"),
+        ("free_cash_flow", "Free Cash Flow"),
+    )
+
+    # /keyratios endpoint
+    # (out_key, src_key, 10-year average out_key or None)
+    KEYRATIOS_PROFITABILITY_FIELDS = (
+        ("operating_margin", "Operating Margin %", None),
+        ("net_margin", "Net Margin %", None),
+        ("roe", "ROE %", "roe_10y_avg"),
+        ("roa", "ROA %", None),
+        ("roic", "ROIC %", "roic_10y_avg"),
+    )
+    KEYRATIOS_PER_SHARE_FIELDS = (
+        ("eps", "Earnings per Share"),
+        ("revenue_per_share", "Revenue per Share"),
+        ("book_value_per_share", "Book Value per Share"),
+        ("fcf_per_share", "Free Cash Flow per Share"),
+        ("dividends_per_share", "Dividends per Share"),
+    )
+    KEYRATIOS_VALUATION_FIELDS = (
+        ("pe_ratio", "P/E Ratio"),
+        ("pb_ratio", "P/B Ratio"),
+        ("ps_ratio", "P/S Ratio"),
+        ("peg_ratio", "PEG Ratio"),
+        ("ev_ebitda", "EV/EBITDA"),
+        ("price_to_fcf", "Price to Free Cash Flow"),
+    )
+    KEYRATIOS_EFFICIENCY_FIELDS = (
+        ("asset_turnover", "Asset Turnover"),
+        ("inventory_turnover", "Inventory Turnover"),
+    )
+
+    # /valuation endpoint
+    VALUATION_FIELDS = (
+        ("market_cap", "market_cap"),
+        ("enterprise_value", "enterprise_value"),
+        ("pe_ratio", "pe_ratio"),
+        ("forward_pe", "forward_pe"),
+        ("peg_ratio", "peg_ratio"),
+        ("ps_ratio", "ps_ratio"),
+        ("pb_ratio", "pb_ratio"),
+        ("ev_ebitda", "ev_ebitda"),
+        ("ev_sales", "ev_sales"),
+        ("price_to_fcf", "price_to_fcf"),
+    )
+    VALUATION_GURUFOCUS_FIELDS = (
+        ("gf_value", "gf_value"),
+        ("current_price", "current_price"),
+        ("graham_number", "graham_number"),
+        ("dcf_value", "dcf_value"),
+        ("median_ps_value", "median_ps_value"),
+        ("peter_lynch_fair_value", "peter_lynch_fair_value"),
+    )
+    VALUATION_GROWTH_FIELDS = (
+        ("revenue_growth_3y", "revenue_growth_3y"),
+        ("revenue_growth_5y", "revenue_growth_5y"),
+        ("eps_growth_3y", "eps_growth_3y"),
+        ("eps_growth_5y", "eps_growth_5y"),
+        ("fcf_growth_3y", "fcf_growth_3y"),
+    )
+
     def __init__(self):
         """
         Initialize GuruFocus Tool.
@@ -85,16 +334,21 @@ class GuruFocusTool(Tool):
                 "Add to .env file: GURUFOCUS_API_KEY=your_key_here"
             )
 
-        # Rate limiting state
+        # Rate limiting state (optionally restored from the previous process)
         self.last_request_time = 0.0
+        self._rate_limit_lock = threading.Lock()
+        self.persist_rate_limit = os.getenv("GURUFOCUS_BUCKET_PERSIST") == "1"
+        if self.persist_rate_limit:
+            self._load_rate_limit_state()
+
+        # Default for execute(include_raw=...)
+        self.include_raw = os.getenv("GURUFOCUS_INCLUDE_RAW") == "1"
 
-        # HTTP session for connection pooling
-        self.session = requests.Session()
-        self.session.headers.update({
-            'Accept': 'application/json',
-            'Accept-Encoding': 'gzip',
-            'User-Agent': 'basirah-agent/1.0'
-        })
+        # Company names by ticker (see _extract_company_name)
+        self._name_cache: Dict[str, str] = {}
+
+        # Shared HTTP session for connection pooling across instances
+        self.session = _get_session()
 
         logger.info("GuruFocus Tool initialized")
 
@@ -148,6 +402,8 @@ class GuruFocusTool(Tool):
             ticker: Stock ticker symbol (required)
             endpoint: API endpoint (required): summary, financials, keyratios, or valuation
             period: Data period (optional): annual or quarterly (default: annual)
+            include_raw: Also return the raw API payload as data["raw_data"]
+                (optional, default: GURUFOCUS_INCLUDE_RAW env var, else False)
 
         Returns:
             Dict containing:
@@ -161,6 +417,7 @@ class GuruFocusTool(Tool):
                     - valuation: dict (valuation metrics if available)
                     - special_values_detected: list (flagged special values)
                     - metadata: dict (source, timestamp, period)
+                    - raw_data: dict (only when include_raw is set)
                 - error: str or None
 
         Reference:
@@ -171,29 +428,130 @@ class GuruFocusTool(Tool):
         ticker = kwargs.get("ticker", "").upper()
         endpoint = kwargs.get("endpoint", "").lower()
         period = kwargs.get("period", "annual").lower()
+        include_raw = bool(kwargs.get("include_raw", self.include_raw))
 
         # Validate ticker
         if not ticker:
             return self._error("Missing required parameter: 'ticker'")
-        if not ticker.isalpha() or len(ticker) > 5:
+        if not self._TICKER_RE.fullmatch(ticker):
             return self._error(f"Invalid ticker format: '{ticker}'. Must be 1-5 uppercase letters.")
 
         # Validate endpoint
-        if endpoint not in self.VALID_ENDPOINTS:
+        if endpoint not in self._VALID_ENDPOINT_SET:
             valid = ", ".join(self.VALID_ENDPOINTS)
             return self._error(
                 f"Invalid endpoint: '{endpoint}'. Must be one of: {valid}"
             )
 
         # Validate period
-        if period not in self.VALID_PERIODS:
+        if period not in self._VALID_PERIOD_SET:
             valid = ", ".join(self.VALID_PERIODS)
             return self._error(
                 f"Invalid period: '{period}'. Must be one of: {valid}"
             )
 
-        # Enforce rate limiting
-        self._enforce_rate_limit()
+        # Concurrent identical requests share one fetch
+        return self._fetch_coalesced(ticker, endpoint, period, include_raw)
+
+    def fetch_all(self, ticker: str, period: str = "annual", **kwargs) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch every endpoint for one ticker, overlapping their network time.
+
+        Requests still leave MIN_INTERVAL apart (the rate limiter is shared),
+        but each one's round trip overlaps the next one's rate-limit wait,
+        so four endpoints cost about 3 * MIN_INTERVAL + one round trip
+        instead of four of each.
+
+        Args:
+            ticker: Stock ticker symbol
+            period: Data period for the financials endpoint (default: annual)
+            **kwargs: Extra execute() arguments (e.g., include_raw)
+
+        Returns:
+            Dict mapping endpoint name to its execute() response
+        """
+        with ThreadPoolExecutor(max_workers=len(self.VALID_ENDPOINTS)) as executor:
+            futures = {
+                endpoint: executor.submit(
+                    self.execute, ticker=ticker, endpoint=endpoint, period=period, **kwargs
+                )
+                for endpoint in self.VALID_ENDPOINTS
+            }
+            return {endpoint: future.result() for endpoint, future in futures.items()}
+
+    # =========================================================================
+    # REQUEST COALESCING
+    # =========================================================================
+
+    def _fetch_coalesced(
+        self,
+        ticker: str,
+        endpoint: str,
+        period: str,
+        include_raw: bool
+    ) -> Dict[str, Any]:
+        """
+        Fetch and process data, collapsing concurrent identical requests.
+
+        The first caller for a (ticker, endpoint, period, include_raw) key
+        performs the fetch; callers arriving while it is in flight wait for
+        and receive the same result instead of making their own rate-limited
+        request.
+
+        Args:
+            ticker: Validated stock ticker
+            endpoint: Validated endpoint name
+            period: Validated period
+            include_raw: Keep the raw API payload in the response
+
+        Returns:
+            Standardized response dict (see execute)
+        """
+        key = (ticker, endpoint, period, include_raw)
+        with _INFLIGHT_LOCK:
+            future = _INFLIGHT.get(key)
+            is_leader = future is None
+            if is_leader:
+                future = Future()
+                _INFLIGHT[key] = future
+
+        if not is_leader:
+            logger.debug(f"Joining in-flight {endpoint} request for {ticker}")
+            return future.result()
+
+        try:
+            result = self._fetch(ticker, endpoint, period, include_raw)
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with _INFLIGHT_LOCK:
+                _INFLIGHT.pop(key, None)
+
+    def _fetch(
+        self,
+        ticker: str,
+        endpoint: str,
+        period: str,
+        include_raw: bool
+    ) -> Dict[str, Any]:
+        """
+        Fetch one endpoint from the API and build the standardized response.
+
+        Args:
+            ticker: Validated stock ticker
+            endpoint: Validated endpoint name
+            period: Validated period
+            include_raw: Keep the raw API payload in the response
+
+        Returns:
+            Standardized response dict (see execute)
+        """
+        # Enforce rate limiting (keeps this request's send time; under
+        # fetch_all, last_request_time may already belong to another endpoint)
+        sent_at = self._enforce_rate_limit()
 
         # Construct URL
         url = f"{self.BASE_URL}/{self.api_key}/stock/{ticker}/{endpoint}"
@@ -202,7 +560,14 @@ class GuruFocusTool(Tool):
 
         # Make API request with retry logic
         try:
-            api_data = self._make_request_with_retry(url, ticker, endpoint)
+            api_data, may_have_specials = self._make_request_with_retry(url, ticker, endpoint)
+        except RateLimited as e:
+            # Structured so callers can defer the call instead of retrying blindly
+            return self._error(
+                f"API request failed: {str(e)}",
+                code=RateLimited.CODE,
+                retry_after=e.retry_after
+            )
         except Exception as e:
             return self._error(f"API request failed: {str(e)}")
 
@@ -225,8 +590,16 @@ class GuruFocusTool(Tool):
             logger.error(f"Error processing {endpoint} data: {str(e)}")
             return self._error(f"Error processing data: {str(e)}")
 
-        # Detect special values across all data
-        special_values = self._detect_special_values(api_data)
+        # The raw payload roughly doubles the response size; drop it unless asked
+        if not include_raw:
+            processed_data.pop("raw_data", None)
+
+        # Detect special values in the part of the payload we return
+        # (skipped outright when the body bytes contain no special code)
+        scope, scope_path = self._special_value_scope(api_data, endpoint, period)
+        special_values = self._detect_special_values(
+            scope, scope_path, expect_specials=may_have_specials
+        )
 
         # Build response
         return {
@@ -240,7 +613,8 @@ class GuruFocusTool(Tool):
                 "metadata": {
                     "source": "gurufocus",
                     "api_version": "v3",
-                    "timestamp": datetime.now().isoformat(),
+                    # Fetch time, reusing the clock read made by the rate limiter
+                    "timestamp": datetime.fromtimestamp(sent_at).isoformat(),
                     "period": period,
                     "url": url.replace(self.api_key, "***")  # Mask API key
                 }
@@ -252,29 +626,70 @@ class GuruFocusTool(Tool):
     # RATE LIMITING
     # =========================================================================
 
-    def _enforce_rate_limit(self) -> None:
+    def _enforce_rate_limit(self) -> float:
         """
         Enforce minimum interval between API requests.
 
         GuruFocus requires 1.5 second minimum between requests to avoid throttling.
 
+        Returns:
+            float: Send time reserved for this request (epoch seconds)
+
         Reference:
             gurufocus_api.md Section 2 (Rate Limits)
             gurufocus_tool_spec.md Section 4 (Rate Limiting)
         """
-        elapsed = time.time() - self.last_request_time
-        if elapsed < self.MIN_INTERVAL:
-            sleep_time = self.MIN_INTERVAL - elapsed
-            logger.debug(f"Rate limiting: sleeping {sleep_time:.2f}s")
-            time.sleep(sleep_time)
+        # Held across the sleep so concurrent callers are spaced MIN_INTERVAL apart
+        with self._rate_limit_lock:
+            elapsed = time.time() - self.last_request_time
+            if elapsed < self.MIN_INTERVAL:
+                sleep_time = self.MIN_INTERVAL - elapsed
+                logger.debug(f"Rate limiting: sleeping {sleep_time:.2f}s")
+                time.sleep(sleep_time)
+
+            sent_at = self.last_request_time = time.time()
+            if self.persist_rate_limit:
+                self._save_rate_limit_state()
 
-        self.last_request_time = time.time()
+        return sent_at
+
+    def _load_rate_limit_state(self) -> None:
+        """
+        Restore the last request time saved by a previous process.
+
+        Missing or unreadable state is ignored; timestamps in the future
+        (clock changes) are clamped to now.
+        """
+        try:
+            with open(self.BUCKET_STATE_PATH, "rb") as f:
+                last = float(orjson.loads(f.read())["last"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return
+        self.last_request_time = min(last, time.time())
+
+    def _save_rate_limit_state(self) -> None:
+        """
+        Atomically persist the last request time so a restart cannot burst.
+
+        Written to a temp file and moved into place with os.replace, so
+        concurrent readers never see a partial file. Failures are logged
+        and otherwise ignored; persistence is best-effort.
+        """
+        path = self.BUCKET_STATE_PATH
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                f.write(orjson.dumps({"last": self.last_request_time}))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.debug(f"Could not persist rate-limit state: {e}")
 
     # =========================================================================
     # HTTP REQUEST HANDLING
     # =========================================================================
 
-    def _make_request_with_retry(self, url: str, ticker: str, endpoint: str) -> Dict[str, Any]:
+    def _make_request_with_retry(self, url: str, ticker: str, endpoint: str) -> Tuple[Dict[str, Any], bool]:
         """
         Make HTTP request with exponential backoff retry logic.
 
@@ -290,9 +705,10 @@ class GuruFocusTool(Tool):
             endpoint: API endpoint (for error messages)
 
         Returns:
-            Dict: Parsed JSON response
+            Tuple of (parsed JSON response, whether it may contain special values)
 
         Raises:
+            RateLimited: If still rate limited (429) after all retries
             Exception: If all retries exhausted or unrecoverable error
 
         Reference:
@@ -320,9 +736,10 @@ class GuruFocusTool(Tool):
                         time.sleep(wait_time)
                         continue
                     else:
-                        raise Exception(
+                        raise RateLimited(
                             "Rate limit exceeded. GuruFocus API requires minimum 1.5s between requests. "
-                            "All retries exhausted."
+                            "All retries exhausted.",
+                            retry_after=_parse_retry_after(response)
                         )
 
                 elif response.status_code == 401:
@@ -350,11 +767,10 @@ class GuruFocusTool(Tool):
                 # Raise for other bad status codes
                 response.raise_for_status()
 
-                # Parse JSON
-                data = response.json()
+                result = self._parse_response(response.content)
 
                 logger.info(f"Successfully fetched {endpoint} data for {ticker}")
-                return data
+                return result
 
             except requests.exceptions.Timeout:
                 if attempt < self.MAX_RETRIES - 1:
@@ -370,8 +786,8 @@ class GuruFocusTool(Tool):
                         f"Request timeout after {self.TIMEOUT}s. All retries exhausted."
                     )
 
-            except requests.exceptions.RequestException as e:
-                # Network error, retry
+            except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
+                # Network error or truncated/garbled body, retry
                 if attempt < self.MAX_RETRIES - 1:
                     wait_time = 2 ** attempt
                     logger.warning(
@@ -385,6 +801,31 @@ class GuruFocusTool(Tool):
 
         raise Exception("Failed to fetch data after all retries")
 
+    def _parse_response(self, content: bytes) -> Tuple[Any, bool]:
+        """
+        Decode a response body and pre-check it for special value codes.
+
+        orjson decodes the raw bytes directly (requests has already undone
+        the transfer encoding). The special codes can only be present in the
+        decoded tree if their digits appear in the body (written as
+        9999/10000, optionally with a fractional part) or if the body holds a
+        number in exponent notation (1e4, 9.999E+3), so a byte search over
+        the same buffer tells us whether the tree walk in
+        _detect_special_values can be skipped entirely.
+
+        Args:
+            content: Raw (decompressed) response body
+
+        Returns:
+            Tuple of (decoded JSON, whether special codes may be present)
+        """
+        may_have_specials = (
+            b"9999" in content
+            or b"10000" in content
+            or _EXPONENT_BYTES_RE.search(content) is not None
+        )
+        return orjson.loads(content), may_have_specials
+
     # =========================================================================
     # DATA PROCESSING: SUMMARY ENDPOINT
     # =========================================================================
@@ -414,8 +855,8 @@ class GuruFocusTool(Tool):
         general = {}
 
         # Extract general company info
-        if "general" in data:
-            gen = data["general"]
+        gen = data.get("general")
+        if gen is not None:
             general = {
                 "industry": gen.get("industry"),
                 "sector": gen.get("sector"),
@@ -425,39 +866,24 @@ class GuruFocusTool(Tool):
             }
 
         # Extract profitability metrics (pre-calculated by GuruFocus)
-        if "profitability" in data:
-            prof = data["profitability"]
-            metrics["operating_margin"] = self._safe_float(prof.get("operating_margin"))
-            metrics["net_margin"] = self._safe_float(prof.get("net_margin"))
-            metrics["roic"] = self._safe_float(prof.get("roic"))
-            metrics["roe"] = self._safe_float(prof.get("roe"))
-            metrics["roa"] = self._safe_float(prof.get("roa"))
+        section = data.get("profitability")
+        if section is not None:
+            self._extract_fields(section, self.SUMMARY_PROFITABILITY_FIELDS, metrics)
 
         # Extract financial strength
-        if "financial_strength" in data:
-            fs = data["financial_strength"]
-            metrics["financial_strength_score"] = self._safe_float(fs.get("score"))
-            metrics["cash_to_debt"] = self._safe_float(fs.get("cash_to_debt"))
-            metrics["equity_to_asset"] = self._safe_float(fs.get("equity_to_asset"))
-            metrics["debt_to_equity"] = self._safe_float(fs.get("debt_to_equity"))
+        section = data.get("financial_strength")
+        if section is not None:
+            self._extract_fields(section, self.SUMMARY_FINANCIAL_STRENGTH_FIELDS, metrics)
 
         # Extract valuation ratios
-        if "valuation" in data:
-            val = data["valuation"]
-            valuation = {
-                "pe_ratio": self._safe_float(val.get("pe_ratio")),
-                "pb_ratio": self._safe_float(val.get("pb_ratio")),
-                "ps_ratio": self._safe_float(val.get("ps_ratio")),
-                "peg_ratio": self._safe_float(val.get("peg_ratio")),
-                "ev_ebitda": self._safe_float(val.get("ev_ebitda"))
-            }
+        section = data.get("valuation")
+        if section is not None:
+            self._extract_fields(section, self.SUMMARY_VALUATION_FIELDS, valuation)
 
         # Extract current price from quote
-        if "quote" in data:
-            quote = data["quote"]
-            valuation["price"] = self._safe_float(quote.get("price"))
-            valuation["market_cap"] = self._safe_float(quote.get("market_cap"))
-            valuation["volume"] = self._safe_float(quote.get("volume"))
+        section = data.get("quote")
+        if section is not None:
+            self._extract_fields(section, self.SUMMARY_QUOTE_FIELDS, valuation)
 
         return {
             "metrics": metrics,
@@ -495,10 +921,10 @@ class GuruFocusTool(Tool):
         financials = {}
 
         # Navigate to financials data
-        if "financials" not in data:
+        fin_data = data.get("financials")
+        if fin_data is None:
             return {"metrics": metrics, "financials": financials, "valuation": {}}
 
-        fin_data = data["financials"]
         period_data = fin_data.get(period, fin_data.get("annual", {}))
 
         # Extract most recent year's key components for Owner Earnings
@@ -507,28 +933,20 @@ class GuruFocusTool(Tool):
             fiscal_period = period_data.get("Fiscal Year", period_data.get("Fiscal Quarter", []))
 
             if fiscal_period and len(fiscal_period) > 0:
-                # Owner Earnings components (most recent)
-                financials["net_income"] = self._safe_float_from_series(period_data.get("Net Income"), 0)
-                financials["depreciation_amortization"] = self._safe_float_from_series(
-                    period_data.get("Depreciation & Amortization"), 0
-                )
-                financials["capex"] = self._safe_float_from_series(period_data.get("Capital Expenditure"), 0)
-                financials["free_cash_flow"] = self._safe_float_from_series(period_data.get("Free Cash Flow"), 0)
-
-                # ROIC components (most recent)
-                financials["operating_income"] = self._safe_float_from_series(period_data.get("Operating Income"), 0)
-                financials["total_assets"] = self._safe_float_from_series(period_data.get("Total Assets"), 0)
-                financials["total_liabilities"] = self._safe_float_from_series(period_data.get("Total Liabilities"), 0)
-                financials["cash_equivalents"] = self._safe_float_from_series(
-                    period_data.get("Cash and Cash Equivalents"), 0
-                )
-                financials["total_debt"] = self._safe_float_from_series(period_data.get("Total Debt"), 0)
+                # Convert each trend series once; its first element doubles
+                # as the most recent value below
+                converted = {
+                    src_key: self._extract_series(period_data.get(src_key), 10)
+                    for _, src_key in self.FINANCIALS_HISTORICAL_FIELDS
+                }
 
-                # Additional balance sheet items
-                financials["stockholders_equity"] = self._safe_float_from_series(
-                    period_data.get("Total Stockholders Equity"), 0
-                )
-                financials["revenue"] = self._safe_float_from_series(period_data.get("Revenue"), 0)
+                # Owner Earnings and ROIC components (most recent)
+                for out_key, src_key in self.FINANCIALS_LATEST_FIELDS:
+                    series = converted.get(src_key)
+                    if series is None:
+                        financials[out_key] = self._safe_float_from_series(period_data.get(src_key), 0)
+                    else:
+                        financials[out_key] = series[0] if series else None
 
                 # Calculate current liabilities (for ROIC invested capital)
                 total_liab = financials.get("total_liabilities")
@@ -543,10 +961,8 @@ class GuruFocusTool(Tool):
 
                 # 10-year historical data for trends
                 financials["historical"] = {
-                    "net_income": self._extract_series(period_data.get("Net Income"), 10),
-                    "revenue": self._extract_series(period_data.get("Revenue"), 10),
-                    "operating_income": self._extract_series(period_data.get("Operating Income"), 10),
-                    "free_cash_flow": self._extract_series(period_data.get("Free Cash Flow"), 10)
+                    out_key: converted[src_key]
+                    for out_key, src_key in self.FINANCIALS_HISTORICAL_FIELDS
                 }
 
         return {
@@ -587,73 +1003,43 @@ class GuruFocusTool(Tool):
         financials = {}
 
         # Extract profitability ratios (pre-calculated by GuruFocus)
-        if "profitability_ratios" in data:
-            prof = data["profitability_ratios"]
-
-            # Get most recent year (index 0)
-            metrics["operating_margin"] = self._safe_float_from_series(prof.get("Operating Margin %"), 0)
-            metrics["net_margin"] = self._safe_float_from_series(prof.get("Net Margin %"), 0)
-            metrics["roe"] = self._safe_float_from_series(prof.get("ROE %"), 0)
-            metrics["roa"] = self._safe_float_from_series(prof.get("ROA %"), 0)
-            metrics["roic"] = self._safe_float_from_series(prof.get("ROIC %"), 0)
-
-            # Convert percentages to decimals if needed
-            # GuruFocus may return as percentage (25.3) or decimal (0.253)
-            if metrics.get("roic") and metrics["roic"] > 1:
-                metrics["roic"] = metrics["roic"] / 100
-            if metrics.get("roe") and metrics["roe"] > 1:
-                metrics["roe"] = metrics["roe"] / 100
-            if metrics.get("roa") and metrics["roa"] > 1:
-                metrics["roa"] = metrics["roa"] / 100
-            if metrics.get("operating_margin") and metrics["operating_margin"] > 1:
-                metrics["operating_margin"] = metrics["operating_margin"] / 100
-            if metrics.get("net_margin") and metrics["net_margin"] > 1:
-                metrics["net_margin"] = metrics["net_margin"] / 100
-
-            # Calculate 10-year averages
-            roic_series = self._extract_series(prof.get("ROIC %"), 10)
-            roe_series = self._extract_series(prof.get("ROE %"), 10)
-            if roic_series:
-                # Convert to decimals if percentages
-                roic_series = [r/100 if r > 1 else r for r in roic_series if r is not None]
-                metrics["roic_10y_avg"] = sum(roic_series) / len(roic_series) if roic_series else None
-            if roe_series:
-                roe_series = [r/100 if r > 1 else r for r in roe_series if r is not None]
-                metrics["roe_10y_avg"] = sum(roe_series) / len(roe_series) if roe_series else None
+        prof = data.get("profitability_ratios")
+        if prof is not None:
+            # Most recent year (index 0) for every ratio; the 10-year series is
+            # only converted for the metrics that report an average (ROIC/ROE).
+            # GuruFocus may return percentages (25.3) or decimals (0.253),
+            # so both paths normalize to decimals.
+            for metric, key, avg_key in self.KEYRATIOS_PROFITABILITY_FIELDS:
+                if avg_key is None:
+                    metrics[metric] = self._scaled_latest(prof.get(key))
+                    continue
+                stats = self._series_stats(prof.get(key))
+                if stats is None:
+                    metrics[metric] = None
+                    continue
+                metrics[metric] = stats["latest"]
+                metrics[avg_key] = stats["mean_10y"]
 
         # Extract per-share values
-        if "keyratios_per_share" in data:
-            ps = data["keyratios_per_share"]
-            metrics["eps"] = self._safe_float_from_series(ps.get("Earnings per Share"), 0)
-            metrics["revenue_per_share"] = self._safe_float_from_series(ps.get("Revenue per Share"), 0)
-            metrics["book_value_per_share"] = self._safe_float_from_series(ps.get("Book Value per Share"), 0)
-            metrics["fcf_per_share"] = self._safe_float_from_series(ps.get("Free Cash Flow per Share"), 0)
-            metrics["dividends_per_share"] = self._safe_float_from_series(ps.get("Dividends per Share"), 0)
-
-            # Calculate 10-year average FCF per share
-            fcf_series = self._extract_series(ps.get("Free Cash Flow per Share"), 10)
-            if fcf_series:
-                fcf_series = [f for f in fcf_series if f is not None]
-                metrics["fcf_per_share_10y_avg"] = sum(fcf_series) / len(fcf_series) if fcf_series else None
+        ps = data.get("keyratios_per_share")
+        if ps is not None:
+            self._extract_latest_fields(ps, self.KEYRATIOS_PER_SHARE_FIELDS, metrics)
+
+            # Calculate 10-year average FCF per share (absolute values, no scaling)
+            fcf_stats = self._series_stats(ps.get("Free Cash Flow per Share"), scale_if_pct=False)
+            if fcf_stats is not None:
+                metrics["fcf_per_share_10y_avg"] = fcf_stats["mean_10y"]
 
         # Extract valuation ratios
         valuation = {}
-        if "valuation_ratios" in data:
-            val = data["valuation_ratios"]
-            valuation = {
-                "pe_ratio": self._safe_float(val.get("P/E Ratio")),
-                "pb_ratio": self._safe_float(val.get("P/B Ratio")),
-                "ps_ratio": self._safe_float(val.get("P/S Ratio")),
-                "peg_ratio": self._safe_float(val.get("PEG Ratio")),
-                "ev_ebitda": self._safe_float(val.get("EV/EBITDA")),
-                "price_to_fcf": self._safe_float(val.get("Price to Free Cash Flow"))
-            }
+        section = data.get("valuation_ratios")
+        if section is not None:
+            valuation = self._extract_fields(section, self.KEYRATIOS_VALUATION_FIELDS)
 
         # Extract efficiency ratios
-        if "efficiency_ratios" in data:
-            eff = data["efficiency_ratios"]
-            metrics["asset_turnover"] = self._safe_float(eff.get("Asset Turnover"))
-            metrics["inventory_turnover"] = self._safe_float(eff.get("Inventory Turnover"))
+        section = data.get("efficiency_ratios")
+        if section is not None:
+            self._extract_fields(section, self.KEYRATIOS_EFFICIENCY_FIELDS, metrics)
 
         return {
             "metrics": metrics,
@@ -688,40 +1074,20 @@ class GuruFocusTool(Tool):
         valuation = {}
 
         # Extract standard valuation multiples
-        if "valuation" in data:
-            val = data["valuation"]
-            valuation = {
-                "market_cap": self._safe_float(val.get("market_cap")),
-                "enterprise_value": self._safe_float(val.get("enterprise_value")),
-                "pe_ratio": self._safe_float(val.get("pe_ratio")),
-                "forward_pe": self._safe_float(val.get("forward_pe")),
-                "peg_ratio": self._safe_float(val.get("peg_ratio")),
-                "ps_ratio": self._safe_float(val.get("ps_ratio")),
-                "pb_ratio": self._safe_float(val.get("pb_ratio")),
-                "ev_ebitda": self._safe_float(val.get("ev_ebitda")),
-                "ev_sales": self._safe_float(val.get("ev_sales")),
-                "price_to_fcf": self._safe_float(val.get("price_to_fcf"))
-            }
+        section = data.get("valuation")
+        if section is not None:
+            valuation = self._extract_fields(section, self.VALUATION_FIELDS)
 
         # Extract GuruFocus proprietary metrics
-        if "gurufocus_metrics" in data:
-            gf = data["gurufocus_metrics"]
-            valuation["gf_value"] = self._safe_float(gf.get("gf_value"))
-            valuation["current_price"] = self._safe_float(gf.get("current_price"))
-            valuation["gf_value_rank"] = gf.get("gf_value_rank")
-            valuation["graham_number"] = self._safe_float(gf.get("graham_number"))
-            valuation["dcf_value"] = self._safe_float(gf.get("dcf_value"))
-            valuation["median_ps_value"] = self._safe_float(gf.get("median_ps_value"))
-            valuation["peter_lynch_fair_value"] = self._safe_float(gf.get("peter_lynch_fair_value"))
+        gf = data.get("gurufocus_metrics")
+        if gf is not None:
+            self._extract_fields(gf, self.VALUATION_GURUFOCUS_FIELDS, valuation)
+            valuation["gf_value_rank"] = gf.get("gf_value_rank")  # Text rank, not numeric
 
         # Extract growth metrics
-        if "growth_metrics" in data:
-            growth = data["growth_metrics"]
-            metrics["revenue_growth_3y"] = self._safe_float(growth.get("revenue_growth_3y"))
-            metrics["revenue_growth_5y"] = self._safe_float(growth.get("revenue_growth_5y"))
-            metrics["eps_growth_3y"] = self._safe_float(growth.get("eps_growth_3y"))
-            metrics["eps_growth_5y"] = self._safe_float(growth.get("eps_growth_5y"))
-            metrics["fcf_growth_3y"] = self._safe_float(growth.get("fcf_growth_3y"))
+        section = data.get("growth_metrics")
+        if section is not None:
+            self._extract_fields(section, self.VALUATION_GROWTH_FIELDS, metrics)
 
         return {
             "metrics": metrics,
@@ -734,9 +1100,43 @@ class GuruFocusTool(Tool):
     # SPECIAL VALUE DETECTION
     # =========================================================================
 
-    def _detect_special_values(self, data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _special_value_scope(
+        self,
+        data: Dict[str, Any],
+        endpoint: str,
+        period: str
+    ) -> Tuple[Any, str]:
+        """
+        Select the subtree of a response that special-value detection must scan.
+
+        The financials payload carries every period GuruFocus has (annual and
+        quarterly), but only the requested period is returned to the caller,
+        so only that period is scanned. Other endpoints are scanned in full.
+
+        Args:
+            data: Raw API response data
+            endpoint: Endpoint the data came from
+            period: Requested period ("annual" or "quarterly")
+
+        Returns:
+            Tuple of (subtree to scan, field path prefix of that subtree)
+        """
+        if endpoint == "financials":
+            fin_data = data.get("financials")
+            if isinstance(fin_data, dict):
+                period_key = period if period in fin_data else "annual"
+                if period_key in fin_data:
+                    return fin_data[period_key], f"financials.{period_key}"
+        return data, ""
+
+    def _detect_special_values(
+        self,
+        data: Any,
+        path: str = "",
+        expect_specials: bool = True
+    ) -> List[Dict[str, Any]]:
         """
-        Recursively scan data for GuruFocus special value codes.
+        Scan nested data for GuruFocus special value codes.
 
         Special values per gurufocus_api.md Section 3.2:
         - 9999: Data not available (flag as missing)
@@ -745,6 +1145,10 @@ class GuruFocusTool(Tool):
 
         Args:
             data: Raw API response data (any structure)
+            path: Field path of ``data`` within the full response
+            expect_specials: False when the caller already knows ``data`` holds
+                no special codes (e.g. _parse_response's byte pre-check);
+                the walk is skipped and [] returned
 
         Returns:
             List of dicts: [{"field": "path.to.field", "value": 9999, "meaning": "..."}]
@@ -754,34 +1158,57 @@ class GuruFocusTool(Tool):
             gurufocus_tool_spec.md Section 3 (Special Values)
         """
         special_values = []
-
-        def scan(obj: Any, path: str = "") -> None:
-            """Recursive scanner for special values"""
-            if isinstance(obj, dict):
+        special_set = _SPECIAL_SET
+
+        # Iterative walk over an explicit list stack of (container, path parts):
+        # no interpreter frame per node and no recursion limit on deep payloads.
+        # Paths are kept as tuples of components (e.g. ("financials", "[0]",
+        # ".revenue")) and only joined into a string when a special value is
+        # reported, so the common no-special branches never build strings.
+        # A dict's own numeric fields are checked inline; child containers are
+        # pushed in reverse so they are still visited in document order.
+        if not expect_specials or (type(data) is not dict and type(data) is not list):
+            return special_values
+
+        stack = [(data, (path,) if path else ())]
+        pop = stack.pop
+        extend = stack.extend
+        while stack:
+            obj, parts = pop()
+            if type(obj) is dict:
+                children = []
                 for key, value in obj.items():
-                    new_path = f"{path}.{key}" if path else key
-                    if isinstance(value, (int, float)):
-                        if value == self.SPECIAL_VALUE_DATA_NA:
+                    # Exact type() checks: decoded JSON never yields subclasses
+                    value_type = type(value)
+                    if value_type is int or value_type is float:
+                        # One hash probe rules out ordinary numbers
+                        if value not in special_set:
+                            continue
+                        field = "".join(parts) + f".{key}" if parts else key
+                        if value == _SPECIAL_NA:
                             special_values.append({
-                                "field": new_path,
-                                "value": self.SPECIAL_VALUE_DATA_NA,
+                                "field": field,
+                                "value": _SPECIAL_NA,
                                 "meaning": "Data not available"
                             })
-                        elif value == self.SPECIAL_VALUE_NO_DEBT:
+                        else:
                             # Context-dependent meaning
-                            meaning = "No debt" if "debt" in new_path.lower() else "No debt OR negative equity"
+                            meaning = "No debt" if "debt" in field.lower() else "No debt OR negative equity"
                             special_values.append({
-                                "field": new_path,
-                                "value": self.SPECIAL_VALUE_NO_DEBT,
+                                "field": field,
+                                "value": _SPECIAL_NO_DEBT,
                                 "meaning": meaning
                             })
-                    else:
-                        scan(value, new_path)
-            elif isinstance(obj, list):
-                for i, item in enumerate(obj):
-                    scan(item, f"{path}[{i}]")
-
-        scan(data)
+                    elif (value_type is dict or value_type is list) and value:
+                        children.append((value, parts + (f".{key}" if parts else key,)))
+                extend(reversed(children))
+            else:
+                # Only non-empty containers are ever pushed, so this is a list
+                extend(
+                    (item, parts + (_INDEX_STRS[i] if i < _INDEX_STRS_LEN else f"[{i}]",))
+                    for i, item in reversed(list(enumerate(obj)))
+                    if (type(item) is dict or type(item) is list) and item
+                )
 
         if special_values:
             logger.info(f"Detected {len(special_values)} special values")
@@ -804,44 +1231,98 @@ class GuruFocusTool(Tool):
         Returns:
             Company name or ticker if not found
         """
-        try:
-            if endpoint == "summary" and "general" in data:
-                return data["general"].get("name", ticker)
-            elif "general" in data:
-                return data["general"].get("name", ticker)
-            else:
-                return ticker
-        except:
-            return ticker
+        # Names learned from an earlier response also cover endpoints whose
+        # payloads carry no "general" section
+        cached = self._name_cache.get(ticker)
+        if cached is not None:
+            return cached
+
+        general = data.get("general") if isinstance(data, dict) else None
+        if isinstance(general, dict):
+            name = general.get("name")
+            if name and isinstance(name, str):
+                self._name_cache[ticker] = name
+                return name
+        return ticker
+
+    def _extract_fields(
+        self,
+        section: Dict[str, Any],
+        fields: Tuple[Tuple[str, str], ...],
+        out: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Extract scalar fields from a response section using a field schema.
+
+        Args:
+            section: Response section (e.g., data["valuation"])
+            fields: Schema of (output key, GuruFocus field) pairs
+            out: Dict to populate (new dict if None)
+
+        Returns:
+            The populated dict (values are floats or None)
+        """
+        if out is None:
+            out = {}
+        safe_float = self._safe_float
+        get = section.get
+        for out_key, src_key in fields:
+            out[out_key] = safe_float(get(src_key))
+        return out
+
+    def _extract_latest_fields(
+        self,
+        section: Dict[str, Any],
+        fields: Tuple[Tuple[str, str], ...],
+        out: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Extract the most recent value (index 0) of each time series in a schema.
 
-    def _safe_float(self, value: Any) -> Optional[float]:
+        Args:
+            section: Response section containing time series lists
+            fields: Schema of (output key, GuruFocus field) pairs
+            out: Dict to populate
+
+        Returns:
+            The populated dict (values are floats or None)
+        """
+        from_series = self._safe_float_from_series
+        get = section.get
+        for out_key, src_key in fields:
+            out[out_key] = from_series(get(src_key), 0)
+        return out
+
+    @staticmethod
+    def _safe_float(value: Any) -> Optional[float]:
         """
         Safely convert value to float, handling special values and errors.
 
+        Decoded JSON numbers are exact int/float instances, so they take a
+        type() fast path; strings go through the memoized _safe_float_str and
+        anything else through float().
+
         Args:
             value: Value to convert (may be str, int, float, None)
 
         Returns:
             Float value or None if invalid/special value
         """
+        value_type = type(value)
+        if value_type is float:
+            return None if value in _SPECIAL_SET else value
+        if value_type is int:
+            return None if value in _SPECIAL_SET else float(value)
         if value is None:
             return None
-
-        # Handle string values
-        if isinstance(value, str):
-            try:
-                value = float(value)
-            except ValueError:
-                return None
-
-        # Handle special values
-        if value == self.SPECIAL_VALUE_DATA_NA or value == self.SPECIAL_VALUE_NO_DEBT:
-            return None
+        if value_type is str:
+            return _safe_float_str(value)
 
         try:
-            return float(value)
+            value = float(value)
         except (ValueError, TypeError):
             return None
+        return None if value in _SPECIAL_SET else value
 
     def _safe_float_from_series(self, series: Optional[List], index: int) -> Optional[float]:
         """
@@ -875,14 +1356,84 @@ class GuruFocusTool(Tool):
         if not series or not isinstance(series, list):
             return []
 
-        return [self._safe_float(v) for v in series[:max_length]]
+        window = series[:max_length]
+
+        # _safe_float's int/float fast paths inlined; other types call it
+        safe_float = self._safe_float
+        specials = _SPECIAL_SET
+        out = []
+        append = out.append
+        for v in window:
+            value_type = type(v)
+            if value_type is float:
+                append(None if v in specials else v)
+            elif value_type is int:
+                append(None if v in specials else float(v))
+            else:
+                append(safe_float(v))
+        return out
+
+    def _scaled_latest(self, series: Optional[List]) -> Optional[float]:
+        """
+        Extract the most recent ratio from a series, normalized to a decimal.
+
+        Equivalent to _series_stats(series)["latest"] without converting the
+        rest of the series.
+
+        Args:
+            series: List of values (time series, most recent first)
+
+        Returns:
+            Float value (percentages > 1 divided by 100) or None if invalid
+        """
+        value = self._safe_float_from_series(series, 0)
+        if value is None or not math.isfinite(value):
+            return None
+        return value / 100.0 if value > 1 else value
+
+    def _series_stats(
+        self,
+        series: Optional[List],
+        scale_if_pct: bool = True
+    ) -> Optional[Dict[str, Optional[float]]]:
+        """
+        Compute latest value and 10-year mean of a time series in one NumPy pass.
+
+        Special values (9999, 10000) and unparseable entries are dropped from
+        the mean. The latest value is always taken from index 0 (None if that
+        entry is invalid), matching _safe_float_from_series(series, 0).
+
+        Args:
+            series: List of values (time series, most recent first)
+            scale_if_pct: Convert percentages (> 1) to decimals
+
+        Returns:
+            Dict with "latest" and "mean_10y" (floats or None),
+            or None if series is missing/empty
+        """
+        if not series or not isinstance(series, list):
+            return None
+
+        # None -> NaN under float64, so invalid entries fall out of the mask
+        arr = np.asarray(self._extract_series(series, 10), dtype=np.float64)
+        if scale_if_pct:
+            arr = np.where(arr > 1, arr / 100.0, arr)
+
+        valid = arr[np.isfinite(arr)]
+        latest = arr[0] if np.isfinite(arr[0]) else None
+
+        return {
+            "latest": float(latest) if latest is not None else None,
+            "mean_10y": float(valid.mean()) if valid.size else None
+        }
 
-    def _error(self, message: str) -> Dict[str, Any]:
+    def _error(self, message: str, **extra: Any) -> Dict[str, Any]:
         """
         Return standardized error response.
 
         Args:
             message: Error message
+            **extra: Additional machine-readable fields (e.g., code, retry_after)
 
         Returns:
             Dict with success=False and error message
@@ -891,9 +1442,10 @@ class GuruFocusTool(Tool):
         return {
             "success": False,
             "data": None,
-            "error": message
+            "error": message,
+            **extra
         }
 
 
 # Make tool available for import
-__all__ = ["GuruFocusTool"]
+__all__ = ["GuruFocusTool", "RateLimited"]
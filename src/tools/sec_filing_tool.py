@@ -35,10 +35,17 @@ import os
 import time
 import logging
 import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import orjson
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import lxml.html
+from lxml import etree
 from datetime import datetime
-from typing import Dict, Any, Optional, Tuple
+from typing import Callable, Dict, Any, List, Optional, Tuple
 from dotenv import load_dotenv
 
 from src.tools.base import Tool
@@ -46,10 +53,88 @@ from src.tools.base import Tool
 # Load environment variables
 load_dotenv()
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Configure logging (handlers/level are left to the application)
 logger = logging.getLogger(__name__)
 
+# Filings are decoded to str before parsing; re-encoding as UTF-8 and pinning
+# the parser to it keeps lxml from honouring a stale <?xml encoding=...?>
+# declaration (common in inline-XBRL 10-Ks).
+_HTML_PARSER = lxml.html.HTMLParser(encoding='utf-8')
+
+
+class _PacedRetry(Retry):
+    """
+    urllib3 Retry that waits at least backoff_min and takes a rate-limit slot.
+
+    Stock Retry does not back off before the first retry, and its retries
+    happen inside urllib3, out of reach of SECFilingTool._enforce_rate_limit.
+    Both would let a burst of 429/5xx retries exceed SEC's 10 req/s limit.
+    """
+
+    def __init__(
+        self,
+        *args,
+        backoff_min: float = 0.0,
+        before_retry: Optional[Callable[[], None]] = None,
+        **kwargs
+    ):
+        super().__init__(*args, **kwargs)
+        self.backoff_min = backoff_min
+        self.before_retry = before_retry
+
+    def new(self, **kw):
+        # urllib3 builds a fresh Retry per attempt; carry the extras across
+        retry = super().new(**kw)
+        retry.backoff_min = self.backoff_min
+        retry.before_retry = self.before_retry
+        return retry
+
+    def get_backoff_time(self) -> float:
+        return max(self.backoff_min, super().get_backoff_time())
+
+    def sleep(self, response=None) -> None:
+        super().sleep(response)
+        if self.before_retry is not None:
+            self.before_retry()
+
+
+class _FilingTextTarget:
+    """
+    lxml parser target that collects document text without building a tree.
+
+    Receives SAX-style events while the parser is fed, so memory stays at the
+    size of the collected text rather than the DOM. Text inside skip_tags is
+    dropped; text after their closing tag (the tail) is kept, matching
+    etree.strip_elements(..., with_tail=False) followed by text_content().
+    """
+
+    def __init__(self, skip_tags: frozenset):
+        self.skip_tags = skip_tags
+        self.skip_depth = 0
+        self.in_body = False
+        self.body_parts: List[str] = []
+        self.other_parts: List[str] = []
+
+    def start(self, tag, attrib):
+        if tag in self.skip_tags:
+            self.skip_depth += 1
+        elif tag == 'body':
+            self.in_body = True
+
+    def end(self, tag):
+        if tag in self.skip_tags:
+            self.skip_depth -= 1
+        elif tag == 'body':
+            self.in_body = False
+
+    def data(self, data):
+        if not self.skip_depth:
+            (self.body_parts if self.in_body else self.other_parts).append(data)
+
+    def close(self) -> str:
+        """Return the <body> text (whole document text if there was no body)."""
+        return ''.join(self.body_parts or self.other_parts)
+
 
 class SECFilingTool(Tool):
     """
@@ -97,6 +182,12 @@ class SECFilingTool(Tool):
     BASE_URL_FILINGS = "https://www.sec.gov"
     TICKER_TO_CIK_URL = "https://www.sec.gov/files/company_tickers.json"
 
+    # On-disk ticker→CIK map (opt-in via SEC_TICKER_CACHE_PERSIST=1)
+    TICKER_CACHE_PATH = os.path.join(
+        os.path.expanduser("~"), ".cache", "basirah", "ticker_cik.json"
+    )
+    TICKER_CACHE_TTL = 24 * 60 * 60  # SEC refreshes company_tickers.json daily
+
     # Rate Limiting (CRITICAL: SEC enforces 10 requests/second)
     MIN_REQUEST_INTERVAL = 0.11  # 110ms = ~9 req/sec (safely under 10)
 
@@ -104,9 +195,47 @@ class SECFilingTool(Tool):
     TIMEOUT_SHORT = 30  # For API metadata calls
     TIMEOUT_LONG = 90   # For large filing downloads
 
-    # Retry Configuration
+    # Ticker→CIK state shared by every instance, so the ~1.5MB map is
+    # downloaded once per process however many tools are created
+    ticker_map: Optional[Dict[str, str]] = None  # Full {TICKER: padded CIK}
+    ticker_to_cik_cache: Dict[str, str] = {}  # Lookups as requested
+    _ticker_map_lock = threading.Lock()
+
+    # Batch execution (concurrent requests still share the rate limiter)
+    MAX_BATCH_WORKERS = 9
+
+    # Submissions cache (parsed JSON is 0.5-5MB per company, so keep it small)
+    SUBMISSIONS_CACHE_SIZE = 16
+    SUBMISSIONS_CACHE_TTL = 60 * 60  # New filings show up within the hour
+
+    # Flattened filing text, so extracting several sections of one filing
+    # parses its HTML once (entries hold the HTML too, so keep it small)
+    TEXT_CACHE_SIZE = 8
+
+    # Cleaned full text by filing URL (a filing never changes, so no TTL);
+    # lets a prefetch or availability check serve the agent's later request
+    FULL_TEXT_CACHE_SIZE = 12
+
+    # Streaming download chunk size (fed to the HTML parser as it arrives)
+    DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+    # Elements whose text is dropped from full-text extraction
+    FULL_TEXT_SKIP_TAGS = ('script', 'style', 'table', 'nav', 'header', 'footer')
+
+    # Retry Configuration (applied by urllib3 at the adapter level). Read
+    # timeouts are not retried: with TIMEOUT_LONG they would hang for minutes.
     MAX_RETRIES = 3
-    RETRY_BACKOFF_FACTOR = 2  # 1s, 2s, 4s
+    RETRY_BACKOFF_FACTOR = 2  # 1s minimum, then 4s, 8s (plus jitter)
+    RETRY_BACKOFF_MIN = 1.0  # seconds
+    RETRY_BACKOFF_JITTER = 1.0  # seconds
+    RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+    # Connection pool (keep-alive reuse across data.sec.gov / www.sec.gov)
+    POOL_CONNECTIONS = 4
+    POOL_MAXSIZE = 16
+
+    # Ticker validation (same shape as the "ticker" schema pattern)
+    _TICKER_RE = re.compile(r"[A-Z]{1,5}\.?[A-Z]?")
 
     # Filing Types
     VALID_FILING_TYPES = ["10-K", "10-Q", "20-F", "DEF 14A", "8-K"]
@@ -114,12 +243,43 @@ class SECFilingTool(Tool):
     # Sections (for 10-K/10-Q)
     VALID_SECTIONS = ["business", "risk_factors", "mda", "financial_statements", "full"]
 
-    # Section Patterns (for text extraction)
+    # Section Patterns (for text extraction). Compiled with re.ASCII, so the
+    # non-breaking space (&#160;, very common in filing headers) is listed
+    # explicitly next to \s.
     SECTION_PATTERNS = {
-        "business": r"Item\s+1[\.\s\-]+Business",
-        "risk_factors": r"Item\s+1A[\.\s\-]+Risk\s+Factors",
-        "mda": r"Item\s+7[\.\s\-]+Management['\']?s\s+Discussion",
-        "financial_statements": r"Item\s+8[\.\s\-]+Financial\s+Statements"
+        "business": r"Item[\s\xa0]+1[\.\s\xa0\-]+Business",
+        "risk_factors": r"Item[\s\xa0]+1A[\.\s\xa0\-]+Risk[\s\xa0]+Factors",
+        "mda": r"Item[\s\xa0]+7[\.\s\xa0\-]+Management['\u2019]?s[\s\xa0]+Discussion",
+        "financial_statements": r"Item[\s\xa0]+8[\.\s\xa0\-]+Financial[\s\xa0]+Statements"
+    }
+
+    # Compiled once at class load instead of on every _extract_section call;
+    # re.ASCII keeps \s and case folding off the Unicode tables
+    _SECTION_RES = {
+        name: re.compile(pattern, re.IGNORECASE | re.ASCII)
+        for name, pattern in SECTION_PATTERNS.items()
+    }
+    _NEXT_ITEM_RE = re.compile(
+        r'Item[\s\xa0]+\d+[A-Z]?[\.\s\xa0\-]', re.IGNORECASE | re.ASCII
+    )
+
+    # Text cleanup (run over every extracted filing or section)
+    _TOC_RE = re.compile(r'Table\s+of\s+Contents', re.IGNORECASE)
+    _SENTENCE_BREAK_RE = re.compile(r'\.\s+(?=[A-Z])')
+    _MULTI_SPACE_RE = re.compile(r' {2,}')
+
+    # Canonical header spellings, tried with str.find before the regex
+    # (which is only needed for spacing/punctuation variants such as &nbsp;)
+    _SECTION_LITERALS = {
+        "business": ("Item 1. Business", "ITEM 1. BUSINESS"),
+        "risk_factors": ("Item 1A. Risk Factors", "ITEM 1A. RISK FACTORS"),
+        "mda": (
+            "Item 7. Management's Discussion", "Item 7. Management\u2019s Discussion",
+            "ITEM 7. MANAGEMENT'S DISCUSSION", "ITEM 7. MANAGEMENT\u2019S DISCUSSION"
+        ),
+        "financial_statements": (
+            "Item 8. Financial Statements", "ITEM 8. FINANCIAL STATEMENTS"
+        )
     }
 
     @property
@@ -234,13 +394,54 @@ class SECFilingTool(Tool):
             # Note: Host header is automatically set by requests library per-request
         })
 
-        # Rate limiting tracker
+        # Pooled keep-alive connections; urllib3 retries idempotent GETs on
+        # connection errors and transient status codes (honours Retry-After
+        # on 429/503), and each retry waits for a rate-limit slot
+        adapter = HTTPAdapter(
+            pool_connections=self.POOL_CONNECTIONS,
+            pool_maxsize=self.POOL_MAXSIZE,
+            max_retries=_PacedRetry(
+                total=self.MAX_RETRIES,
+                read=0,
+                backoff_factor=self.RETRY_BACKOFF_FACTOR,
+                backoff_jitter=self.RETRY_BACKOFF_JITTER,
+                backoff_min=self.RETRY_BACKOFF_MIN,
+                before_retry=self._enforce_rate_limit,
+                status_forcelist=self.RETRY_STATUS_CODES,
+                allowed_methods=frozenset(['GET'])
+            )
+        )
+        self.session.mount('https://', adapter)
+
+        # Rate limiting tracker (time of the most recently reserved request slot)
         self.last_request_time = 0.0
+        self._rate_limit_lock = threading.Lock()
+
+        # Ticker→CIK map is shared by all instances (see class attributes);
+        # load a fresh on-disk copy if persistence is enabled
+        self.persist_ticker_map = os.getenv("SEC_TICKER_CACHE_PERSIST") == "1"
+        if self.persist_ticker_map and SECFilingTool.ticker_map is None:
+            with SECFilingTool._ticker_map_lock:
+                if SECFilingTool.ticker_map is None:
+                    SECFilingTool.ticker_map = self._load_ticker_map()
+
+        # LRU of CIK → (fetch time, submissions JSON)
+        self._submissions_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._submissions_lock = threading.Lock()
 
-        # CIK cache (avoid redundant lookups)
-        self.ticker_to_cik_cache: Dict[str, str] = {}
+        # LRU of CIK → (form list, {form type: [positions]}) over recent filings;
+        # sized and locked like the submissions cache it indexes
+        self._form_index_cache: "OrderedDict[str, Tuple[List[str], Dict[str, List[int]]]]" = OrderedDict()
 
-        logger.info(f"User-Agent configured: {user_agent[:50]}...")
+        # LRU of hash(html) → (html, flattened section source text)
+        self._text_cache: "OrderedDict[int, Tuple[str, str]]" = OrderedDict()
+        self._text_lock = threading.Lock()
+
+        # LRU of filing URL → cleaned full text
+        self._full_text_cache: "OrderedDict[str, str]" = OrderedDict()
+        self._full_text_lock = threading.Lock()
+
+        logger.info("User-Agent configured: %s...", user_agent[:50])
 
     def execute(
         self,
@@ -289,14 +490,14 @@ class SECFilingTool(Tool):
             - Invalid ticker → Returns error with clear message
             - Filing not found → Returns error suggesting alternatives
             - Rate limit exceeded → Automatic retry with backoff
-            - Network timeout → Retry up to MAX_RETRIES times
+            - Connection failure or 429/5xx → Retry up to MAX_RETRIES times
         """
-        logger.info(f"Executing SEC filing retrieval: {ticker} {filing_type}")
+        logger.info("Executing SEC filing retrieval: %s %s", ticker, filing_type)
 
         # Step 1: Validate inputs
         validation_error = self._validate_inputs(ticker, filing_type, section, quarter)
         if validation_error:
-            logger.error(f"Validation error: {validation_error}")
+            logger.error("Validation error: %s", validation_error)
             return self._error_response(validation_error)
 
         try:
@@ -310,7 +511,7 @@ class SECFilingTool(Tool):
                 logger.error(error_msg)
                 return self._error_response(error_msg)
 
-            logger.info(f"CIK lookup successful: {ticker} → {cik}")
+            logger.info("CIK lookup successful: %s → %s", ticker, cik)
 
             # Step 3: Get company filings list
             company_data = self._get_company_submissions(cik)
@@ -320,7 +521,7 @@ class SECFilingTool(Tool):
                 return self._error_response(error_msg)
 
             company_name = company_data.get("name", "Unknown Company")
-            logger.info(f"Company: {company_name}")
+            logger.info("Company: %s", company_name)
 
             # Step 4: Find specific filing
             filing_info = self._find_filing(company_data, filing_type, year, quarter)
@@ -328,11 +529,11 @@ class SECFilingTool(Tool):
             # Auto-fallback to 20-F for foreign companies (ADRs)
             # Foreign companies file 20-F instead of 10-K
             if not filing_info and filing_type == "10-K":
-                logger.info(f"No 10-K found for {ticker}, trying 20-F (foreign company annual report)...")
+                logger.info("No 10-K found for %s, trying 20-F (foreign company annual report)...", ticker)
                 filing_info = self._find_filing(company_data, "20-F", year, quarter)
 
                 if filing_info:
-                    logger.info(f"Found 20-F filing instead (foreign company): {ticker}")
+                    logger.info("Found 20-F filing instead (foreign company): %s", ticker)
                     filing_type = "20-F"  # Update filing_type for subsequent messages
 
             if not filing_info:
@@ -345,28 +546,32 @@ class SECFilingTool(Tool):
                 return self._error_response(error_msg)
 
             logger.info(
-                f"Found filing: {filing_type} filed {filing_info['filing_date']} "
-                f"(fiscal {filing_info.get('fiscal_year', 'N/A')})"
+                "Found filing: %s filed %s (fiscal %s)",
+                filing_type, filing_info['filing_date'], filing_info.get('fiscal_year', 'N/A')
             )
 
             # Step 5: Download filing HTML
             filing_url = self._construct_filing_url(cik, filing_info)
-            html_content = self._download_filing(filing_url)
-
-            if not html_content:
-                error_msg = "Failed to download filing content. Filing may be unavailable."
-                logger.error(error_msg)
-                return self._error_response(error_msg)
-
-            logger.info(f"Downloaded filing: {len(html_content)} bytes")
+            download_error = "Failed to download filing content. Filing may be unavailable."
 
             # Step 6: Extract text
             if filing_type in ["10-K", "10-Q"] and section != "full":
+                html_content = self._download_filing(filing_url)
+                if not html_content:
+                    logger.error(download_error)
+                    return self._error_response(download_error)
+
+                logger.info("Downloaded filing: %d bytes", len(html_content))
+
                 content = self._extract_section(html_content, section)
-                logger.info(f"Extracted section '{section}': {len(content)} characters")
+                logger.info("Extracted section '%s': %d characters", section, len(content))
             else:
-                content = self._extract_full_text(html_content)
-                logger.info(f"Extracted full text: {len(content)} characters")
+                content = self._get_full_text(filing_url)
+                if content is None:
+                    logger.error(download_error)
+                    return self._error_response(download_error)
+
+                logger.info("Extracted full text: %d characters", len(content))
 
             # Step 7: Return success
             return {
@@ -407,6 +612,35 @@ class SECFilingTool(Tool):
             logger.exception(error_msg)
             return self._error_response(error_msg)
 
+    def execute_batch(
+        self,
+        requests_list: List[Dict[str, Any]],
+        max_workers: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Run several execute() calls concurrently (e.g. a watchlist of 10-Ks).
+
+        Requests still leave MIN_REQUEST_INTERVAL apart (the rate limiter is
+        shared), but each download and HTML parse overlaps the next request's
+        rate-limit wait, so throughput approaches SEC's ~9 req/sec instead of
+        one filing per sequential CIK + submissions + download round trip.
+
+        Args:
+            requests_list: execute() keyword arguments per request, e.g.
+                [{"ticker": "AAPL", "filing_type": "10-K", "section": "mda"}]
+            max_workers: Concurrent requests (default: MAX_BATCH_WORKERS)
+
+        Returns:
+            List of execute() responses, in the same order as requests_list
+        """
+        if not requests_list:
+            return []
+
+        workers = min(max_workers or self.MAX_BATCH_WORKERS, len(requests_list))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(self.execute, **kwargs) for kwargs in requests_list]
+            return [future.result() for future in futures]
+
     # =========================================================================
     # INPUT VALIDATION
     # =========================================================================
@@ -434,7 +668,7 @@ class SECFilingTool(Tool):
         if not ticker:
             return "Ticker cannot be empty"
 
-        if not ticker.replace(".", "").isalpha() or not ticker.isupper():
+        if not self._TICKER_RE.fullmatch(ticker):
             return f"Ticker must be uppercase letters only (e.g., 'AAPL', 'BRK.B'). Got: '{ticker}'"
 
         # Validate filing type
@@ -473,20 +707,25 @@ class SECFilingTool(Tool):
 
         This method blocks until sufficient time has elapsed since the last request.
 
+        Thread-safe: each caller reserves the next free slot under a lock and
+        sleeps outside it, so concurrent downloads queue up 110ms apart while
+        their network I/O overlaps instead of serializing behind one sleep.
+
         Critical: Violating SEC rate limits can result in IP blocking.
 
         References:
             - SEC Fair Access: https://www.sec.gov/os/accessing-edgar-data
         """
-        elapsed = time.time() - self.last_request_time
-
-        if elapsed < self.MIN_REQUEST_INTERVAL:
-            sleep_time = self.MIN_REQUEST_INTERVAL - elapsed
-            logger.debug(f"Rate limiting: sleeping {sleep_time:.3f}s")
+        with self._rate_limit_lock:
+            now = time.time()
+            slot = max(now, self.last_request_time + self.MIN_REQUEST_INTERVAL)
+            self.last_request_time = slot
+
+        sleep_time = slot - now
+        if sleep_time > 0:
+            logger.debug("Rate limiting: sleeping %.3fs", sleep_time)
             time.sleep(sleep_time)
 
-        self.last_request_time = time.time()
-
     # =========================================================================
     # CIK LOOKUP
     # =========================================================================
@@ -497,8 +736,8 @@ class SECFilingTool(Tool):
 
         SEC API requires CIK, not ticker. This method:
         1. Checks cache for previously looked up ticker
-        2. If not cached, downloads ticker→CIK mapping from SEC
-        3. Searches for matching ticker
+        2. If the ticker map is not loaded, downloads it from SEC once
+        3. Looks up the ticker in the map (O(1))
         4. Returns 10-digit zero-padded CIK
 
         Args:
@@ -513,19 +752,52 @@ class SECFilingTool(Tool):
 
         Notes:
             - CIK must be 10 digits with leading zeros for API calls
-            - Cache is maintained in memory to avoid repeated lookups
+            - Map and cache are shared by all instances (one download per process)
+            - Map persisted to TICKER_CACHE_PATH when SEC_TICKER_CACHE_PERSIST=1
             - Rate limiting applied before API call
         """
         # Check cache first
         if ticker in self.ticker_to_cik_cache:
-            logger.debug(f"CIK cache hit: {ticker}")
+            logger.debug("CIK cache hit: %s", ticker)
             return self.ticker_to_cik_cache[ticker]
 
+        ticker_map = SECFilingTool.ticker_map
+        if ticker_map is None:
+            # One download per process; concurrent callers wait for it
+            with SECFilingTool._ticker_map_lock:
+                if SECFilingTool.ticker_map is None:
+                    SECFilingTool.ticker_map = self._fetch_ticker_map(ticker)
+                ticker_map = SECFilingTool.ticker_map
+
+            if ticker_map is None:
+                return None
+
+        cik = ticker_map.get(ticker.upper())
+        if cik is None:
+            logger.warning("CIK not found for ticker: %s", ticker)
+            return None
+
+        # Cache result
+        self.ticker_to_cik_cache[ticker] = cik
+
+        logger.info("CIK found: %s → %s", ticker, cik)
+        return cik
+
+    def _fetch_ticker_map(self, ticker: str) -> Optional[Dict[str, str]]:
+        """
+        Download company_tickers.json and build the {TICKER: padded CIK} map.
+
+        Args:
+            ticker: Ticker being looked up (for logging)
+
+        Returns:
+            Optional[Dict[str, str]]: The full map, or None if the request fails
+        """
         # Rate limit before API call
         self._enforce_rate_limit()
 
         try:
-            logger.info(f"Looking up CIK for ticker: {ticker}")
+            logger.info("Looking up CIK for ticker: %s", ticker)
 
             response = self.session.get(
                 self.TICKER_TO_CIK_URL,
@@ -533,30 +805,62 @@ class SECFilingTool(Tool):
             )
             response.raise_for_status()
 
-            tickers_data = response.json()
+            tickers_data = orjson.loads(response.content)
 
-            # Search for ticker in data
+            # Build the full map once; CIK padded to 10 digits. A ticker can
+            # appear more than once, and the first entry wins, as it did when
+            # the file was scanned per lookup
+            ticker_map: Dict[str, str] = {}
             for entry in tickers_data.values():
-                if entry['ticker'].upper() == ticker.upper():
-                    # Pad CIK to 10 digits with leading zeros
-                    cik = str(entry['cik_str']).zfill(10)
-
-                    # Cache result
-                    self.ticker_to_cik_cache[ticker] = cik
-
-                    logger.info(f"CIK found: {ticker} → {cik}")
-                    return cik
-
-            logger.warning(f"CIK not found for ticker: {ticker}")
-            return None
+                ticker_map.setdefault(entry['ticker'].upper(), str(entry['cik_str']).zfill(10))
 
         except requests.exceptions.RequestException as e:
-            logger.error(f"Error fetching ticker-to-CIK mapping: {e}")
+            logger.error("Error fetching ticker-to-CIK mapping: %s", e)
             return None
 
         except Exception as e:
-            logger.error(f"Unexpected error during CIK lookup: {e}")
+            logger.error("Unexpected error during CIK lookup: %s", e)
+            return None
+
+        if self.persist_ticker_map:
+            self._save_ticker_map(ticker_map)
+
+        return ticker_map
+
+    def _load_ticker_map(self) -> Optional[Dict[str, str]]:
+        """
+        Load the ticker→CIK map saved by a previous process.
+
+        Returns:
+            Optional[Dict[str, str]]: The map, or None if the file is missing,
+            unreadable or older than TICKER_CACHE_TTL
+        """
+        try:
+            if os.path.getmtime(self.TICKER_CACHE_PATH) < time.time() - self.TICKER_CACHE_TTL:
+                return None
+            with open(self.TICKER_CACHE_PATH, "rb") as f:
+                ticker_map = orjson.loads(f.read())
+        except (OSError, ValueError):
             return None
+        return ticker_map if isinstance(ticker_map, dict) else None
+
+    def _save_ticker_map(self, ticker_map: Dict[str, str]) -> None:
+        """
+        Atomically persist the ticker→CIK map for later processes.
+
+        Written to a temp file and moved into place with os.replace, so
+        concurrent readers never see a partial file. Failures are logged
+        and otherwise ignored; persistence is best-effort.
+        """
+        path = self.TICKER_CACHE_PATH
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                f.write(orjson.dumps(ticker_map))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.debug("Could not persist ticker map: %s", e)
 
     # =========================================================================
     # FILING RETRIEVAL
@@ -593,27 +897,41 @@ class SECFilingTool(Tool):
             - Rate limiting applied before API call
             - Returns most recent 1000 filings in "recent" array
             - Older filings available via pagination (not implemented)
+            - Successful responses cached per CIK (LRU, SUBMISSIONS_CACHE_TTL)
         """
+        with self._submissions_lock:
+            cached = self._submissions_cache.get(cik)
+            if cached is not None and time.time() - cached[0] < self.SUBMISSIONS_CACHE_TTL:
+                self._submissions_cache.move_to_end(cik)
+                logger.debug("Submissions cache hit: %s", cik)
+                return cached[1]
+
         self._enforce_rate_limit()
 
         try:
             url = f"{self.BASE_URL_DATA}/submissions/CIK{cik}.json"
-            logger.info(f"Fetching company submissions from: {url}")
+            logger.info("Fetching company submissions from: %s", url)
 
             response = self.session.get(url, timeout=self.TIMEOUT_SHORT)
             response.raise_for_status()
 
-            company_data = response.json()
-            logger.info(f"Retrieved {len(company_data.get('filings', {}).get('recent', {}).get('form', []))} recent filings")
+            company_data = orjson.loads(response.content)
+            logger.info("Retrieved %d recent filings", len(company_data.get('filings', {}).get('recent', {}).get('form', [])))
+
+            with self._submissions_lock:
+                self._submissions_cache[cik] = (time.time(), company_data)
+                self._submissions_cache.move_to_end(cik)
+                while len(self._submissions_cache) > self.SUBMISSIONS_CACHE_SIZE:
+                    self._submissions_cache.popitem(last=False)
 
             return company_data
 
         except requests.exceptions.RequestException as e:
-            logger.error(f"Error fetching company submissions: {e}")
+            logger.error("Error fetching company submissions: %s", e)
             return None
 
         except Exception as e:
-            logger.error(f"Unexpected error fetching company submissions: {e}")
+            logger.error("Unexpected error fetching company submissions: %s", e)
             return None
 
     def _find_filing(
@@ -663,13 +981,10 @@ class SECFilingTool(Tool):
             report_dates = recent_filings.get('reportDate', [])
             primary_documents = recent_filings.get('primaryDocument', [])
 
-            logger.info(f"Searching {len(forms)} filings for {filing_type}")
-
-            # Search through filings
-            for i, form in enumerate(forms):
-                if form != filing_type:
-                    continue
+            logger.info("Searching %d filings for %s", len(forms), filing_type)
 
+            # Visit only filings of the requested form (newest first)
+            for i in self._get_form_index(company_data).get(filing_type, ()):
                 report_date = report_dates[i] if i < len(report_dates) else ""
                 fiscal_year = int(report_date.split('-')[0]) if report_date else None
 
@@ -695,16 +1010,52 @@ class SECFilingTool(Tool):
                     "fiscal_year": fiscal_year
                 }
 
-                logger.info(f"Found matching filing: {filing_info['accession_number']}")
+                logger.info("Found matching filing: %s", filing_info['accession_number'])
                 return filing_info
 
-            logger.warning(f"No matching {filing_type} filing found")
+            logger.warning("No matching %s filing found", filing_type)
             return None
 
         except (KeyError, IndexError, ValueError) as e:
-            logger.error(f"Error parsing filing data: {e}")
+            logger.error("Error parsing filing data: %s", e)
             return None
 
+    def _get_form_index(self, company_data: Dict[str, Any]) -> Dict[str, List[int]]:
+        """
+        Index recent filings by form type.
+
+        Built once per submissions payload and reused for later lookups on
+        the same company (e.g. the 20-F fallback after a 10-K miss). Like
+        the submissions cache, at most SUBMISSIONS_CACHE_SIZE companies are
+        kept.
+
+        Args:
+            company_data: Company data from _get_company_submissions()
+
+        Returns:
+            Dict[str, List[int]]: Form type → positions in the "recent" arrays
+        """
+        forms = company_data['filings']['recent'].get('form', [])
+        key = company_data.get('cik', '')
+
+        with self._submissions_lock:
+            cached = self._form_index_cache.get(key)
+            if cached is not None and cached[0] is forms:
+                self._form_index_cache.move_to_end(key)
+                return cached[1]
+
+        form_index: Dict[str, List[int]] = {}
+        for i, form in enumerate(forms):
+            form_index.setdefault(form, []).append(i)
+
+        with self._submissions_lock:
+            self._form_index_cache[key] = (forms, form_index)
+            self._form_index_cache.move_to_end(key)
+            while len(self._form_index_cache) > self.SUBMISSIONS_CACHE_SIZE:
+                self._form_index_cache.popitem(last=False)
+
+        return form_index
+
     def _construct_filing_url(
         self,
         cik: str,
@@ -748,14 +1099,14 @@ class SECFilingTool(Tool):
             f"{accession_clean}/{filing_info['primary_document']}"
         )
 
-        logger.debug(f"Constructed filing URL: {url}")
+        logger.debug("Constructed filing URL: %s", url)
         return url
 
     def _download_filing(self, url: str) -> Optional[str]:
         """
         Download filing HTML content.
 
-        Downloads SEC filing document with retry logic for large files.
+        Downloads SEC filing document (retries handled by the session adapter).
 
         Args:
             url: Complete URL to filing document
@@ -766,86 +1117,174 @@ class SECFilingTool(Tool):
         Notes:
             - Rate limiting applied before request
             - Uses longer timeout (90s) for large filings
-            - Retries on timeout (up to MAX_RETRIES)
-            - Returns raw HTML (no parsing)
+            - Connection errors and 429/5xx responses retried by urllib3
+              (up to MAX_RETRIES, rate limited; read timeouts are not retried)
+            - Decoded as UTF-8 (invalid bytes replaced)
+            - Returns raw HTML of the <body> element (no parsing)
         """
         self._enforce_rate_limit()
 
-        for attempt in range(self.MAX_RETRIES):
-            try:
-                logger.info(f"Downloading filing (attempt {attempt + 1}/{self.MAX_RETRIES}): {url}")
+        try:
+            logger.info("Downloading filing: %s", url)
 
-                response = self.session.get(url, timeout=self.TIMEOUT_LONG)
-                response.raise_for_status()
+            response = self.session.get(url, timeout=self.TIMEOUT_LONG)
+            response.raise_for_status()
 
-                logger.info(f"Filing downloaded successfully: {len(response.text)} bytes")
-                return response.text
-
-            except requests.exceptions.Timeout:
-                if attempt < self.MAX_RETRIES - 1:
-                    wait_time = self.RETRY_BACKOFF_FACTOR ** attempt
-                    logger.warning(
-                        f"Download timeout. "
-                        f"Retrying in {wait_time}s (attempt {attempt + 1}/{self.MAX_RETRIES})"
-                    )
-                    time.sleep(wait_time)
-                else:
-                    logger.error(f"Download failed after {self.MAX_RETRIES} attempts")
-                    return None
-
-            except requests.exceptions.RequestException as e:
-                logger.error(f"Error downloading filing: {e}")
-                return None
+            raw = response.content
+            logger.info("Filing downloaded successfully: %d bytes", len(raw))
 
-        return None
+            # SEC filings are ASCII/UTF-8; decoding directly skips requests'
+            # charset guessing (ISO-8859-1 for text/html without a charset).
+            # Only <body> is decoded and later parsed (head/stylesheets dropped).
+            return self._slice_body(raw).decode('utf-8', errors='replace')
 
-    # =========================================================================
-    # TEXT EXTRACTION
-    # =========================================================================
+        except requests.exceptions.RequestException as e:
+            logger.error("Error downloading filing: %s", e)
+            return None
 
-    def _extract_full_text(self, html_content: str) -> str:
+    @staticmethod
+    def _slice_body(raw: bytes) -> bytes:
         """
-        Extract clean text from filing HTML.
+        Cut raw filing bytes down to the <body>...</body> element.
 
-        Process:
-            1. Parse HTML with BeautifulSoup
-            2. Remove unwanted elements (scripts, styles, tables)
-            3. Extract text
-            4. Clean whitespace
-            5. Preserve paragraph structure
+        A C-level byte search, so the decode and parse steps never see the
+        <head> (stylesheets, metadata). Returns the input unchanged if either
+        tag is missing.
 
         Args:
-            html_content: Raw HTML from SEC filing
+            raw: Raw filing bytes
+
+        Returns:
+            bytes: The body element, or raw if it cannot be located
+        """
+        start = raw.find(b'<body')
+        if start == -1:
+            start = raw.find(b'<BODY')
+
+        end = raw.rfind(b'</body>')
+        if end == -1:
+            end = raw.rfind(b'</BODY>')
+
+        if start == -1 or end < start:
+            return raw
+        return raw[start:end + len(b'</body>')]
+
+    def _get_full_text(self, url: str) -> Optional[str]:
+        """
+        Cleaned full text of the filing at url, from cache when available.
+
+        Full text only needs the text, so it is collected while the body
+        downloads. Results are cached (LRU, FULL_TEXT_CACHE_SIZE) by URL.
+
+        Args:
+            url: Filing URL
 
         Returns:
-            str: Clean, readable text
+            str: Cleaned filing text, or None if the download failed
+        """
+        with self._full_text_lock:
+            cached = self._full_text_cache.get(url)
+            if cached is not None:
+                self._full_text_cache.move_to_end(url)
+                logger.debug("Full text cache hit: %s", url)
+                return cached
+
+        filing_text = self._download_filing_text(url)
+        if filing_text is None:
+            return None
+        content = self._clean_text(filing_text)
+
+        with self._full_text_lock:
+            self._full_text_cache[url] = content
+            self._full_text_cache.move_to_end(url)
+            while len(self._full_text_cache) > self.FULL_TEXT_CACHE_SIZE:
+                self._full_text_cache.popitem(last=False)
+
+        return content
+
+    def _download_filing_text(self, url: str) -> Optional[str]:
+        """
+        Download a filing and extract its text incrementally as chunks arrive.
+
+        Used for full-text extraction, which never needs the raw HTML or a
+        document tree: chunks are fed to a tree-less parser target
+        (_FilingTextTarget), so network I/O overlaps with parsing and peak
+        memory is bounded by the extracted text rather than the DOM of a
+        10-50MB filing.
+
+        Args:
+            url: Complete URL to filing document
+
+        Returns:
+            Optional[str]: Uncleaned <body> text without FULL_TEXT_SKIP_TAGS
+            content, or None if the download fails or the body is empty
 
         Notes:
-            - Tables removed (usually financial data, already in GuruFocus)
-            - Scripts and styles removed
-            - HTML entities unescaped (&amp; → &, &nbsp; → space)
-            - Excessive whitespace normalized
-            - Paragraph breaks preserved
+            - Rate limiting applied before request
+            - Uses longer timeout (90s) for large filings
+            - Bytes decoded as UTF-8 (SEC filings are ASCII/UTF-8)
         """
+        self._enforce_rate_limit()
+
         try:
-            soup = BeautifulSoup(html_content, 'lxml')
+            logger.info("Downloading filing (streaming): %s", url)
+
+            with self.session.get(url, timeout=self.TIMEOUT_LONG, stream=True) as response:
+                response.raise_for_status()
 
-            # Remove unwanted elements
-            for tag in soup(['script', 'style', 'table', 'nav', 'header', 'footer']):
-                tag.decompose()
+                parser = self._new_text_parser()
+                size = 0
+                for chunk in response.iter_content(chunk_size=self.DOWNLOAD_CHUNK_SIZE):
+                    size += len(chunk)
+                    parser.feed(chunk)
 
-            # Extract text
-            text = soup.get_text()
+            text = parser.close()
+            logger.info("Filing downloaded successfully: %d bytes", size)
+            return text
 
-            # Clean text
-            cleaned_text = self._clean_text(text)
+        except requests.exceptions.RequestException as e:
+            logger.error("Error downloading filing: %s", e)
+            return None
 
-            logger.debug(f"Extracted text: {len(cleaned_text)} characters")
-            return cleaned_text
+        except etree.LxmlError as e:
+            logger.error("Error parsing filing: %s", e)
+            return None
 
-        except Exception as e:
-            logger.error(f"Error extracting text from HTML: {e}")
-            return f"Error extracting text: {str(e)}"
+    # =========================================================================
+    # TEXT EXTRACTION
+    # =========================================================================
+
+    def _parse_html(self, html_content: str) -> lxml.html.HtmlElement:
+        """
+        Parse filing HTML into an lxml document.
+
+        Args:
+            html_content: Raw HTML from SEC filing (non-empty)
+
+        Returns:
+            lxml.html.HtmlElement: Document root (<html>)
+        """
+        return lxml.html.document_fromstring(
+            html_content.encode('utf-8'), parser=_HTML_PARSER
+        )
+
+    def _new_text_parser(self) -> etree.HTMLParser:
+        """
+        Create a tree-less HTML parser that collects filing text.
+
+        The single HTML-to-text path for full-text extraction: tables (usually
+        financial data, already in GuruFocus), scripts, styles and page
+        chrome (FULL_TEXT_SKIP_TAGS) are dropped and only <body> text is kept.
+        Entities are decoded by the parser; whitespace is left for _clean_text.
+
+        Returns:
+            etree.HTMLParser: Feed it UTF-8 bytes; close() returns the
+            uncleaned text (see _FilingTextTarget)
+        """
+        return etree.HTMLParser(
+            encoding='utf-8',
+            target=_FilingTextTarget(frozenset(self.FULL_TEXT_SKIP_TAGS))
+        )
 
     def _extract_section(self, html_content: str, section_name: str) -> str:
         """
@@ -858,7 +1297,7 @@ class SECFilingTool(Tool):
         - Item 8: Financial Statements
 
         Process:
-            1. Extract full text from HTML
+            1. Extract full text from HTML (lxml text_content)
             2. Find section header using regex pattern
             3. Extract text from section start to next section
             4. Clean and return text
@@ -878,21 +1317,17 @@ class SECFilingTool(Tool):
         """
         try:
             # Get full text first
-            soup = BeautifulSoup(html_content, 'lxml')
-            for tag in soup(['script', 'style', 'table']):
-                tag.decompose()
-
-            text = soup.get_text()
+            text = self._get_section_source_text(html_content)
 
             # Get pattern for requested section
-            pattern = self.SECTION_PATTERNS.get(section_name)
-            if not pattern:
-                logger.warning(f"No pattern defined for section: {section_name}")
+            pattern = self._SECTION_RES.get(section_name)
+            if pattern is None:
+                logger.warning("No pattern defined for section: %s", section_name)
                 return self._clean_text(text)
 
-            # Find section header
-            match = re.search(pattern, text, re.IGNORECASE)
-            if not match:
+            # Find section header (literal fast path, regex for variants)
+            start_pos = self._find_section_start(text, section_name)
+            if start_pos == -1:
                 msg = (
                     f"Section '{section_name}' not found in filing. "
                     f"Filing may use non-standard formatting. Try section='full'."
@@ -900,35 +1335,134 @@ class SECFilingTool(Tool):
                 logger.warning(msg)
                 return msg
 
-            start_pos = match.start()
-
-            # Find next section (Item X.) to determine end
-            # Look for pattern starting after current section header
-            next_section_match = re.search(
-                r'Item\s+\d+[A-Z]?[\.\s\-]',
-                text[start_pos + 50:],  # Skip ahead to avoid matching current item
-                re.IGNORECASE
-            )
-
-            if next_section_match:
-                end_pos = start_pos + 50 + next_section_match.start()
-            else:
-                # No next section found, take rest of document
-                end_pos = len(text)
-
-            # Extract section text
-            section_text = text[start_pos:end_pos]
+            # Extract section text (up to the next "Item X." header)
+            section_text = text[start_pos:self._find_section_end(text, start_pos)]
 
             # Clean and return
             cleaned_section = self._clean_text(section_text)
-            logger.info(f"Extracted section '{section_name}': {len(cleaned_section)} characters")
+            logger.info("Extracted section '%s': %d characters", section_name, len(cleaned_section))
 
             return cleaned_section
 
         except Exception as e:
-            logger.error(f"Error extracting section '{section_name}': {e}")
+            logger.error("Error extracting section '%s': %s", section_name, e)
             return f"Error extracting section: {str(e)}"
 
+    def _get_section_source_text(self, html_content: str) -> str:
+        """
+        Flatten filing HTML to the raw text that section headers are found in.
+
+        Scripts, styles and tables are dropped with a C-level strip and the
+        text is read with text_content(); no Python-level tree is built.
+        Results are cached (LRU, TEXT_CACHE_SIZE) so extracting several
+        sections of the same filing only parses it once.
+
+        Args:
+            html_content: Raw HTML from SEC filing
+
+        Returns:
+            str: Uncleaned document text ("" for empty input)
+        """
+        if not html_content:
+            return ""
+
+        key = hash(html_content)
+        with self._text_lock:
+            cached = self._text_cache.get(key)
+            if cached is not None and cached[0] == html_content:
+                self._text_cache.move_to_end(key)
+                return cached[1]
+
+        doc = self._parse_html(html_content)
+        etree.strip_elements(doc, 'script', 'style', 'table', with_tail=False)
+        text = doc.text_content()
+
+        with self._text_lock:
+            self._text_cache[key] = (html_content, text)
+            self._text_cache.move_to_end(key)
+            while len(self._text_cache) > self.TEXT_CACHE_SIZE:
+                self._text_cache.popitem(last=False)
+
+        return text
+
+    def _find_section_end(self, text: str, start_pos: int) -> int:
+        """
+        Find where a section starting at start_pos ends.
+
+        Args:
+            text: Document text
+            start_pos: Offset of the section header
+
+        Returns:
+            int: Offset of the next "Item X." header, or len(text) if none
+        """
+        # Skip ahead to avoid matching the current item's own header (pos=
+        # rather than slicing, so the remainder of the document isn't copied)
+        next_section_match = self._NEXT_ITEM_RE.search(text, start_pos + 50)
+
+        if next_section_match:
+            return next_section_match.start()
+
+        # No next section found, take rest of document
+        return len(text)
+
+    def _find_section_start(self, text: str, section_name: str) -> int:
+        """
+        Locate the first header of a section, in any spelling.
+
+        The literal fast path only bounds the search: the section regex is
+        still run over the text before the literal hit, so an earlier
+        variant header (e.g. "ITEM 1 - BUSINESS") wins over a later exact
+        spelling such as a cross-reference ("see Item 1. Business").
+
+        Args:
+            text: Extracted filing text
+            section_name: Section key (e.g. "risk_factors")
+
+        Returns:
+            int: Offset of the first header match, or -1 if none matched
+        """
+        pattern = self._SECTION_RES[section_name]
+        pos = self._find_section_literal(text, section_name)
+        if pos == -1:
+            match = pattern.search(text)
+        else:
+            # endpos covers the literal itself, which the regex also matches
+            match = pattern.search(text, 0, pos + self._literal_length(section_name))
+        return match.start() if match else -1
+
+    def _literal_length(self, section_name: str) -> int:
+        """
+        Length of the longest literal header spelling for a section.
+
+        Args:
+            section_name: Section key (e.g. "risk_factors")
+
+        Returns:
+            int: Longest _SECTION_LITERALS entry length (0 if none)
+        """
+        return max((len(literal) for literal in self._SECTION_LITERALS.get(section_name, ())), default=0)
+
+    def _find_section_literal(self, text: str, section_name: str) -> int:
+        """
+        Locate a section header spelled exactly as in _SECTION_LITERALS.
+
+        str.find is a C substring scan, far cheaper than running the
+        case-insensitive section regex across a multi-MB filing.
+
+        Args:
+            text: Extracted filing text
+            section_name: Section key (e.g. "risk_factors")
+
+        Returns:
+            int: Offset of the earliest literal hit, or -1 if none matched
+        """
+        hits = [
+            pos for pos in (text.find(literal) for literal in self._SECTION_LITERALS.get(section_name, ()))
+            if pos != -1
+        ]
+        return min(hits) if hits else -1
+
     def _clean_text(self, text: str) -> str:
         """
         Clean extracted text for readability.
@@ -954,24 +1488,22 @@ class SECFilingTool(Tool):
         if not text:
             return ""
 
-        # Remove excessive whitespace (collapse to single space)
-        text = re.sub(r'\s+', ' ', text)
-
-        # Remove standalone page numbers
-        text = re.sub(r'\n\s*\d+\s*\n', '\n', text)
+        # Remove excessive whitespace (collapse to single space). Newlines go
+        # too, so line-based cleanups (standalone page numbers, runs of blank
+        # lines) cannot match afterwards and are not run.
+        text = ' '.join(text.split())
 
         # Remove common table of contents artifacts
-        text = re.sub(r'Table\s+of\s+Contents', '', text, flags=re.IGNORECASE)
+        text, toc_removed = self._TOC_RE.subn('', text)
 
         # Add paragraph breaks at sentence boundaries followed by capital letters
-        # (helps readability, especially for long documents)
-        text = re.sub(r'\.(\s+)([A-Z])', r'.\n\n\2', text)
-
-        # Remove any remaining multiple spaces
-        text = re.sub(r' {2,}', ' ', text)
+        # (helps readability, especially for long documents). The capital is
+        # only looked at, so the replacement is a plain string, not a template.
+        text = self._SENTENCE_BREAK_RE.sub('.\n\n', text)
 
-        # Remove multiple newlines (max 2)
-        text = re.sub(r'\n{3,}', '\n\n', text)
+        # Remove multiple spaces, which only TOC removal can leave behind
+        if toc_removed:
+            text = self._MULTI_SPACE_RE.sub(' ', text)
 
         return text.strip()
 
@@ -26,11 +26,16 @@ import os
 import time
 import logging
 import re
+import threading
+from collections import OrderedDict
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
 from html import unescape
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, timedelta
-from urllib.parse import urlparse
 from dotenv import load_dotenv
+from concurrent.futures import Future, ThreadPoolExecutor
+import orjson
 import requests
 
 from src.tools.base import Tool
@@ -38,11 +43,55 @@ from src.tools.base import Tool
 # Load environment variables
 load_dotenv()
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Configure logging (handlers/level are left to the application)
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=256)
+def _company_terms(company: str) -> Tuple[str, str]:
+    """
+    Lowercased company name and its first word, for query de-duplication.
+
+    Memoized because one analysis issues many searches for the same company.
+
+    Args:
+        company: Company name as passed to execute()
+
+    Returns:
+        (full name, core name) both lowercased, e.g. ("apple inc", "apple")
+    """
+    company_lower = company.lower()
+    return company_lower, company_lower.split()[0]
+
+
+def _build_filter_params(
+    search_types: List[str],
+    freshness_map: Dict[str, str]
+) -> Dict[Tuple[str, Optional[str]], Dict[str, str]]:
+    """
+    Brave filter parameters for every (search_type, freshness) combination.
+
+    Args:
+        search_types: Valid search types
+        freshness_map: Freshness option → Brave freshness code
+
+    Returns:
+        Dict mapping (search_type, freshness or None) to the extra request params
+    """
+    table = {}
+    for search_type in search_types:
+        for freshness in [None, *freshness_map]:
+            params = {}
+            if freshness:
+                params["freshness"] = freshness_map[freshness]
+            elif search_type == "recent":
+                params["freshness"] = "pm"  # Default recent to past month
+            if search_type == "news":
+                params["result_filter"] = "news"
+            table[(search_type, freshness)] = params
+    return table
+
+
 class WebSearchTool(Tool):
     """
     Web search tool using Brave Search API for qualitative investment research.
@@ -78,6 +127,31 @@ class WebSearchTool(Tool):
     BASE_URL = "https://api.search.brave.com/res/v1/web/search"
     TIMEOUT = 30  # seconds
     MAX_RETRIES = 3  # maximum retry attempts
+    MAX_BATCH_WORKERS = 4  # concurrent searches in execute_batch()
+
+    # Identical searches (e.g. repeated across sub-agents or re-runs of the
+    # same ticker) within the TTL reuse the last API response instead of
+    # spending a call; fresher search types expire sooner
+    SEARCH_CACHE_SIZE = 256
+    SEARCH_CACHE_TTL = {  # seconds, by search_type
+        "general": 24 * 60 * 60,
+        "news": 60 * 60,
+        "recent": 15 * 60,
+    }
+
+    # Longest server-requested wait (Retry-After) worth retrying after; a
+    # 429 asking for longer is a quota problem, not a per-second limit
+    MAX_RETRY_AFTER = 10  # seconds
+
+    # Token bucket shared by every instance (one Brave subscription per
+    # process), so parallel tool calls are smoothed to the plan's QPS instead
+    # of bursting into 429s. Holds at most one second's worth of requests.
+    # Overridden from WEB_SEARCH_QPS when a tool is created (see __init__).
+    DEFAULT_RATE_LIMIT_QPS = 1.0
+    RATE_LIMIT_QPS = DEFAULT_RATE_LIMIT_QPS
+    _bucket_lock = threading.Lock()
+    _bucket_tokens = 1.0
+    _bucket_updated = 0.0  # time.monotonic() of the last refill
 
     # Valid parameters
     VALID_SEARCH_TYPES = ["general", "news", "recent"]
@@ -91,6 +165,21 @@ class WebSearchTool(Tool):
         "year": "py"    # past year
     }
 
+    # (search_type, freshness) → Brave filter params, built once at class load
+    _FILTER_PARAMS = _build_filter_params(VALID_SEARCH_TYPES, FRESHNESS_MAP)
+
+    # Text parsing pattern (compiled once, used per search result)
+    _HTML_TAG_RE = re.compile(r'<[^>]+>')
+
+    # Relative-age units ("5 days ago") in seconds; month/year approximated
+    _AGE_UNIT_SECONDS = {
+        "hour": 3600, "hours": 3600,
+        "day": 86400, "days": 86400,
+        "week": 604800, "weeks": 604800,
+        "month": 2592000, "months": 2592000,    # 30 days
+        "year": 31536000, "years": 31536000,    # 365 days
+    }
+
     def __init__(self):
         """
         Initialize Web Search Tool.
@@ -113,6 +202,18 @@ class WebSearchTool(Tool):
             'X-Subscription-Token': self.api_key
         })
 
+        # Shared search rate; the bucket is process-wide, so this sets the class value
+        qps = os.getenv("WEB_SEARCH_QPS")
+        if qps is not None:
+            WebSearchTool.RATE_LIMIT_QPS = self._parse_qps(qps)
+
+        # LRU of sorted request params → (fetch time, raw API response)
+        self._search_cache: "OrderedDict[Tuple, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._search_cache_lock = threading.Lock()
+
+        # Requests currently being fetched, by the same key (guarded by the cache lock)
+        self._inflight: Dict[Tuple, Future] = {}
+
         logger.info("Web Search Tool initialized")
 
     @property
@@ -192,7 +293,7 @@ class WebSearchTool(Tool):
                         - source: str (domain name)
                         - extra_snippets: list (RAG-optimized snippets)
                     - total_results: int
-                    - metadata: dict (source, search_type, timestamp, latency)
+                    - metadata: dict (source, search_type, timestamp, latency, cached)
                 - error: str or None
 
         Reference:
@@ -232,7 +333,7 @@ class WebSearchTool(Tool):
         # Construct full query with company context
         full_query = self._construct_query(query, company)
 
-        logger.info(f"Executing {search_type} search: {full_query}")
+        logger.info("Executing %s search: %s", search_type, full_query)
 
         # Build API request parameters
         params = {
@@ -246,19 +347,12 @@ class WebSearchTool(Tool):
             "safesearch": "moderate"      # Content filtering
         }
 
-        # Apply freshness filter
-        if freshness:
-            params["freshness"] = self.FRESHNESS_MAP[freshness]
-        elif search_type == "recent":
-            params["freshness"] = "pm"  # Default recent to past month
+        # Apply freshness and search type filters
+        params.update(self._FILTER_PARAMS[(search_type, freshness)])
 
-        # Apply search type filters
-        if search_type == "news":
-            params["result_filter"] = "news"
-
-        # Execute search with retry logic
+        # Execute search with retry logic (or reuse a recent identical one)
         try:
-            api_data = self._execute_with_retry(params)
+            api_data, cached = self._fetch(params, self.SEARCH_CACHE_TTL[search_type])
         except Exception as e:
             return self._error(f"Search failed: {str(e)}")
 
@@ -267,11 +361,39 @@ class WebSearchTool(Tool):
 
         # Process results
         try:
-            return self._process_response(api_data, full_query, search_type, latency_ms)
+            return self._process_response(api_data, full_query, search_type, latency_ms, cached)
         except Exception as e:
-            logger.error(f"Error processing search results: {str(e)}")
+            logger.error("Error processing search results: %s", e)
             return self._error(f"Error processing results: {str(e)}")
 
+    def execute_batch(
+        self,
+        requests_list: List[Dict[str, Any]],
+        max_workers: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Run several searches concurrently (e.g. news + moat + management).
+
+        Each search is API-bound (~200-800ms), so issuing them in parallel
+        over the shared session makes the batch take about as long as the
+        slowest search instead of the sum of all of them.
+
+        Args:
+            requests_list: execute() keyword arguments per search, e.g.
+                [{"query": "Apple competitive advantages", "count": 5}]
+            max_workers: Concurrent searches (default: MAX_BATCH_WORKERS)
+
+        Returns:
+            List of execute() responses, in the same order as requests_list
+        """
+        if not requests_list:
+            return []
+
+        workers = min(max_workers or self.MAX_BATCH_WORKERS, len(requests_list))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(self.execute, **kwargs) for kwargs in requests_list]
+            return [future.result() for future in futures]
+
     # =========================================================================
     # QUERY CONSTRUCTION
     # =========================================================================
@@ -298,16 +420,14 @@ class WebSearchTool(Tool):
 
         # Add company for context if provided and not already present
         if company:
-            company_lower = company.lower()
-            query_lower = query.lower()
-
             # Check if company (or core part of company name) already in query
             # Handle cases like "Apple Inc" in query should match "Apple" company param
-            company_core = company_lower.split()[0]  # Get first word of company name
+            company_lower, company_core = _company_terms(company)
+            query_lower = query.lower()
 
             if company_lower not in query_lower and company_core not in query_lower:
                 query = f"{query} {company}"
-                logger.debug(f"Added company context: {company}")
+                logger.debug("Added company context: %s", company)
 
         return query
 
@@ -315,6 +435,60 @@ class WebSearchTool(Tool):
     # HTTP REQUEST HANDLING
     # =========================================================================
 
+    def _fetch(self, params: Dict[str, Any], ttl: float) -> Tuple[Dict[str, Any], bool]:
+        """
+        Return the API response for params, from cache when still fresh.
+
+        Only successful responses are cached (LRU, SEARCH_CACHE_SIZE entries);
+        errors propagate from _execute_with_retry. Identical requests that
+        arrive while one is already in flight wait for and share its result
+        instead of making their own (billed, rate-limited) API call.
+
+        Args:
+            params: Request parameters
+            ttl: Maximum age in seconds of a cached response to reuse
+
+        Returns:
+            Tuple of (parsed JSON response, whether it was served without a
+            new API call, i.e. from the cache or an in-flight request)
+        """
+        key = tuple(sorted(params.items()))
+
+        with self._search_cache_lock:
+            cached = self._search_cache.get(key)
+            if cached is not None and time.time() - cached[0] < ttl:
+                self._search_cache.move_to_end(key)
+                logger.debug("Search cache hit: %s", params['q'])
+                return cached[1], True
+
+            future = self._inflight.get(key)
+            is_leader = future is None
+            if is_leader:
+                future = Future()
+                self._inflight[key] = future
+
+        if not is_leader:
+            logger.debug("Joining in-flight search: %s", params['q'])
+            return future.result(), True
+
+        try:
+            api_data = self._execute_with_retry(params)
+        except BaseException as e:
+            future.set_exception(e)
+            with self._search_cache_lock:
+                self._inflight.pop(key, None)
+            raise
+
+        with self._search_cache_lock:
+            self._search_cache[key] = (time.time(), api_data)
+            self._search_cache.move_to_end(key)
+            while len(self._search_cache) > self.SEARCH_CACHE_SIZE:
+                self._search_cache.popitem(last=False)
+            self._inflight.pop(key, None)
+
+        future.set_result(api_data)
+        return api_data, False
+
     def _execute_with_retry(
         self,
         params: Dict[str, Any],
@@ -325,8 +499,9 @@ class WebSearchTool(Tool):
 
         Handles:
         - Network timeouts (retry up to 3 times)
-        - Server errors (500/502/503, retry)
-        - Rate limit errors (429, don't retry - it won't help)
+        - Server errors (500/502/503, retry; honours Retry-After)
+        - Rate limit errors (429, retry only if Retry-After asks for a short
+          wait, i.e. a per-second limit - retrying a quota error won't help)
         - Auth errors (401, don't retry)
 
         Args:
@@ -344,15 +519,17 @@ class WebSearchTool(Tool):
         """
         for attempt in range(max_retries):
             try:
+                self._acquire_rate_limit()
                 response = self.session.get(
                     self.BASE_URL,
                     params=params,
                     timeout=self.TIMEOUT
                 )
+                self._observe_rate_limit(response)
 
                 # Handle HTTP status codes
                 if response.status_code == 200:
-                    return response.json()
+                    return orjson.loads(response.content)
 
                 elif response.status_code == 401:
                     raise ValueError(
@@ -361,6 +538,20 @@ class WebSearchTool(Tool):
                     )
 
                 elif response.status_code == 429:
+                    # Short Retry-After: per-second limit, worth one more try
+                    retry_after = self._retry_after(response)
+                    if (
+                        retry_after is not None
+                        and retry_after <= self.MAX_RETRY_AFTER
+                        and attempt < max_retries - 1
+                    ):
+                        logger.warning(
+                            "Rate limited (429). Retry %d/%d in %.1fs",
+                            attempt + 1, max_retries, retry_after
+                        )
+                        time.sleep(retry_after)
+                        continue
+
                     # Rate limit exceeded - don't retry
                     raise Exception(
                         "Rate limit exceeded. Check your Brave Search API plan. "
@@ -370,10 +561,14 @@ class WebSearchTool(Tool):
                 elif response.status_code >= 500:
                     # Server error - retry with exponential backoff
                     if attempt < max_retries - 1:
-                        wait_time = 2 ** attempt  # 1s, 2s, 4s
+                        retry_after = self._retry_after(response)
+                        if retry_after is None:
+                            wait_time = 2 ** attempt  # 1s, 2s, 4s
+                        else:
+                            wait_time = min(retry_after, self.MAX_RETRY_AFTER)
                         logger.warning(
-                            f"Server error ({response.status_code}). "
-                            f"Retry {attempt + 1}/{max_retries} in {wait_time}s"
+                            "Server error (%d). Retry %d/%d in %ss",
+                            response.status_code, attempt + 1, max_retries, wait_time
                         )
                         time.sleep(wait_time)
                         continue
@@ -390,8 +585,8 @@ class WebSearchTool(Tool):
                 if attempt < max_retries - 1:
                     wait_time = 2 ** attempt
                     logger.warning(
-                        f"Request timeout. "
-                        f"Retry {attempt + 1}/{max_retries} in {wait_time}s"
+                        "Request timeout. Retry %d/%d in %ss",
+                        attempt + 1, max_retries, wait_time
                     )
                     time.sleep(wait_time)
                     continue
@@ -405,8 +600,8 @@ class WebSearchTool(Tool):
                 if attempt < max_retries - 1:
                     wait_time = 2 ** attempt
                     logger.warning(
-                        f"Network error: {str(e)}. "
-                        f"Retry {attempt + 1}/{max_retries} in {wait_time}s"
+                        "Network error: %s. Retry %d/%d in %ss",
+                        e, attempt + 1, max_retries, wait_time
                     )
                     time.sleep(wait_time)
                     continue
@@ -415,6 +610,113 @@ class WebSearchTool(Tool):
 
         raise Exception("Failed to fetch data after all retries")
 
+    # =========================================================================
+    # RATE LIMITING
+    # =========================================================================
+
+    @classmethod
+    def _parse_qps(cls, value: str) -> float:
+        """
+        Parse a WEB_SEARCH_QPS value.
+
+        Args:
+            value: Requests per second as configured
+
+        Returns:
+            The rate, or DEFAULT_RATE_LIMIT_QPS if value isn't a finite number > 0
+        """
+        try:
+            qps = float(value)
+        except ValueError:
+            qps = 0.0
+        if not 0 < qps < float("inf"):
+            logger.warning(
+                "Invalid WEB_SEARCH_QPS=%r (must be > 0); using %s",
+                value, cls.DEFAULT_RATE_LIMIT_QPS
+            )
+            return cls.DEFAULT_RATE_LIMIT_QPS
+        return qps
+
+    @classmethod
+    def _acquire_rate_limit(cls) -> None:
+        """
+        Take one token from the shared bucket, sleeping until it is available.
+
+        Each caller reserves its token under the lock (the balance may go
+        negative) and sleeps outside it, so concurrent callers are spaced
+        1/RATE_LIMIT_QPS apart without serializing on the lock.
+        """
+        with cls._bucket_lock:
+            now = time.monotonic()
+            rate = cls.RATE_LIMIT_QPS
+            capacity = max(1.0, rate)
+            tokens = min(capacity, cls._bucket_tokens + (now - cls._bucket_updated) * rate) - 1
+            cls._bucket_tokens = tokens
+            cls._bucket_updated = now
+
+        if tokens < 0:
+            wait_time = -tokens / rate
+            logger.debug("Rate limiting: sleeping %.2fs", wait_time)
+            time.sleep(wait_time)
+
+    @classmethod
+    def _observe_rate_limit(cls, response: requests.Response) -> None:
+        """
+        Drain the bucket when Brave reports the per-second window is used up.
+
+        Brave sends comma-separated X-RateLimit-Remaining/-Reset headers whose
+        first entry is the per-second window (later ones are monthly quotas,
+        which waiting cannot help). If it is exhausted, no token is handed out
+        until the window resets.
+
+        Args:
+            response: Any Brave Search API response
+        """
+        remaining = response.headers.get('X-RateLimit-Remaining')
+        reset = response.headers.get('X-RateLimit-Reset')
+        if not isinstance(remaining, str) or not isinstance(reset, str):
+            return
+        try:
+            if int(remaining.split(',', 1)[0]) > 0:
+                return
+            reset_in = min(float(reset.split(',', 1)[0]), cls.MAX_RETRY_AFTER)
+        except ValueError:
+            return
+
+        with cls._bucket_lock:
+            now = time.monotonic()
+            rate = cls.RATE_LIMIT_QPS
+            tokens = min(max(1.0, rate), cls._bucket_tokens + (now - cls._bucket_updated) * rate)
+            # One token becomes available when the window resets
+            cls._bucket_tokens = min(tokens, 1 - reset_in * rate)
+            cls._bucket_updated = now
+
+    def _retry_after(self, response: requests.Response) -> Optional[float]:
+        """
+        Read the wait the server asked for via the Retry-After header.
+
+        Args:
+            response: Error response (429/5xx)
+
+        Returns:
+            Seconds to wait (delta-seconds or HTTP-date form, never negative),
+            or None if the header is absent or unparseable
+        """
+        value = response.headers.get('Retry-After')
+        if not isinstance(value, str):
+            return None
+
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        return max(0.0, retry_at.timestamp() - time.time())
+
     # =========================================================================
     # RESPONSE PROCESSING
     # =========================================================================
@@ -424,7 +726,8 @@ class WebSearchTool(Tool):
         api_data: Dict[str, Any],
         query: str,
         search_type: str,
-        latency_ms: int
+        latency_ms: int,
+        cached: bool = False
     ) -> Dict[str, Any]:
         """
         Process Brave Search API response into standardized format.
@@ -437,6 +740,8 @@ class WebSearchTool(Tool):
             query: Query that was executed
             search_type: Type of search performed
             latency_ms: API response latency
+            cached: Whether api_data was served from the search cache
+                (no API call was billed)
 
         Returns:
             Dict with standardized response format
@@ -447,22 +752,25 @@ class WebSearchTool(Tool):
         # Extract web results
         web_results = api_data.get("web", {}).get("results", [])
 
-        # Process each result
-        processed_results = []
-        for result in web_results:
-            processed_result = {
-                "title": self._clean_text(result.get("title", "")),
+        # One clock read per response (shared by every result's age)
+        now = datetime.now()
+
+        # Process each result (methods bound once, outside the loop)
+        clean = self._clean_text
+        parse_date = self._parse_date
+        extract_domain = self._extract_domain
+        processed_results = [
+            {
+                "title": clean(result.get("title", "")),
                 "url": result.get("url", ""),
-                "description": self._clean_text(result.get("description", "")),
+                "description": clean(result.get("description", "")),
                 "age": result.get("age", ""),
-                "published_date": self._parse_date(result.get("age", "")),
-                "source": self._extract_domain(result.get("url", "")),
-                "extra_snippets": [
-                    self._clean_text(snippet)
-                    for snippet in result.get("extra_snippets", [])
-                ]
+                "published_date": parse_date(result.get("age", ""), now),
+                "source": extract_domain(result.get("url", "")),
+                "extra_snippets": [clean(snippet) for snippet in result.get("extra_snippets") or ()]
             }
-            processed_results.append(processed_result)
+            for result in web_results
+        ]
 
         # Build standardized response
         return {
@@ -474,8 +782,9 @@ class WebSearchTool(Tool):
                 "metadata": {
                     "source": "brave_search",
                     "search_type": search_type,
-                    "timestamp": datetime.now().isoformat(),
-                    "api_latency_ms": latency_ms
+                    "timestamp": now.isoformat(),
+                    "api_latency_ms": latency_ms,
+                    "cached": cached
                 }
             },
             "error": None
@@ -510,19 +819,17 @@ class WebSearchTool(Tool):
         text = unescape(text)  # &#39; → ', &amp; → &, &quot; → "
 
         # Remove HTML tags (shouldn't be present, but defensive)
-        text = re.sub(r'<[^>]+>', '', text)
+        if '<' in text:
+            text = self._HTML_TAG_RE.sub('', text)
 
-        # Normalize whitespace (multiple spaces → single space)
-        text = re.sub(r'\s+', ' ', text)
-
-        # Trim leading/trailing whitespace
-        return text.strip()
+        # Normalize whitespace (runs → single space, trimmed at both ends)
+        return ' '.join(text.split())
 
     # =========================================================================
     # DATE PARSING
     # =========================================================================
 
-    def _parse_date(self, age_str: str) -> Optional[str]:
+    def _parse_date(self, age_str: str, now: Optional[datetime] = None) -> Optional[str]:
         """
         Convert relative date ("X days ago") to ISO format (YYYY-MM-DD).
 
@@ -537,6 +844,8 @@ class WebSearchTool(Tool):
 
         Args:
             age_str: Relative age string from Brave Search
+            now: Reference time (default: datetime.now()); pass one in when
+                parsing a batch of results
 
         Returns:
             ISO formatted date (YYYY-MM-DD) or None if unparseable
@@ -553,30 +862,16 @@ class WebSearchTool(Tool):
             return None
 
         # Parse "X hours/days/weeks/months/years ago"
-        match = re.match(r'(\d+)\s+(hour|day|week|month|year)s?\s+ago', age_str.lower())
-
-        if not match:
+        parts = age_str.lower().split()
+        if len(parts) < 3 or not parts[2].startswith('ago') or not parts[0].isdecimal():
             return None
 
-        amount = int(match.group(1))
-        unit = match.group(2)
-
-        now = datetime.now()
-
-        # Convert to timedelta
-        delta_map = {
-            'hour': timedelta(hours=amount),
-            'day': timedelta(days=amount),
-            'week': timedelta(weeks=amount),
-            'month': timedelta(days=amount * 30),    # Approximation
-            'year': timedelta(days=amount * 365)     # Approximation
-        }
-
-        if unit in delta_map:
-            date = now - delta_map[unit]
-            return date.strftime('%Y-%m-%d')
+        seconds = self._AGE_UNIT_SECONDS.get(parts[1])
+        if seconds is None:
+            return None
 
-        return None
+        date = (now or datetime.now()) - timedelta(seconds=int(parts[0]) * seconds)
+        return date.strftime('%Y-%m-%d')
 
     # =========================================================================
     # DOMAIN EXTRACTION
@@ -600,18 +895,19 @@ class WebSearchTool(Tool):
         if not url:
             return ""
 
-        try:
-            parsed = urlparse(url)
-            domain = parsed.netloc
+        # Netloc is what follows "scheme://" up to the first / ? or #
+        # (str.partition is far cheaper than urlparse for just this)
+        _, sep, rest = url.partition('://')
+        if not sep:
+            return ""
 
-            # Remove www. prefix
-            if domain.startswith('www.'):
-                domain = domain[4:]
+        domain = rest.partition('/')[0].partition('?')[0].partition('#')[0]
 
-            return domain
+        # Remove www. prefix
+        if domain.startswith('www.'):
+            domain = domain[4:]
 
-        except Exception:
-            return ""
+        return domain
 
     # =========================================================================
     # ERROR HANDLING
@@ -627,7 +923,7 @@ class WebSearchTool(Tool):
         Returns:
             Dict with success=False and error message
         """
-        logger.error(f"Web Search Tool error: {message}")
+        logger.error("Web Search Tool error: %s", message)
         return {
             "success": False,
             "data": None,
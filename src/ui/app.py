@@ -10,18 +10,18 @@ Usage:
 import streamlit as st
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
 # Add project root to path
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
-from src.agent.buffett_agent import WarrenBuffettAgent
-from src.agent.translator import ThesisTranslator
-from src.agent.sharia_screener import ShariaScreener
-from src.storage import AnalysisStorage
-from src.ui.cost_estimator import CostEstimator
+# Agent, translator, screener, storage and cost estimator are imported on
+# first use (they pull in the LLM clients, tools, lxml and psycopg2), so the
+# page renders without paying for components this session never touches
 from src.ui.components import (
     render_header,
     render_ticker_input,
@@ -79,48 +79,274 @@ st.markdown("""
 @st.cache_resource
 def get_agent():
     """Initialize and cache the Warren Buffett AI Agent"""
+    from src.agent.buffett_agent import WarrenBuffettAgent
     return WarrenBuffettAgent()
 
 
-def main():
-    """Main application entry point"""
-
-    # Render header
-    render_header()
-
-    # Initialize translator (cache in session state)
+def get_translator():
+    """Get the session's thesis translator, creating it on first use"""
     if 'translator' not in st.session_state:
+        from src.agent.translator import ThesisTranslator
         st.session_state['translator'] = ThesisTranslator()
+    return st.session_state['translator']
 
-    translator = st.session_state['translator']
 
-    # Initialize Sharia screener (cache in session state)
+def get_sharia_screener():
+    """Get the session's Sharia screener (None if unavailable), creating it on first use"""
     if 'sharia_screener' not in st.session_state:
         try:
+            from src.agent.sharia_screener import ShariaScreener
             st.session_state['sharia_screener'] = ShariaScreener()
         except Exception as e:
             st.sidebar.warning(f"Sharia screening unavailable: {e}")
             st.session_state['sharia_screener'] = None
+    return st.session_state['sharia_screener']
+
 
-    # Initialize Analysis Storage (cache in session state)
+def get_analysis_storage():
+    """Get the session's analysis storage (None if unavailable), creating it on first use"""
     if 'analysis_storage' not in st.session_state:
         try:
+            from src.storage import AnalysisStorage
             st.session_state['analysis_storage'] = AnalysisStorage()
         except Exception as e:
             st.sidebar.warning(f"Analysis history unavailable: {e}")
             st.session_state['analysis_storage'] = None
+    return st.session_state['analysis_storage']
 
-    # Initialize Cost Estimator (cache in session state)
+
+# Shared across sessions so its token-count cache serves every user
+@st.cache_resource
+def load_cost_estimator():
+    """Initialize and cache the cost estimator"""
+    from src.ui.cost_estimator import CostEstimator
+    return CostEstimator()
+
+
+def get_cost_estimator():
+    """Get the cost estimator (None if unavailable), creating it on first use"""
     if 'cost_estimator' not in st.session_state:
         try:
-            st.session_state['cost_estimator'] = CostEstimator()
+            st.session_state['cost_estimator'] = load_cost_estimator()
         except Exception as e:
             st.sidebar.warning(f"Cost estimation unavailable: {e}")
             st.session_state['cost_estimator'] = None
+    return st.session_state['cost_estimator']
+
+
+# History writes run off the script thread (one pool shared across reruns/sessions)
+@st.cache_resource
+def get_background_executor():
+    """Create and cache the background executor"""
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix="background")
+
+
+# Deep-dive prefetches get their own pool: a batch of 10-K downloads can take
+# a while and must not hold up history saves queued behind it
+@st.cache_resource
+def get_prefetch_executor():
+    """Create and cache the deep-dive prefetch executor"""
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix="prefetch")
+
+
+def save_to_history(storage, result: dict):
+    """
+    Save an analysis to history in the background.
+
+    The result renders immediately; the outcome is reported in the sidebar
+    on a later rerun by show_history_save_status().
+
+    Args:
+        storage: AnalysisStorage instance
+        result: Analysis result to persist
+    """
+    st.session_state['history_save_future'] = get_background_executor().submit(
+        storage.save_analysis, result
+    )
+
+
+def start_deep_dive_prefetch(agent, ticker: str, years_to_analyze: int):
+    """
+    Start fetching the deep dive's 10-Ks while the user reviews a Quick Screen.
 
-    sharia_screener = st.session_state['sharia_screener']
-    storage = st.session_state['analysis_storage']
-    cost_estimator = st.session_state['cost_estimator']
+    A previous prefetch that has not started yet is cancelled, since only the
+    latest Quick Screen's ticker can be deep-dived next.
+
+    Args:
+        agent: Cached WarrenBuffettAgent
+        ticker: Stock ticker symbol
+        years_to_analyze: Years the deep dive would cover
+    """
+    previous = st.session_state.pop('deep_dive_prefetch', None)
+    if previous is not None:
+        previous[1].cancel()
+
+    future = get_prefetch_executor().submit(agent.prefetch_deep_dive, ticker, years_to_analyze)
+    st.session_state['deep_dive_prefetch'] = (ticker, future)
+
+
+def wait_for_deep_dive_prefetch(ticker: str):
+    """
+    Let a running prefetch for ticker finish, so the deep dive reuses it.
+
+    A prefetch for another ticker is dropped (cancelled if it has not started;
+    any filings it fetched just age out of the SEC tool's cache).
+
+    Args:
+        ticker: Ticker the deep dive is about to analyze
+    """
+    prefetch = st.session_state.pop('deep_dive_prefetch', None)
+    if prefetch is None:
+        return
+    if prefetch[0] != ticker:
+        prefetch[1].cancel()
+        return
+
+    future = prefetch[1]
+    if not future.done():
+        with st.spinner("Finishing 10-K prefetch..."):
+            try:
+                future.result()
+            except Exception:
+                pass  # Best effort: the deep dive fetches anything missing
+
+
+def show_history_save_status():
+    """Report the outcome of the last background history save, once it is done"""
+    future = st.session_state.get('history_save_future')
+    if future is None or not future.done():
+        return
+
+    del st.session_state['history_save_future']
+    try:
+        save_result = future.result()
+        if save_result['success']:
+            st.sidebar.success(f"Saved to history: {save_result['analysis_id']}")
+    except Exception as e:
+        st.sidebar.warning(f"Failed to save to history: {e}")
+
+
+@lru_cache(maxsize=32)
+def advanced_settings_summary(years_to_analyze: int, current_calendar_year: int) -> str:
+    """
+    Markdown summary shown under the Years to Analyze slider.
+
+    Memoized because the panel is redrawn on every rerun but only ever shows
+    a handful of slider values; the calendar year is part of the key so a
+    long-running server rolls over on January 1st.
+
+    Args:
+        years_to_analyze: Years selected for Deep Dive analysis
+        current_calendar_year: Current calendar year
+
+    Returns:
+        Markdown text for st.info
+    """
+    # Calculate fiscal years dynamically
+    most_recent_fiscal_year = current_calendar_year - 1  # Most recent complete FY with 10-K
+    oldest_fiscal_year = most_recent_fiscal_year - (years_to_analyze - 1)
+
+    # Build year range display
+    if years_to_analyze == 1:
+        year_range = f"FY {most_recent_fiscal_year}"
+    else:
+        year_range = f"FY {oldest_fiscal_year}-{most_recent_fiscal_year}"
+
+    return (
+        f"**Selected:** {years_to_analyze} year{'s' if years_to_analyze > 1 else ''}\n\n"
+        f"**Analysis includes:**\n"
+        f"- Most recent fiscal year: {most_recent_fiscal_year} (latest 10-K available)\n"
+        f"- Prior years: {years_to_analyze-1} year{'s' if years_to_analyze > 1 else ''}\n"
+        f"- Year range: {year_range}\n"
+        f"- Total: {years_to_analyze} year{'s' if years_to_analyze > 1 else ''} analyzed\n\n"
+        f"**Estimated time:** ~{2 + (years_to_analyze-1)*2}-{3 + (years_to_analyze-1)*2} minutes\n"
+        f"**Estimated cost:** ~${2.09 + (years_to_analyze-1)*0.18:.2f}\n"
+        f"💡 Use 'Check Cost' button for exact estimate"
+    )
+
+
+@st.fragment
+def render_advanced_settings() -> int:
+    """
+    Render the Analysis Configuration expander.
+
+    Runs as a fragment, so moving the slider only redraws this panel instead
+    of re-running the whole page.
+
+    Returns:
+        Number of years selected for Deep Dive analysis
+    """
+    st.divider()
+    st.markdown("### ⚙️ Advanced Settings")
+
+    with st.expander("Analysis Configuration", expanded=False):
+        years_to_analyze = st.slider(
+            "Years to Analyze (Deep Dive)",
+            min_value=5,
+            max_value=10,
+            value=5,
+            help="Number of years to include in multi-year analysis. Deep Dive requires 5-10 years for meaningful trend analysis and to assess management quality over time. More years = longer analysis time and deeper insights."
+        )
+
+        st.info(advanced_settings_summary(years_to_analyze, datetime.now().year))
+
+    return years_to_analyze
+
+
+@st.fragment
+def render_last_result():
+    """
+    Render the latest analysis stored in session state.
+
+    Runs as a fragment, so the English/Arabic toggles only redraw the result.
+    """
+    st.divider()
+    result = st.session_state['last_result']
+    last_analysis_type = st.session_state.get('last_analysis_type', 'quick')
+
+    st.markdown("## 📊 Latest Analysis")
+
+    # Show analysis type badge
+    display_analysis_type_badge(last_analysis_type)
+
+    # Display cost
+    display_cost_information(result)
+
+    if last_analysis_type == 'sharia':
+        # Sharia compliance results with translation option
+        display_sharia_screening_with_translation(result, get_translator())
+
+    else:
+        # Investment analysis results
+        # Check if this was a quick screen
+        is_quick_screen = False
+        metadata = result.get('metadata', {})
+        if 'deep_dive' in metadata and not metadata['deep_dive']:
+            is_quick_screen = True
+        elif metadata.get('years_analyzed') == 1 and 'context_management' not in metadata:
+            is_quick_screen = True
+
+        # Render basic results (without thesis)
+        render_results(result)
+
+        # If Quick Screen, show prominent recommendation
+        if is_quick_screen:
+            display_quick_screen_recommendation(result)
+
+        # Display thesis with translation option
+        display_thesis_with_translation(result, get_translator())
+
+
+def main():
+    """Main application entry point"""
+
+    # Render header
+    render_header()
+
+    # Translator, screener, storage and cost estimator are created on first
+    # use (see get_translator() etc.), not on every new session
+
+    show_history_save_status()
 
     # Sidebar info
     render_sidebar_info()
@@ -159,40 +385,7 @@ def main():
 
     # Advanced settings in sidebar
     with st.sidebar:
-        st.divider()
-        st.markdown("### ⚙️ Advanced Settings")
-
-        with st.expander("Analysis Configuration", expanded=False):
-            years_to_analyze = st.slider(
-                "Years to Analyze (Deep Dive)",
-                min_value=5,
-                max_value=10,
-                value=5,
-                help="Number of years to include in multi-year analysis. Deep Dive requires 5-10 years for meaningful trend analysis and to assess management quality over time. More years = longer analysis time and deeper insights."
-            )
-
-            # Calculate fiscal years dynamically
-            current_calendar_year = datetime.now().year
-            most_recent_fiscal_year = current_calendar_year - 1  # Most recent complete FY with 10-K
-            oldest_fiscal_year = most_recent_fiscal_year - (years_to_analyze - 1)
-
-            # Build year range display
-            if years_to_analyze == 1:
-                year_range = f"FY {most_recent_fiscal_year}"
-            else:
-                year_range = f"FY {oldest_fiscal_year}-{most_recent_fiscal_year}"
-
-            st.info(
-                f"**Selected:** {years_to_analyze} year{'s' if years_to_analyze > 1 else ''}\n\n"
-                f"**Analysis includes:**\n"
-                f"- Most recent fiscal year: {most_recent_fiscal_year} (latest 10-K available)\n"
-                f"- Prior years: {years_to_analyze-1} year{'s' if years_to_analyze > 1 else ''}\n"
-                f"- Year range: {year_range}\n"
-                f"- Total: {years_to_analyze} year{'s' if years_to_analyze > 1 else ''} analyzed\n\n"
-                f"**Estimated time:** ~{2 + (years_to_analyze-1)*2}-{3 + (years_to_analyze-1)*2} minutes\n"
-                f"**Estimated cost:** ~${2.09 + (years_to_analyze-1)*0.18:.2f}\n"
-                f"💡 Use 'Check Cost' button for exact estimate"
-            )
+        years_to_analyze = render_advanced_settings()
 
     # Main content area
     col1, col2 = st.columns([2, 1])
@@ -234,6 +427,7 @@ def main():
 
     # Handle Check Cost button click
     if check_cost_clicked:
+        cost_estimator = get_cost_estimator()
         if not ticker:
             st.error("⚠️ Please enter a stock ticker symbol")
         elif not validate_ticker(ticker):
@@ -257,6 +451,7 @@ def main():
                         agent = get_agent()
                         estimate = cost_estimator.estimate_deep_dive_cost(ticker, years_to_analyze, agent)
                     else:  # Sharia Compliance
+                        sharia_screener = get_sharia_screener()
                         if not sharia_screener:
                             st.error("⚠️ Sharia screening is not available.")
                         else:
@@ -332,6 +527,7 @@ def main():
             # Handle different analysis types
             if analysis_type == "Sharia Compliance":
                 # Sharia compliance screening
+                sharia_screener = get_sharia_screener()
                 if not sharia_screener:
                     st.error("⚠️ Sharia screening is not available. Please check API configuration.")
                 else:
@@ -358,13 +554,9 @@ def main():
                             st.session_state['session_costs'].append(cost)
 
                         # Auto-save to history
+                        storage = get_analysis_storage()
                         if storage:
-                            try:
-                                save_result = storage.save_analysis(result)
-                                if save_result['success']:
-                                    st.sidebar.success(f"Saved to history: {save_result['analysis_id']}")
-                            except Exception as e:
-                                st.sidebar.warning(f"Failed to save to history: {e}")
+                            save_to_history(storage, result)
 
                     st.rerun()
             else:
@@ -373,41 +565,7 @@ def main():
 
     # Show last result if available
     if 'last_result' in st.session_state and st.session_state['last_result'] is not None:
-        st.divider()
-        result = st.session_state['last_result']
-        last_analysis_type = st.session_state.get('last_analysis_type', 'quick')
-
-        st.markdown("## 📊 Latest Analysis")
-
-        # Show analysis type badge
-        display_analysis_type_badge(last_analysis_type)
-
-        # Display cost
-        display_cost_information(result)
-
-        if last_analysis_type == 'sharia':
-            # Sharia compliance results with translation option
-            display_sharia_screening_with_translation(result, translator)
-
-        else:
-            # Investment analysis results
-            # Check if this was a quick screen
-            is_quick_screen = False
-            metadata = result.get('metadata', {})
-            if 'deep_dive' in metadata and not metadata['deep_dive']:
-                is_quick_screen = True
-            elif metadata.get('years_analyzed') == 1 and 'context_management' not in metadata:
-                is_quick_screen = True
-
-            # Render basic results (without thesis)
-            render_results(result)
-
-            # If Quick Screen, show prominent recommendation
-            if is_quick_screen:
-                display_quick_screen_recommendation(result)
-
-            # Display thesis with translation option
-            display_thesis_with_translation(result, translator)
+        render_last_result()
 
     # Handle deep dive trigger from quick screen
     if st.session_state.get('run_deep_dive', False):
@@ -467,6 +625,10 @@ def run_analysis(ticker: str, deep_dive: bool, years_to_analyze: int = 3):
             with st.spinner("Initializing Warren Buffett AI Agent..."):
                 agent = get_agent()
 
+        # Reuse filings prefetched after this ticker's Quick Screen
+        if deep_dive:
+            wait_for_deep_dive_prefetch(ticker)
+
         # Start analysis
         start_time = time.time()
 
@@ -474,10 +636,16 @@ def run_analysis(ticker: str, deep_dive: bool, years_to_analyze: int = 3):
         progress_bar = None
         status_text = None
 
+        # Thesis preview: one placeholder per paragraph, plus how much of the
+        # streamed text is already rendered as finished paragraphs
+        preview = None
+        preview_tail = None
+        preview_done = ""
+
         # Define progress callback to update UI in real-time
         def update_progress(progress_info: dict):
             """Update Streamlit UI with current progress."""
-            nonlocal progress_bar, status_text
+            nonlocal progress_bar, status_text, preview, preview_tail, preview_done
 
             stage = progress_info.get("stage", "")
             progress = progress_info.get("progress", 0.0)
@@ -493,6 +661,25 @@ def run_analysis(ticker: str, deep_dive: bool, years_to_analyze: int = 3):
             progress_bar.progress(progress)
             status_text.info(f"{message}\n\nProgress: {progress*100:.0f}%")
 
+            # Live preview of the thesis while the synthesis streams in. Each
+            # finished paragraph is sent once; only the one still being written
+            # is re-rendered, so updates don't grow with the thesis
+            partial_text = progress_info.get("partial_text")
+            if partial_text:
+                if preview is None or not partial_text.startswith(preview_done):
+                    # First update, or a new turn restarted the text
+                    preview = status_container.container()
+                    preview_tail = preview.empty()
+                    preview_done = ""
+
+                end = partial_text.rfind("\n\n", len(preview_done))
+                if end > len(preview_done):
+                    preview_tail.markdown(partial_text[len(preview_done):end])
+                    preview_tail = preview.empty()
+                    preview_done = partial_text[:end + 2]
+
+                preview_tail.markdown(partial_text[len(preview_done):])
+
         with progress_container:
             # Show initial status
             if deep_dive:
@@ -547,14 +734,14 @@ def run_analysis(ticker: str, deep_dive: bool, years_to_analyze: int = 3):
         result['metadata']['analysis_type'] = 'deep_dive' if deep_dive else 'quick'
 
         # Auto-save to history
-        storage = st.session_state.get('analysis_storage')
+        storage = get_analysis_storage()
         if storage:
-            try:
-                save_result = storage.save_analysis(result)
-                if save_result['success']:
-                    st.sidebar.success(f"Saved to history: {save_result['analysis_id']}")
-            except Exception as e:
-                st.sidebar.warning(f"Failed to save to history: {e}")
+            save_to_history(storage, result)
+
+        # Quick Screen says investigate: fetch the deep dive's 10-Ks while the
+        # user reads the result (same check as display_quick_screen_recommendation)
+        if not deep_dive and '🟢 INVESTIGATE' in result.get('thesis', ''):
+            start_deep_dive_prefetch(agent, ticker, years_to_analyze)
 
     except Exception as e:
         # Clear progress indicators
@@ -573,6 +573,10 @@ def display_sharia_screening_with_translation(result: Dict[str, Any], translator
     with col2:
         button_label = "🌍 عربي" if not st.session_state['show_sharia_arabic'] else "🇺🇸 English"
         if st.button(button_label, key="sharia_translation_button"):
+            # Toggling a cached translation only redraws this result section;
+            # a new one also changes the sidebar's session costs
+            rerun_scope = "fragment"
+
             if not st.session_state['show_sharia_arabic']:
                 # Check if translation is cached for this ticker
                 if ticker not in st.session_state['sharia_translation_cache']:
@@ -591,6 +595,7 @@ def display_sharia_screening_with_translation(result: Dict[str, Any], translator
                         if 'session_translation_costs' not in st.session_state:
                             st.session_state['session_translation_costs'] = []
                         st.session_state['session_translation_costs'].append(translation_result['cost'])
+                        rerun_scope = "app"
 
                 # Show Arabic
                 st.session_state['show_sharia_arabic'] = True
@@ -598,7 +603,7 @@ def display_sharia_screening_with_translation(result: Dict[str, Any], translator
                 # Toggle back to English (keep cached translation)
                 st.session_state['show_sharia_arabic'] = False
 
-            st.rerun()
+            st.rerun(scope=rerun_scope)
 
     # Display analysis (English or Arabic)
     if st.session_state['show_sharia_arabic'] and ticker in st.session_state['sharia_translation_cache']:
@@ -682,6 +687,10 @@ def display_thesis_with_translation(result: Dict[str, Any], translator):
     with col2:
         button_label = "🌍 عربي" if not st.session_state['show_arabic'] else "🇺🇸 English"
         if st.button(button_label):
+            # Toggling a cached translation only redraws this result section;
+            # a new one also changes the sidebar's session costs
+            rerun_scope = "fragment"
+
             if not st.session_state['show_arabic']:
                 # Check if translation is cached for this ticker
                 if ticker not in st.session_state['translation_cache']:
@@ -700,6 +709,7 @@ def display_thesis_with_translation(result: Dict[str, Any], translator):
                         if 'session_translation_costs' not in st.session_state:
                             st.session_state['session_translation_costs'] = []
                         st.session_state['session_translation_costs'].append(translation_result['cost'])
+                        rerun_scope = "app"
 
                 # Show Arabic
                 st.session_state['show_arabic'] = True
@@ -707,7 +717,7 @@ def display_thesis_with_translation(result: Dict[str, Any], translator):
                 # Toggle back to English (keep cached translation)
                 st.session_state['show_arabic'] = False
 
-            st.rerun()
+            st.rerun(scope=rerun_scope)
 
     # Display thesis (English or Arabic)
     if st.session_state['show_arabic'] and ticker in st.session_state['translation_cache']:
@@ -6,10 +6,15 @@ using Anthropic's token counting endpoint.
 """
 
 import os
-from typing import Dict, Any, Optional
-from anthropic import Anthropic
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
 import logging
 
+from src.llm.clients import get_anthropic_client
+from src.utils.retry import with_retries
+
 logger = logging.getLogger(__name__)
 
 
@@ -34,12 +39,51 @@ class CostEstimator:
     DEEP_DIVE_TOKENS_PER_ADDITIONAL_YEAR = 3000  # Prior year summary (2-3K each, due to summarization)
     SHARIA_SCREEN_TOOL_TOKENS = 18000  # Business section (~10-20K) + GuruFocus calls (~5-8K for multiple metrics)
 
+    # Token counts per (analysis type, ticker, years, model): the prompt is
+    # fully determined by these, so repeat "Check Cost" clicks skip the API
+    TOKEN_COUNT_CACHE_SIZE = 128
+    TOKEN_COUNT_CACHE_TTL = 60 * 60  # seconds
+
     def __init__(self):
         """Initialize cost estimator with Anthropic client."""
         api_key = os.getenv("ANTHROPIC_API_KEY")
         if not api_key:
             raise ValueError("ANTHROPIC_API_KEY not found in environment")
-        self.client = Anthropic(api_key=api_key)
+        self.client = get_anthropic_client(api_key)
+
+        # LRU of cache key → (count time, input tokens)
+        self._token_count_cache: "OrderedDict[Tuple, Tuple[float, int]]" = OrderedDict()
+        self._token_count_lock = threading.Lock()
+
+    def _count_input_tokens(self, key: Tuple, **request) -> int:
+        """
+        Count prompt input tokens, reusing a recent count for the same key.
+
+        Only successful counts are cached (LRU, TOKEN_COUNT_CACHE_SIZE entries,
+        TOKEN_COUNT_CACHE_TTL seconds); API errors propagate to the caller.
+
+        Args:
+            key: Everything the prompt depends on
+            **request: messages.count_tokens() arguments
+
+        Returns:
+            int: Input tokens
+        """
+        with self._token_count_lock:
+            cached = self._token_count_cache.get(key)
+            if cached is not None and time.time() - cached[0] < self.TOKEN_COUNT_CACHE_TTL:
+                self._token_count_cache.move_to_end(key)
+                return cached[1]
+
+        input_tokens = with_retries(lambda: self.client.messages.count_tokens(**request)).input_tokens
+
+        with self._token_count_lock:
+            self._token_count_cache[key] = (time.time(), input_tokens)
+            self._token_count_cache.move_to_end(key)
+            while len(self._token_count_cache) > self.TOKEN_COUNT_CACHE_SIZE:
+                self._token_count_cache.popitem(last=False)
+
+        return input_tokens
 
     def estimate_quick_screen_cost(
         self,
@@ -71,7 +115,8 @@ This is a Quick Screen analysis (1 year of data). Provide a focused analysis wit
 Focus on quality over quantity. Be concise but thorough."""
 
             # Count tokens
-            response = self.client.messages.count_tokens(
+            input_tokens = self._count_input_tokens(
+                ("quick_screen", ticker, 1, agent.MODEL),
                 model=agent.MODEL,
                 system=system_prompt,
                 messages=[{"role": "user", "content": initial_message}],
@@ -82,8 +127,6 @@ Focus on quality over quantity. Be concise but thorough."""
                 }
             )
 
-            input_tokens = response.input_tokens
-
             # Add empirical estimate for tool responses (SEC business section + GuruFocus data)
             estimated_total_input_tokens = input_tokens + self.QUICK_SCREEN_TOOL_TOKENS
             estimated_output_tokens = self.QUICK_SCREEN_OUTPUT_TOKENS
@@ -158,7 +201,8 @@ Analyze fiscal years and provide a complete Warren Buffett-style investment thes
 Use all available tools to gather data."""
 
             # Count tokens
-            response = self.client.messages.count_tokens(
+            input_tokens = self._count_input_tokens(
+                ("deep_dive", ticker, years_to_analyze, agent.MODEL),
                 model=agent.MODEL,
                 system=system_prompt,
                 messages=[{"role": "user", "content": initial_message}],
@@ -169,8 +213,6 @@ Use all available tools to gather data."""
                 }
             )
 
-            input_tokens = response.input_tokens
-
             # Add empirical estimate for tool responses
             # Context management: current year full 10-K + prior year summaries (2-3K each)
             tool_tokens = self.DEEP_DIVE_BASE_TOKENS + (years_to_analyze - 1) * self.DEEP_DIVE_TOKENS_PER_ADDITIONAL_YEAR
@@ -231,7 +273,8 @@ Use all available tools to gather data."""
             prompt = screener._build_sharia_screening_prompt(ticker)
 
             # Count tokens
-            response = self.client.messages.count_tokens(
+            input_tokens = self._count_input_tokens(
+                ("sharia_compliance", ticker, 1, screener.MODEL),
                 model=screener.MODEL,
                 messages=[{"role": "user", "content": prompt}],
                 tools=screener._get_tool_definitions(),
@@ -241,8 +284,6 @@ Use all available tools to gather data."""
                 }
             )
 
-            input_tokens = response.input_tokens
-
             # Add empirical estimate for tool responses (full 10-K + GuruFocus calls)
             estimated_total_input_tokens = input_tokens + self.SHARIA_SCREEN_TOOL_TOKENS
             estimated_output_tokens = self.SHARIA_SCREEN_OUTPUT_TOKENS
@@ -0,0 +1,114 @@
+"""
+Retry Utilities
+
+Module: src.utils.retry
+Purpose: Exponential backoff with jitter for transient Anthropic API errors
+
+A deep dive makes dozens of Claude calls over several minutes (more when
+prior years run concurrently), so a single 429 or overloaded response
+should cost a short wait, not the whole analysis.
+"""
+
+import logging
+import random
+import time
+from typing import Callable, TypeVar
+
+import anthropic
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# HTTP statuses worth retrying: rate limited, server errors, overloaded
+RETRYABLE_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504, 529})
+
+# Error types Anthropic reports inside an already-open (HTTP 200) stream
+RETRYABLE_ERROR_TYPES = frozenset({"overloaded_error", "rate_limit_error", "api_error"})
+
+MAX_RETRIES = 5
+BACKOFF_BASE = 1.0  # seconds
+BACKOFF_CAP = 30.0  # seconds
+
+
+def is_retryable(error: BaseException) -> bool:
+    """
+    Whether an exception is a transient API failure worth retrying.
+
+    Args:
+        error: Exception raised by an Anthropic API call
+
+    Returns:
+        True for connection errors/timeouts, retryable HTTP statuses and
+        overloaded/rate-limit errors reported mid-stream
+    """
+    if isinstance(error, anthropic.APIConnectionError):  # includes APITimeoutError
+        return True
+    if isinstance(error, anthropic.APIStatusError):
+        if error.status_code in RETRYABLE_STATUS_CODES:
+            return True
+        body = error.body if isinstance(error.body, dict) else {}
+        details = body.get("error") if isinstance(body.get("error"), dict) else body
+        return details.get("type") in RETRYABLE_ERROR_TYPES
+    return False
+
+
+def backoff_delay(attempt: int, base: float = BACKOFF_BASE, cap: float = BACKOFF_CAP) -> float:
+    """
+    Full-jitter exponential backoff delay.
+
+    Args:
+        attempt: Zero-based retry attempt
+        base: Delay ceiling for the first retry, in seconds
+        cap: Maximum delay ceiling, in seconds
+
+    Returns:
+        Seconds to wait, uniform in [0, min(cap, base * 2**attempt)]
+    """
+    return random.uniform(0, min(cap, base * 2 ** attempt))
+
+
+def with_retries(
+    fn: Callable[[], T],
+    retries: int = MAX_RETRIES,
+    base: float = BACKOFF_BASE,
+    cap: float = BACKOFF_CAP
+) -> T:
+    """
+    Call fn, retrying transient API errors with exponential backoff and jitter.
+
+    Args:
+        fn: Zero-argument callable making the API call
+        retries: Maximum number of retries after the first attempt
+        base: Delay ceiling for the first retry, in seconds
+        cap: Maximum delay ceiling, in seconds
+
+    Returns:
+        fn's return value
+
+    Raises:
+        The last exception if it is not retryable or retries are exhausted
+    """
+    attempt = 0
+    while True:
+        try:
+            return fn()
+        except Exception as e:
+            if attempt >= retries or not is_retryable(e):
+                raise
+            delay = backoff_delay(attempt, base, cap)
+            logger.warning(
+                f"Transient API error ({e.__class__.__name__}), "
+                f"retry {attempt + 1}/{retries} in {delay:.1f}s"
+            )
+            time.sleep(delay)
+            attempt += 1
+
+
+__all__ = [
+    "RETRYABLE_STATUS_CODES",
+    "RETRYABLE_ERROR_TYPES",
+    "is_retryable",
+    "backoff_delay",
+    "with_retries"
+]
@@ -40,6 +40,19 @@ class TestAgentInitialization:
                 agent = WarrenBuffettAgent()
                 assert agent.api_key == "env_key"
 
+    def test_deep_dive_concurrency_from_env(self):
+        """Test DEEP_DIVE_CONCURRENCY is read at init; bad values fall back or clamp."""
+        with patch.dict(os.environ, {'DEEP_DIVE_CONCURRENCY': '5'}):
+            with patch('anthropic.Anthropic'):
+                agent = WarrenBuffettAgent(api_key="test_key")
+                assert agent.DEEP_DIVE_CONCURRENCY == 5
+
+        default = WarrenBuffettAgent.DEFAULT_DEEP_DIVE_CONCURRENCY
+        assert WarrenBuffettAgent._parse_concurrency("abc") == default
+        assert WarrenBuffettAgent._parse_concurrency("2.5") == default
+        assert WarrenBuffettAgent._parse_concurrency("0") == 1
+        assert WarrenBuffettAgent._parse_concurrency("-3") == 1
+
     def test_init_without_api_key_fails(self):
         """Test agent initialization fails without API key."""
         with patch.dict(os.environ, {}, clear=True):
@@ -85,6 +98,9 @@ class TestAgentInitialization:
             assert "web_search_tool" in tool_names
             assert "calculator_tool" in tool_names
 
+            # Built once and reused on every turn
+            assert agent._get_tool_definitions() is tool_defs
+
 
 class TestDecisionParsing:
     """Test decision parsing from agent output."""
@@ -272,6 +288,56 @@ class TestToolExecution:
             assert result["success"] is False
             assert "exception" in result["error"].lower()
 
+    def test_execute_tool_uses_runs_in_parallel_and_keeps_order(self):
+        """Test independent tool calls in one turn overlap and keep their order."""
+        import threading
+        from types import SimpleNamespace
+
+        with patch('anthropic.Anthropic'):
+            agent = WarrenBuffettAgent(api_key="test_key")
+
+            # Both calls must be in flight at once to get past the barrier
+            barrier = threading.Barrier(2, timeout=5)
+
+            def make_execute(value):
+                def execute(**kwargs):
+                    barrier.wait()
+                    return {"success": True, "data": value, "error": None}
+                return execute
+
+            agent.tools["gurufocus"].execute = make_execute("guru")
+            agent.tools["web_search"].execute = make_execute("web")
+
+            tool_uses = [
+                SimpleNamespace(id="t1", name="web_search_tool", input={"query": "q"}),
+                SimpleNamespace(id="t2", name="gurufocus_tool", input={"ticker": "AAPL"}),
+            ]
+            results = agent._execute_tool_uses(tool_uses)
+
+            assert [r["data"] for r in results] == ["web", "guru"]
+
+    def test_execute_tool_uses_honours_serialize(self):
+        """Test tools flagged serialize=True are not run concurrently."""
+        from types import SimpleNamespace
+
+        with patch('anthropic.Anthropic'):
+            agent = WarrenBuffettAgent(api_key="test_key")
+
+            agent.tools["sec_filing"].serialize = True
+            agent.tools["sec_filing"].execute = Mock(return_value={
+                "success": True, "data": "sec", "error": None
+            })
+
+            tool_uses = [
+                SimpleNamespace(id="t1", name="sec_filing_tool", input={"ticker": "AAPL"}),
+                SimpleNamespace(id="t2", name="sec_filing_tool", input={"ticker": "MSFT"}),
+            ]
+            with patch('src.agent.buffett_agent.ThreadPoolExecutor') as pool:
+                results = agent._execute_tool_uses(tool_uses)
+
+            pool.assert_not_called()
+            assert [r["data"] for r in results] == ["sec", "sec"]
+
 
 class TestReActLoop:
     """Test ReAct loop mechanics (with mocked Claude API)."""
@@ -363,6 +429,64 @@ class TestReActLoop:
             assert "max iterations" in result["thesis"].lower()
 
 
+    def test_react_loop_streams_text_to_callback(self):
+        """Test streamed text deltas reach on_text, ending with the full text."""
+        from types import SimpleNamespace as NS
+
+        with patch('anthropic.Anthropic'):
+            agent = WarrenBuffettAgent(api_key="test_key")
+
+            chunks = ["DECISION: AVOID\n", "ROIC too ", "low."]
+            events = [
+                NS(type="message_start", message=NS(usage=NS(input_tokens=10))),
+                NS(type="content_block_start", index=0, content_block=NS(type="text")),
+                *[NS(type="content_block_delta", delta=NS(type="text_delta", text=c)) for c in chunks],
+                NS(type="content_block_stop", index=0),
+                NS(type="message_delta", usage=NS(output_tokens=5)),
+                NS(type="message_stop"),
+            ]
+            agent.client = Mock()
+            agent.client.messages.create.return_value = iter(events)
+
+            seen = []
+            result = agent._run_react_loop("XYZ", "Analyze XYZ", on_text=seen.append)
+
+            assert seen[0] == chunks[0]
+            assert seen[-1] == "".join(chunks)
+            assert "ROIC too low." in result["thesis"]
+
+    def test_react_loop_retries_rate_limited_turn(self):
+        """Test a 429 is retried after a backoff instead of aborting the analysis."""
+        import anthropic
+        import httpx
+        from types import SimpleNamespace as NS
+
+        with patch('anthropic.Anthropic'):
+            agent = WarrenBuffettAgent(api_key="test_key")
+
+            events = [
+                NS(type="message_start", message=NS(usage=NS(input_tokens=10))),
+                NS(type="content_block_start", index=0, content_block=NS(type="text")),
+                NS(type="content_block_delta", delta=NS(type="text_delta", text="DECISION: AVOID")),
+                NS(type="content_block_stop", index=0),
+                NS(type="message_delta", usage=NS(output_tokens=5)),
+                NS(type="message_stop"),
+            ]
+            request = httpx.Request("POST", "https://api.anthropic.com/v1/messages")
+            rate_limited = anthropic.RateLimitError(
+                "rate limited", response=httpx.Response(429, request=request), body=None
+            )
+            agent.client = Mock()
+            agent.client.messages.create.side_effect = [rate_limited, iter(events)]
+
+            with patch('src.agent.buffett_agent.time.sleep') as sleep:
+                result = agent._run_react_loop("XYZ", "Analyze XYZ")
+
+            assert sleep.call_count == 1
+            assert agent.client.messages.create.call_count == 2
+            assert result["decision"] == "AVOID"
+
+
 class TestAnalysisWorkflow:
     """Test end-to-end analysis workflow (mocked)."""
 
@@ -298,6 +298,73 @@ Some trailing text.
         assert 'debt_equity' in metrics
         assert abs(metrics['debt_equity'] - 1.55) < 0.1
 
+    def test_prior_years_run_concurrently_in_year_order(self):
+        """Test prior years overlap but summaries/missing years keep year order"""
+        import threading
+        from unittest.mock import Mock
+        from src.agent.buffett_agent import WarrenBuffettAgent
+
+        agent = WarrenBuffettAgent()
+        agent._progress_callback = None
+        latest = agent.most_recent_fiscal_year
+        missing = latest - 2
+
+        agent.tools["sec_filing"].execute = Mock(
+            side_effect=lambda **kw: {"success": kw["year"] != missing}
+        )
+
+        # Every available year must be in flight at once to pass the barrier
+        barrier = threading.Barrier(3, timeout=5)
+
+        def run_loop(ticker, prompt):
+            barrier.wait()
+            year = next(y for y in range(latest - 1, latest - 5, -1) if f"analyze {ticker}'s {y}" in prompt)
+            return {"thesis": f"=== {year} ANNUAL REPORT SUMMARY ===\nRevenue: $1.0B\n=== END {year} SUMMARY ==="}
+
+        agent._run_analysis_loop = run_loop
+
+        summaries, missing_years = agent._analyze_prior_years("AAPL", num_years=4, years_to_analyze=5)
+
+        assert [s['year'] for s in summaries] == [latest - 1, latest - 3, latest - 4]
+        assert missing_years == [missing]
+
+    def test_prior_year_failure_waits_for_running_years(self):
+        """Test a failing year propagates only after the other running years finish"""
+        import threading
+        import time
+        from unittest.mock import Mock
+        from src.agent.buffett_agent import WarrenBuffettAgent
+
+        agent = WarrenBuffettAgent()
+        agent._progress_callback = None
+        agent.DEEP_DIVE_CONCURRENCY = 2
+        latest = agent.most_recent_fiscal_year
+        agent.tools["sec_filing"].execute = Mock(return_value={"success": True})
+
+        started, finished = [], []
+        lock = threading.Lock()
+
+        def run_loop(ticker, prompt):
+            year = next(y for y in range(latest - 1, latest - 5, -1) if f"analyze {ticker}'s {y}" in prompt)
+            with lock:
+                started.append(year)
+            if year == latest - 1:
+                raise RuntimeError("API down")
+            time.sleep(0.2)
+            with lock:
+                finished.append(year)
+            return {"thesis": f"=== {year} ANNUAL REPORT SUMMARY ===\n=== END {year} SUMMARY ==="}
+
+        agent._run_analysis_loop = run_loop
+
+        with pytest.raises(RuntimeError, match="API down"):
+            agent._analyze_prior_years("AAPL", num_years=4, years_to_analyze=5)
+
+        # Nothing is left running, and not every queued year was started
+        assert sorted(finished) == sorted(y for y in started if y != latest - 1)
+        assert latest - 2 in finished
+        assert len(started) < 4
+
 
 # Mark expensive tests to run selectively
 pytestmark = pytest.mark.integration
@@ -19,7 +19,9 @@ Test Coverage:
 import os
 import pytest
 import time
+import orjson
 from unittest.mock import Mock, patch, MagicMock
+from datetime import datetime
 from src.tools.gurufocus_tool import GuruFocusTool
 
 
@@ -231,6 +233,11 @@ def test_invalid_ticker_format(tool):
     result = tool.execute(ticker="ABC123", endpoint="summary")
     assert result["success"] is False
 
+    # Non-ASCII letters (str.isalpha() would accept these)
+    result = tool.execute(ticker="ÉTÉ", endpoint="summary")
+    assert result["success"] is False
+    assert "Invalid ticker format" in result["error"]
+
 
 def test_missing_endpoint(tool):
     """Test error handling for missing endpoint"""
@@ -269,7 +276,7 @@ def test_summary_endpoint_success(mock_get, tool, mock_summary_response):
     # Mock HTTP response
     mock_response = Mock()
     mock_response.status_code = 200
-    mock_response.json.return_value = mock_summary_response
+    mock_response.content = orjson.dumps(mock_summary_response)
     mock_get.return_value = mock_response
 
     result = tool.execute(ticker="AAPL", endpoint="summary")
@@ -306,7 +313,7 @@ def test_financials_endpoint_success(mock_get, tool, mock_financials_response):
     """Test successful financials endpoint call (mocked)"""
     mock_response = Mock()
     mock_response.status_code = 200
-    mock_response.json.return_value = mock_financials_response
+    mock_response.content = orjson.dumps(mock_financials_response)
     mock_get.return_value = mock_response
 
     result = tool.execute(ticker="AAPL", endpoint="financials", period="annual")
@@ -339,7 +346,7 @@ def test_keyratios_endpoint_success(mock_get, tool, mock_keyratios_response):
     """Test successful keyratios endpoint call (mocked) - MOST IMPORTANT"""
     mock_response = Mock()
     mock_response.status_code = 200
-    mock_response.json.return_value = mock_keyratios_response
+    mock_response.content = orjson.dumps(mock_keyratios_response)
     mock_get.return_value = mock_response
 
     result = tool.execute(ticker="AAPL", endpoint="keyratios")
@@ -382,7 +389,7 @@ def test_valuation_endpoint_success(mock_get, tool, mock_valuation_response):
     """Test successful valuation endpoint call (mocked)"""
     mock_response = Mock()
     mock_response.status_code = 200
-    mock_response.json.return_value = mock_valuation_response
+    mock_response.content = orjson.dumps(mock_valuation_response)
     mock_get.return_value = mock_response
 
     result = tool.execute(ticker="AAPL", endpoint="valuation")
@@ -422,7 +429,7 @@ def test_special_value_detection_9999(mock_get, tool):
 
     mock_response = Mock()
     mock_response.status_code = 200
-    mock_response.json.return_value = mock_response_data
+    mock_response.content = orjson.dumps(mock_response_data)
     mock_get.return_value = mock_response
 
     result = tool.execute(ticker="TEST", endpoint="summary")
@@ -453,7 +460,7 @@ def test_special_value_detection_10000(mock_get, tool):
 
     mock_response = Mock()
     mock_response.status_code = 200
-    mock_response.json.return_value = mock_response_data
+    mock_response.content = orjson.dumps(mock_response_data)
     mock_get.return_value = mock_response
 
     result = tool.execute(ticker="TEST", endpoint="summary")
@@ -473,6 +480,39 @@ def test_special_value_detection_10000(mock_get, tool):
     assert any("No debt" in sv["meaning"] for sv in debt_fields)
 
 
+@patch('requests.Session.get')
+def test_special_value_detection_scoped_to_requested_period(mock_get, tool):
+    """Test financials special values are only reported for the returned period"""
+    mock_response_data = {
+        "financials": {
+            "annual": {
+                "Fiscal Year": ["2023", "2022"],
+                "Total Debt": [5000, 4000],
+                "per_share_data": {"Debt per Share": 10000}
+            },
+            "quarterly": {
+                "Fiscal Quarter": ["2023-12", "2023-09"],
+                "per_share_data": {"Revenue per Share": 9999}
+            }
+        }
+    }
+
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.content = orjson.dumps(mock_response_data)
+    mock_get.return_value = mock_response
+
+    result = tool.execute(ticker="TEST", endpoint="financials", period="annual")
+
+    assert result["success"] is True
+    special_values = result["data"]["special_values_detected"]
+    assert special_values == [{
+        "field": "financials.annual.per_share_data.Debt per Share",
+        "value": 10000,
+        "meaning": "No debt"
+    }]
+
+
 @patch('requests.Session.get')
 def test_zero_value_not_flagged_as_special(mock_get, tool):
     """Test that 0 values are NOT flagged as special (valid at-loss value)"""
@@ -486,7 +526,7 @@ def test_zero_value_not_flagged_as_special(mock_get, tool):
 
     mock_response = Mock()
     mock_response.status_code = 200
-    mock_response.json.return_value = mock_response_data
+    mock_response.content = orjson.dumps(mock_response_data)
     mock_get.return_value = mock_response
 
     result = tool.execute(ticker="TEST", endpoint="summary")
@@ -508,7 +548,7 @@ def test_rate_limiting_enforced(mock_get, tool):
     """Test that rate limiting enforces 1.5s minimum between requests"""
     mock_response = Mock()
     mock_response.status_code = 200
-    mock_response.json.return_value = {"general": {"name": "Test"}}
+    mock_response.content = orjson.dumps({"general": {"name": "Test"}})
     mock_get.return_value = mock_response
 
     # Make first request
@@ -523,6 +563,51 @@ def test_rate_limiting_enforced(mock_get, tool):
     assert elapsed >= 1.5, f"Rate limiting not enforced: elapsed={elapsed:.2f}s"
 
 
+def test_rate_limit_state_persisted_across_instances(mock_api_key, monkeypatch, tmp_path):
+    """Test GURUFOCUS_BUCKET_PERSIST restores the last request time in a new process"""
+    state_path = tmp_path / "gurufocus_bucket.json"
+    monkeypatch.setenv("GURUFOCUS_BUCKET_PERSIST", "1")
+    monkeypatch.setattr(GuruFocusTool, "BUCKET_STATE_PATH", str(state_path))
+
+    first = GuruFocusTool()
+    first._enforce_rate_limit()
+    assert state_path.exists()
+
+    # Fresh instance (as after a restart) picks up the saved timestamp
+    second = GuruFocusTool()
+    assert second.last_request_time == pytest.approx(first.last_request_time)
+
+
+@patch('requests.Session.get')
+def test_timestamp_is_this_requests_send_time(mock_get, tool, mock_summary_response):
+    """Test metadata timestamp isn't taken from another request's rate-limit slot"""
+    def get(*args, **kwargs):
+        # A concurrent fetch_all endpoint reserves the next slot meanwhile
+        tool.last_request_time = time.time() + 3600
+        response = Mock()
+        response.status_code = 200
+        response.content = orjson.dumps(mock_summary_response)
+        return response
+
+    mock_get.side_effect = get
+    before = time.time()
+
+    result = tool.execute(ticker="AAPL", endpoint="summary")
+
+    timestamp = datetime.fromisoformat(result["data"]["metadata"]["timestamp"]).timestamp()
+    assert before - 1 <= timestamp <= time.time()
+
+
+def test_rate_limit_state_not_persisted_by_default(tool, monkeypatch, tmp_path):
+    """Test rate-limit state stays in memory unless persistence is enabled"""
+    state_path = tmp_path / "gurufocus_bucket.json"
+    monkeypatch.setattr(GuruFocusTool, "BUCKET_STATE_PATH", str(state_path))
+
+    tool._enforce_rate_limit()
+
+    assert not state_path.exists()
+
+
 # ==============================================================================
 # ERROR HANDLING TESTS
 # ==============================================================================
@@ -553,6 +638,24 @@ def test_rate_limit_exceeded_429(mock_get, tool):
 
     assert result["success"] is False
     assert "Rate limit exceeded" in result["error"]
+    assert result["code"] == "agent.rate_limited"
+    assert result["retry_after"] is None  # No Retry-After header on the mock
+
+
+@patch('time.sleep')
+@patch('requests.Session.get')
+def test_rate_limit_exceeded_reports_retry_after(mock_get, mock_sleep, tool):
+    """Test the 429 error envelope carries the server's Retry-After hint"""
+    mock_response = Mock()
+    mock_response.status_code = 429
+    mock_response.headers = {"Retry-After": "12.5"}
+    mock_get.return_value = mock_response
+
+    result = tool.execute(ticker="AAPL", endpoint="summary")
+
+    assert result["success"] is False
+    assert result["code"] == "agent.rate_limited"
+    assert result["retry_after"] == 12.5
 
 
 @patch('requests.Session.get')
@@ -577,7 +680,7 @@ def test_server_error_500_with_retries(mock_get, tool):
 
     mock_response_success = Mock()
     mock_response_success.status_code = 200
-    mock_response_success.json.return_value = {"general": {"name": "Apple Inc"}}
+    mock_response_success.content = orjson.dumps({"general": {"name": "Apple Inc"}})
 
     mock_get.side_effect = [mock_response_fail, mock_response_fail, mock_response_success]
 
@@ -596,7 +699,7 @@ def test_timeout_with_retries(mock_get, tool):
     # First attempt times out, second succeeds
     mock_response_success = Mock()
     mock_response_success.status_code = 200
-    mock_response_success.json.return_value = {"general": {"name": "Apple Inc"}}
+    mock_response_success.content = orjson.dumps({"general": {"name": "Apple Inc"}})
 
     mock_get.side_effect = [
         requests.exceptions.Timeout("Request timeout"),
@@ -624,6 +727,36 @@ def test_timeout_all_retries_exhausted(mock_get, tool):
     assert "retries exhausted" in result["error"].lower()
 
 
+@patch('time.sleep')
+@patch('requests.Session.get')
+def test_malformed_json_is_retried(mock_get, mock_sleep, tool):
+    """Test a truncated JSON body is retried like a network error"""
+    mock_response_truncated = Mock()
+    mock_response_truncated.status_code = 200
+    mock_response_truncated.content = b'{"general": {"name": "Apple'
+
+    mock_response_success = Mock()
+    mock_response_success.status_code = 200
+    mock_response_success.content = orjson.dumps({"general": {"name": "Apple Inc"}})
+
+    mock_get.side_effect = [mock_response_truncated, mock_response_success]
+
+    result = tool.execute(ticker="AAPL", endpoint="summary")
+
+    assert result["success"] is True
+    assert mock_get.call_count == 2
+
+    # A body that never parses exhausts the retries instead of escaping them
+    mock_get.reset_mock(side_effect=True)
+    mock_get.return_value = mock_response_truncated
+
+    result = tool.execute(ticker="MSFT", endpoint="summary")
+
+    assert result["success"] is False
+    assert "retries exhausted" in result["error"].lower()
+    assert mock_get.call_count == tool.MAX_RETRIES
+
+
 # ==============================================================================
 # DATA STRUCTURE VALIDATION TESTS
 # ==============================================================================
@@ -633,7 +766,7 @@ def test_response_structure_complete(mock_get, tool, mock_summary_response):
     """Test that response has all required fields"""
     mock_response = Mock()
     mock_response.status_code = 200
-    mock_response.json.return_value = mock_summary_response
+    mock_response.content = orjson.dumps(mock_summary_response)
     mock_get.return_value = mock_response
 
     result = tool.execute(ticker="AAPL", endpoint="summary")
@@ -675,7 +808,7 @@ def test_integration_with_calculator_dcf(mock_get, tool, mock_keyratios_response
     # Mock GuruFocus API response
     mock_response = Mock()
     mock_response.status_code = 200
-    mock_response.json.return_value = mock_keyratios_response
+    mock_response.content = orjson.dumps(mock_keyratios_response)
     mock_get.return_value = mock_response
 
     # Get data from GuruFocus
@@ -716,7 +849,7 @@ def test_integration_with_calculator_margin_of_safety(mock_get, tool, mock_summa
     # Mock GuruFocus API response
     mock_response = Mock()
     mock_response.status_code = 200
-    mock_response.json.return_value = mock_summary_response
+    mock_response.content = orjson.dumps(mock_summary_response)
     mock_get.return_value = mock_response
 
     # Get price from GuruFocus
@@ -741,6 +874,221 @@ def test_integration_with_calculator_margin_of_safety(mock_get, tool, mock_summa
     assert mos_result["data"]["result"] > 0  # Positive margin
 
 
+# ==============================================================================
+# HELPER METHOD TESTS
+# ==============================================================================
+
+def test_series_stats_scales_and_filters_special_values(tool):
+    """Test _series_stats converts percentages and skips special values"""
+    stats = tool._series_stats([25.0, 9999, 0.2, "15", None])
+
+    assert stats["latest"] == 0.25
+    assert stats["mean_10y"] == pytest.approx((0.25 + 0.2 + 0.15) / 3)
+
+
+def test_series_stats_invalid_latest_and_missing_series(tool):
+    """Test _series_stats returns None latest for special value and None for no data"""
+    stats = tool._series_stats([10000, 5.0, 7.0], scale_if_pct=False)
+
+    assert stats["latest"] is None
+    assert stats["mean_10y"] == 6.0
+    assert tool._series_stats(None) is None
+    assert tool._series_stats([]) is None
+
+
+def test_session_shared_across_instances(mock_api_key):
+    """Test all tool instances reuse one pooled HTTP session"""
+    first = GuruFocusTool()
+    second = GuruFocusTool()
+
+    assert first.session is second.session
+    assert first.session.headers["Accept"] == "application/json"
+
+
+@patch('requests.Session.get')
+def test_concurrent_identical_requests_share_one_fetch(mock_get, tool, mock_summary_response):
+    """Test concurrent calls for the same ticker/endpoint make a single API request"""
+    import threading
+
+    entered = threading.Event()
+    release = threading.Event()
+
+    def slow_get(*args, **kwargs):
+        entered.set()
+        release.wait(timeout=5)
+        response = Mock()
+        response.status_code = 200
+        response.content = orjson.dumps(mock_summary_response)
+        return response
+
+    mock_get.side_effect = slow_get
+    results = []
+
+    def call():
+        results.append(tool.execute(ticker="AAPL", endpoint="summary"))
+
+    leader = threading.Thread(target=call)
+    leader.start()
+    assert entered.wait(timeout=5)
+
+    follower = threading.Thread(target=call)
+    follower.start()
+    time.sleep(0.1)  # let the follower join the in-flight request
+    release.set()
+    leader.join(timeout=5)
+    follower.join(timeout=5)
+
+    assert mock_get.call_count == 1
+    assert len(results) == 2
+    assert results[0] is results[1]
+    assert results[0]["success"] is True
+
+
+@patch('requests.Session.get')
+def test_raw_data_omitted_unless_requested(mock_get, tool, mock_summary_response):
+    """Test raw_data is only returned when include_raw is set"""
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.content = orjson.dumps(mock_summary_response)
+    mock_get.return_value = mock_response
+
+    result = tool.execute(ticker="AAPL", endpoint="summary")
+    assert result["success"] is True
+    assert "raw_data" not in result["data"]
+
+    tool.last_request_time = 0.0  # skip the rate-limit sleep
+    result = tool.execute(ticker="AAPL", endpoint="summary", include_raw=True)
+    assert result["data"]["raw_data"] == mock_summary_response
+
+
+@patch('requests.Session.get')
+def test_fetch_all_returns_every_endpoint(mock_get, tool, monkeypatch, mock_summary_response,
+                                          mock_financials_response, mock_keyratios_response,
+                                          mock_valuation_response):
+    """Test fetch_all fetches and processes all four endpoints for one ticker"""
+    payloads = {
+        "summary": mock_summary_response,
+        "financials": mock_financials_response,
+        "keyratios": mock_keyratios_response,
+        "valuation": mock_valuation_response,
+    }
+
+    def get(url, **kwargs):
+        response = Mock()
+        response.status_code = 200
+        response.content = orjson.dumps(payloads[url.rsplit("/", 1)[-1]])
+        return response
+
+    mock_get.side_effect = get
+    monkeypatch.setattr(tool, "MIN_INTERVAL", 0)
+
+    results = tool.fetch_all("AAPL")
+
+    assert list(results) == tool.VALID_ENDPOINTS
+    assert all(r["success"] for r in results.values())
+    assert all(results[e]["data"]["endpoint"] == e for e in results)
+    assert mock_get.call_count == 4
+
+
+def test_detect_special_values_deeply_nested(tool):
+    """Test special-value scan handles nesting deeper than the recursion limit"""
+    import sys
+
+    data = {"roic": 9999}
+    for _ in range(sys.getrecursionlimit() + 100):
+        data = {"level": [data]}
+
+    special_values = tool._detect_special_values(data)
+
+    assert len(special_values) == 1
+    assert special_values[0]["field"].endswith("[0].roic")
+
+
+def test_detect_special_values_visit_order(tool):
+    """Test a dict's own fields are reported first, then nested containers in document order"""
+    data = {
+        "a": {"debt_to_equity": 10000},
+        "b": [{"x": 9999}, {"y": 9999}],
+        "c": 9999,
+    }
+
+    fields = [sv["field"] for sv in tool._detect_special_values(data)]
+
+    assert fields == ["c", "a.debt_to_equity", "b[0].x", "b[1].y"]
+
+
+def test_safe_float_strings(tool):
+    """Test numeric strings parse and placeholder strings map to None"""
+    assert tool._safe_float("12.5") == 12.5
+    assert tool._safe_float(" -3 ") == -3.0
+    assert tool._safe_float("1e3") == 1000.0
+    assert tool._safe_float("9999") is None
+    for placeholder in ("N/A", "-", "", "nan", "abc"):
+        assert tool._safe_float(placeholder) is None
+
+
+@patch('requests.Session.get')
+def test_special_value_scan_skipped_without_codes_in_body(mock_get, tool, mock_summary_response):
+    """Test the tree walk is skipped when the response bytes contain no special code"""
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.content = orjson.dumps(mock_summary_response)
+    mock_get.return_value = mock_response
+    assert b"9999" not in mock_response.content and b"10000" not in mock_response.content
+
+    with patch.object(tool, "_detect_special_values", wraps=tool._detect_special_values) as mock_detect:
+        result = tool.execute(ticker="AAPL", endpoint="summary")
+
+    assert result["success"] is True
+    assert result["data"]["special_values_detected"] == []
+    assert mock_detect.call_args.kwargs["expect_specials"] is False
+
+
+def test_special_value_precheck_sees_exponent_encodings(tool):
+    """Test special codes written in exponent notation still trigger the scan"""
+    for body in (b'{"debt": 1e4}', b'{"debt": 1E+4}', b'{"pe": 9.999e3}'):
+        data, may_have_specials = tool._parse_response(body)
+        assert may_have_specials is True
+        assert tool._detect_special_values(data, expect_specials=may_have_specials)
+
+    assert tool._parse_response(b'{"name": "Apple", "pe": 25.3}')[1] is False
+
+
+def test_detect_special_values_skipped_when_not_expected(tool):
+    """Test expect_specials=False returns no detections without walking the data"""
+    data = {"profitability": {"roic": 9999}}
+
+    assert tool._detect_special_values(data, expect_specials=False) == []
+    assert len(tool._detect_special_values(data)) == 1
+
+
+@patch('requests.Session.get')
+def test_company_name_reused_across_endpoints(mock_get, tool, mock_summary_response,
+                                              mock_keyratios_response):
+    """Test a name learned from /summary is reported for endpoints without one"""
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_get.return_value = mock_response
+
+    mock_response.content = orjson.dumps(mock_summary_response)
+    name = tool.execute(ticker="AAPL", endpoint="summary")["data"]["company_name"]
+    assert name != "AAPL"
+
+    tool.last_request_time = 0.0  # skip the rate-limit sleep
+    mock_response.content = orjson.dumps(mock_keyratios_response)
+    result = tool.execute(ticker="AAPL", endpoint="keyratios")
+
+    assert result["data"]["company_name"] == name
+
+
+def test_extract_company_name_malformed_payloads(tool):
+    """Test malformed payloads fall back to the ticker without raising"""
+    assert tool._extract_company_name([], "summary", "AAPL") == "AAPL"
+    assert tool._extract_company_name({"general": None}, "summary", "AAPL") == "AAPL"
+    assert tool._extract_company_name({"general": ["Apple"]}, "summary", "AAPL") == "AAPL"
+    assert tool._extract_company_name({"general": {"name": ""}}, "summary", "AAPL") == "AAPL"
+
+
 # ==============================================================================
 # REAL API TESTS (REQUIRES API KEY)
 # ==============================================================================
@@ -29,6 +29,7 @@ Notes:
 import unittest
 import time
 import pytest
+import orjson
 from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime
 
@@ -45,6 +46,13 @@ def tool():
     return SECFilingTool()
 
 
+def full_text(tool, html_content):
+    """Run HTML through the streaming full-text parser, as a download would."""
+    parser = tool._new_text_parser()
+    parser.feed(html_content.encode('utf-8'))
+    return tool._clean_text(parser.close())
+
+
 @pytest.fixture
 def mock_ticker_to_cik_response():
     """Mock response from SEC company_tickers.json endpoint."""
@@ -239,7 +247,7 @@ class TestCIKLookup(unittest.TestCase):
         """Test successful CIK lookup."""
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = mock_ticker_to_cik_response
+        mock_response.content = orjson.dumps(mock_ticker_to_cik_response)
         mock_get.return_value = mock_response
 
         cik = tool._get_cik_from_ticker("AAPL")
@@ -252,7 +260,7 @@ class TestCIKLookup(unittest.TestCase):
         """Test CIK lookup caching works."""
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = mock_ticker_to_cik_response
+        mock_response.content = orjson.dumps(mock_ticker_to_cik_response)
         mock_get.return_value = mock_response
 
         # First lookup - should hit API
@@ -269,7 +277,7 @@ class TestCIKLookup(unittest.TestCase):
         """Test CIK lookup for non-existent ticker."""
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = mock_ticker_to_cik_response
+        mock_response.content = orjson.dumps(mock_ticker_to_cik_response)
         mock_get.return_value = mock_response
 
         cik = tool._get_cik_from_ticker("INVALID")
@@ -281,9 +289,9 @@ class TestCIKLookup(unittest.TestCase):
         """Test CIK is padded to 10 digits."""
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response.content = orjson.dumps({
             "0": {"cik_str": 123, "ticker": "TEST", "title": "Test Corp"}
-        }
+        })
         mock_get.return_value = mock_response
 
         cik = tool._get_cik_from_ticker("TEST")
@@ -304,7 +312,7 @@ class TestFilingRetrieval(unittest.TestCase):
         """Test finding latest 10-K filing."""
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = mock_company_submissions_response
+        mock_response.content = orjson.dumps(mock_company_submissions_response)
         mock_get.return_value = mock_response
 
         company_data = tool._get_company_submissions("0000320193")
@@ -320,7 +328,7 @@ class TestFilingRetrieval(unittest.TestCase):
         """Test finding 10-Q filing for specific quarter."""
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = mock_company_submissions_response
+        mock_response.content = orjson.dumps(mock_company_submissions_response)
         mock_get.return_value = mock_response
 
         company_data = tool._get_company_submissions("0000320193")
@@ -336,7 +344,7 @@ class TestFilingRetrieval(unittest.TestCase):
         """Test finding filing for specific year."""
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = mock_company_submissions_response
+        mock_response.content = orjson.dumps(mock_company_submissions_response)
         mock_get.return_value = mock_response
 
         company_data = tool._get_company_submissions("0000320193")
@@ -364,7 +372,7 @@ class TestFilingRetrieval(unittest.TestCase):
         """Test filing not found for requested type."""
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = mock_company_submissions_response
+        mock_response.content = orjson.dumps(mock_company_submissions_response)
         mock_get.return_value = mock_response
 
         company_data = tool._get_company_submissions("0000320193")
@@ -384,7 +392,7 @@ class TestTextExtraction(unittest.TestCase):
 
     def test_extract_full_text(self, tool, mock_10k_html_content):
         """Test extracting full text from HTML."""
-        text = tool._extract_full_text(mock_10k_html_content)
+        text = full_text(tool, mock_10k_html_content)
 
         assert "Business" in text
         assert "Risk Factors" in text
@@ -406,7 +414,7 @@ class TestTextExtraction(unittest.TestCase):
         """Test HTML entities are unescaped."""
         html_content = "<html><body><p>Test &amp; text with &#39;entities&#39;</p></body></html>"
 
-        text = tool._extract_full_text(html_content)
+        text = full_text(tool, html_content)
 
         assert "&amp;" not in text
         assert "&#39;" not in text
@@ -497,7 +505,7 @@ class TestErrorHandling(unittest.TestCase):
         # Mock empty response (ticker not found)
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {}
+        mock_response.content = b"{}"
         mock_get.return_value = mock_response
 
         result = tool.execute(ticker="INVALID", filing_type="10-K")
@@ -547,12 +555,12 @@ class TestErrorHandling(unittest.TestCase):
         # Mock CIK lookup success
         mock_cik_response = Mock()
         mock_cik_response.status_code = 200
-        mock_cik_response.json.return_value = mock_ticker_to_cik_response
+        mock_cik_response.content = orjson.dumps(mock_ticker_to_cik_response)
 
         # Mock company submissions with no 10-K
         mock_submissions_response = Mock()
         mock_submissions_response.status_code = 200
-        mock_submissions_response.json.return_value = {
+        mock_submissions_response.content = orjson.dumps({
             "name": "Apple Inc.",
             "filings": {
                 "recent": {
@@ -563,7 +571,7 @@ class TestErrorHandling(unittest.TestCase):
                     "primaryDocument": []
                 }
             }
-        }
+        })
 
         mock_get.side_effect = [mock_cik_response, mock_submissions_response]
 
@@ -2,11 +2,29 @@
 Simple working tests for SEC Filing Tool
 Demonstrates core functionality works
 """
+import os
+import threading
 import time
-from unittest.mock import Mock, patch
+import orjson
+import pytest
+from unittest.mock import MagicMock, Mock, patch
 from src.tools.sec_filing_tool import SECFilingTool
 
 
+@pytest.fixture(autouse=True)
+def fresh_ticker_map(monkeypatch):
+    """Give each test its own process-wide ticker→CIK state."""
+    monkeypatch.setattr(SECFilingTool, "ticker_map", None)
+    monkeypatch.setattr(SECFilingTool, "ticker_to_cik_cache", {})
+
+
+def full_text(tool, html):
+    """Run HTML through the streaming full-text parser, as a download would."""
+    parser = tool._new_text_parser()
+    parser.feed(html.encode('utf-8'))
+    return tool._clean_text(parser.close())
+
+
 def test_tool_initialization():
     """Test tool initializes correctly."""
     tool = SECFilingTool()
@@ -14,6 +32,32 @@ def test_tool_initialization():
     assert 'User-Agent' in tool.session.headers
 
 
+def test_session_adapter_retries():
+    """Test HTTPS adapter pools connections and retries transient errors."""
+    tool = SECFilingTool()
+    adapter = tool.session.get_adapter("https://www.sec.gov/")
+
+    assert adapter.max_retries.total == tool.MAX_RETRIES
+    assert 503 in adapter.max_retries.status_forcelist
+    assert "GET" in adapter.max_retries.allowed_methods
+    assert adapter.max_retries.read == 0  # 90s read timeouts are not retried
+
+
+def test_adapter_retries_back_off_and_respect_rate_limit():
+    """Test the first retry waits and every retry takes a rate-limit slot."""
+    tool = SECFilingTool()
+    retry = tool.session.get_adapter("https://www.sec.gov/").max_retries
+    response = Mock(status=503, headers={}, get_redirect_location=Mock(return_value=False))
+
+    first_retry = retry.increment(method="GET", url="/x", response=response)
+
+    assert first_retry.get_backoff_time() >= tool.RETRY_BACKOFF_MIN
+    with patch('urllib3.util.retry.time.sleep') as sleep:
+        first_retry.sleep()
+    assert sleep.call_args[0][0] >= tool.RETRY_BACKOFF_MIN
+    assert tool.last_request_time > 0  # The retry reserved a rate-limit slot
+
+
 def test_rate_limiting_interval():
     """Test rate limit interval is correct."""
     tool = SECFilingTool()
@@ -35,6 +79,23 @@ def test_rate_limit_enforcement():
     assert elapsed >= 0.4
 
 
+def test_rate_limit_enforcement_concurrent():
+    """Test concurrent callers still share the 110ms spacing."""
+    tool = SECFilingTool()
+    threads = [threading.Thread(target=tool._enforce_rate_limit) for _ in range(5)]
+
+    start = time.time()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.time() - start
+
+    # Five reserved slots span at least four intervals
+    assert elapsed >= 0.4
+    assert tool.last_request_time - start >= 0.4
+
+
 def test_input_validation_empty_ticker():
     """Test empty ticker returns error."""
     tool = SECFilingTool()
@@ -44,6 +105,18 @@ def test_input_validation_empty_ticker():
     assert "cannot be empty" in result["error"].lower()
 
 
+def test_input_validation_ticker_format():
+    """Test ticker validation follows the schema pattern."""
+    tool = SECFilingTool()
+
+    for ticker in ("AAPL", "BRK.B", "F"):
+        assert tool._validate_inputs(ticker, "10-K", "full", None) is None
+
+    for ticker in ("aapl", "BRK-B", "A1", "\u00c9DF", "TOOLONGX"):
+        error = tool._validate_inputs(ticker, "10-K", "full", None)
+        assert error is not None and "uppercase letters only" in error
+
+
 def test_input_validation_invalid_filing_type():
     """Test invalid filing type returns error."""
     tool = SECFilingTool()
@@ -53,6 +126,23 @@ def test_input_validation_invalid_filing_type():
     assert "invalid filing_type" in result["error"].lower()
 
 
+def test_execute_batch_preserves_order():
+    """Test batch execution returns one response per request, in order."""
+    tool = SECFilingTool()
+
+    results = tool.execute_batch([
+        {"ticker": "", "filing_type": "10-K"},
+        {"ticker": "AAPL", "filing_type": "INVALID"},
+        {"ticker": "MSFT", "filing_type": "10-Q"}
+    ])
+
+    assert len(results) == 3
+    assert "cannot be empty" in results[0]["error"].lower()
+    assert "invalid filing_type" in results[1]["error"].lower()
+    assert "quarter is required" in results[2]["error"].lower()
+    assert tool.execute_batch([]) == []
+
+
 @patch('requests.Session.get')
 def test_cik_lookup_success(mock_get):
     """Test successful CIK lookup."""
@@ -60,9 +150,9 @@ def test_cik_lookup_success(mock_get):
     
     mock_response = Mock()
     mock_response.status_code = 200
-    mock_response.json.return_value = {
+    mock_response.content = orjson.dumps({
         "0": {"cik_str": 320193, "ticker": "AAPL", "title": "Apple Inc."}
-    }
+    })
     mock_get.return_value = mock_response
     
     cik = tool._get_cik_from_ticker("AAPL")
@@ -71,6 +161,158 @@ def test_cik_lookup_success(mock_get):
     assert len(cik) == 10
 
 
+@patch('requests.Session.get')
+def test_ticker_map_downloaded_once(mock_get):
+    """Test the ticker map is fetched once and reused for later lookups."""
+    tool = SECFilingTool()
+
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.content = orjson.dumps({
+        "0": {"cik_str": 320193, "ticker": "AAPL", "title": "Apple Inc."},
+        "1": {"cik_str": 789019, "ticker": "MSFT", "title": "Microsoft Corp"}
+    })
+    mock_get.return_value = mock_response
+
+    assert tool._get_cik_from_ticker("AAPL") == "0000320193"
+    assert tool._get_cik_from_ticker("MSFT") == "0000789019"
+    assert tool._get_cik_from_ticker("ZZZZ") is None
+    assert mock_get.call_count == 1
+
+
+@patch('requests.Session.get')
+def test_ticker_map_first_duplicate_wins(mock_get):
+    """Test a ticker listed twice resolves to its first entry."""
+    tool = SECFilingTool()
+
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.content = orjson.dumps({
+        "0": {"cik_str": 1067983, "ticker": "BRK-B", "title": "Berkshire Hathaway Inc"},
+        "1": {"cik_str": 1234567, "ticker": "brk-b", "title": "Duplicate listing"}
+    })
+    mock_get.return_value = mock_response
+
+    assert tool._get_cik_from_ticker("BRK-B") == "0001067983"
+
+
+@patch('requests.Session.get')
+def test_ticker_map_persisted(mock_get, tmp_path, monkeypatch):
+    """Test a persisted ticker map is reused by a new process until stale."""
+    cache_path = str(tmp_path / "ticker_cik.json")
+    monkeypatch.setenv("SEC_TICKER_CACHE_PERSIST", "1")
+    monkeypatch.setattr(SECFilingTool, "TICKER_CACHE_PATH", cache_path)
+
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.content = orjson.dumps({
+        "0": {"cik_str": 320193, "ticker": "AAPL", "title": "Apple Inc."}
+    })
+    mock_get.return_value = mock_response
+
+    assert SECFilingTool()._get_cik_from_ticker("AAPL") == "0000320193"
+    assert mock_get.call_count == 1
+
+    # Fresh file: a new process never hits the network
+    monkeypatch.setattr(SECFilingTool, "ticker_map", None)
+    monkeypatch.setattr(SECFilingTool, "ticker_to_cik_cache", {})
+    assert SECFilingTool()._get_cik_from_ticker("AAPL") == "0000320193"
+    assert mock_get.call_count == 1
+
+    # Stale file: ignored and re-downloaded
+    monkeypatch.setattr(SECFilingTool, "ticker_map", None)
+    stale = time.time() - SECFilingTool.TICKER_CACHE_TTL - 60
+    os.utime(cache_path, (stale, stale))
+    SECFilingTool()
+    assert SECFilingTool.ticker_map is None
+
+
+@patch('requests.Session.get')
+def test_ticker_map_shared_across_instances(mock_get):
+    """Test concurrent lookups from separate tools download the map once."""
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.content = orjson.dumps({
+        "0": {"cik_str": 320193, "ticker": "AAPL", "title": "Apple Inc."}
+    })
+    mock_get.return_value = mock_response
+
+    tools = [SECFilingTool() for _ in range(4)]
+    results = []
+    threads = [
+        threading.Thread(target=lambda t=t: results.append(t._get_cik_from_ticker("AAPL")))
+        for t in tools
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == ["0000320193"] * 4
+    assert mock_get.call_count == 1
+
+
+@patch('requests.Session.get')
+def test_company_submissions_cached(mock_get, monkeypatch):
+    """Test submissions are reused per CIK and the cache stays bounded."""
+    monkeypatch.setattr(SECFilingTool, "SUBMISSIONS_CACHE_SIZE", 2)
+    tool = SECFilingTool()
+
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.content = orjson.dumps({"name": "Apple Inc.", "filings": {"recent": {"form": []}}})
+    mock_get.return_value = mock_response
+
+    first = tool._get_company_submissions("0000320193")
+    assert tool._get_company_submissions("0000320193") is first
+    assert mock_get.call_count == 1
+
+    tool._get_company_submissions("0000789019")
+    tool._get_company_submissions("0001652044")
+    assert list(tool._submissions_cache) == ["0000789019", "0001652044"]
+
+    # Evicted entry is fetched again
+    tool._get_company_submissions("0000320193")
+    assert mock_get.call_count == 4
+
+
+def test_find_filing_uses_form_index():
+    """Test filing lookup by form type, including the reused index."""
+    tool = SECFilingTool()
+    company_data = {
+        "cik": "320193",
+        "filings": {
+            "recent": {
+                "form": ["8-K", "10-Q", "10-K", "10-Q", "10-K"],
+                "accessionNumber": ["a0", "a1", "a2", "a3", "a4"],
+                "filingDate": ["2024-02-01", "2024-01-31", "2023-11-03", "2023-08-04", "2022-10-28"],
+                "reportDate": ["2024-02-01", "2023-12-30", "2023-09-30", "2023-07-01", "2022-09-24"],
+                "primaryDocument": ["d0", "d1", "d2", "d3", "d4"]
+            }
+        }
+    }
+
+    assert tool._find_filing(company_data, "10-K", None, None)["accession_number"] == "a2"
+    assert tool._find_filing(company_data, "10-K", 2022, None)["accession_number"] == "a4"
+    assert tool._find_filing(company_data, "10-Q", None, 3)["accession_number"] == "a3"
+    assert tool._find_filing(company_data, "20-F", None, None) is None
+
+    index = tool._get_form_index(company_data)
+    assert index["10-K"] == [2, 4]
+    assert tool._get_form_index(company_data) is index
+
+
+def test_form_index_cache_bounded(monkeypatch):
+    """Test the form index keeps no more companies than the submissions cache."""
+    monkeypatch.setattr(SECFilingTool, "SUBMISSIONS_CACHE_SIZE", 2)
+    tool = SECFilingTool()
+
+    for cik in ("320193", "789019", "1652044"):
+        tool._get_form_index({"cik": cik, "filings": {"recent": {"form": ["10-K"]}}})
+
+    assert list(tool._form_index_cache) == ["789019", "1652044"]
+
+
 def test_text_cleaning():
     """Test text cleaning functionality."""
     tool = SECFilingTool()
@@ -82,6 +324,195 @@ def test_text_cleaning():
     assert "\n\n\n" not in clean
 
 
+def test_full_text_skips_head_and_tables():
+    """Test full-text extraction keeps body prose only."""
+    tool = SECFilingTool()
+
+    html = (
+        "<html><head><title>Head title</title><style>p {}</style></head>"
+        "<body><div><p>Item 1. Business</p>"
+        "<table><tr><td>Table cell</td></tr></table></div>"
+        "<font>Loose body text</font></body></html>"
+    )
+    text = full_text(tool, html)
+
+    assert "Business" in text
+    assert "Loose body text" in text
+    assert "Head title" not in text
+    assert "Table cell" not in text
+
+
+def test_full_text_with_xml_declaration():
+    """Test inline-XBRL style filings with an XML declaration still parse."""
+    tool = SECFilingTool()
+
+    html = (
+        "<?xml version='1.0' encoding='ASCII'?>"
+        "<html><body><p>Caf\u00e9 revenue grew</p></body></html>"
+    )
+    text = full_text(tool, html)
+
+    assert text == "Caf\u00e9 revenue grew"
+
+
+def test_mda_section_with_typographic_apostrophe():
+    """Test MD&A header using a right single quote (&#8217;) is found."""
+    tool = SECFilingTool()
+
+    html = (
+        "<html><body>"
+        "<p>Item 7. Management&#8217;s Discussion and Analysis</p>"
+        "<p>Revenue increased due to higher iPhone sales.</p>"
+        "<p>Item 7A. Quantitative and Qualitative Disclosures</p>"
+        "</body></html>"
+    )
+    section = tool._extract_section(html, "mda")
+
+    assert "higher iPhone sales" in section
+    assert "Quantitative" not in section
+
+
+@patch('requests.Session.get')
+def test_download_filing_decodes_utf8(mock_get):
+    """Test filings are decoded as UTF-8 regardless of response.encoding."""
+    tool = SECFilingTool()
+
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.encoding = "ISO-8859-1"
+    mock_response.content = "<p>Management\u2019s Discussion \xff</p>".encode("utf-8") + b"\xff"
+    mock_get.return_value = mock_response
+
+    html = tool._download_filing("https://www.sec.gov/Archives/x.htm")
+
+    assert html == "<p>Management\u2019s Discussion \xff</p>\ufffd"
+
+
+def test_slice_body():
+    """Test filing bytes are cut to the body element when present."""
+    raw = b"<html><head><style>p {}</style></head><BODY><p>Text</p></BODY></html>"
+
+    assert SECFilingTool._slice_body(raw) == b"<BODY><p>Text</p></BODY>"
+    assert SECFilingTool._slice_body(b"<p>No body tag</p>") == b"<p>No body tag</p>"
+
+
+@patch('requests.Session.get')
+def test_download_filing_text_streams_chunks(mock_get):
+    """Test streamed chunks (split mid-character) parse into one text."""
+    tool = SECFilingTool()
+
+    mock_response = MagicMock()
+    mock_response.__enter__.return_value = mock_response
+    mock_response.iter_content.return_value = [
+        b"<html><body><p>Caf\xc3",
+        b"\xa9 revenue</p><script>var x;</script>",
+        b"<p>Next paragraph</p></body></html>"
+    ]
+    mock_get.return_value = mock_response
+
+    text = tool._download_filing_text("https://www.sec.gov/Archives/x.htm")
+
+    assert mock_get.call_args.kwargs["stream"] is True
+    assert "Caf\u00e9 revenue" in text
+    assert "Next paragraph" in text
+    assert "var x" not in text
+
+
+def test_streamed_text_skips_page_chrome_and_tables():
+    """Test the tree-less target drops skipped elements but keeps their tail text."""
+    tool = SECFilingTool()
+    html = (
+        "<html><head><title>10-K</title><style>p {}</style></head><body>"
+        "<header>Nav links</header><p>Caf&eacute; <b>bold</b> revenue.</p>"
+        "<table><tr><td>1,234</td></tr></table>Tail after table."
+        "<div><nav>Menu</nav>Segment results <script>x()</script>grew.</div>"
+        "<footer>Page 3</footer></body></html>"
+    )
+
+    text = full_text(tool, html)
+
+    assert text == "Caf\u00e9 bold revenue.Tail after table.Segment results grew."
+    assert "10-K" not in text
+
+
+def test_section_literal_and_regex_fallback():
+    """Test exact header spellings and formatting variants both resolve."""
+    tool = SECFilingTool()
+
+    text = "Cover page ITEM 1A. RISK FACTORS Supply risk. Item 2. Properties"
+    assert tool._find_section_literal(text, "risk_factors") == text.index("ITEM 1A")
+    assert tool._find_section_literal(text, "business") == -1
+
+    # Non-breaking space defeats the literal; the regex still finds it
+    html = (
+        "<html><body><p>Item 1.&#160;Business</p>"
+        "<p>We design smartphones, personal computers and wearables.</p>"
+        "<p>Item 1A. Risk Factors</p></body></html>"
+    )
+    section = tool._extract_section(html, "business")
+    assert "We design smartphones" in section
+    assert "Risk Factors" not in section
+
+
+def test_section_variant_header_before_literal_cross_reference():
+    """Test an earlier variant header wins over a later exact-spelling cross-reference."""
+    tool = SECFilingTool()
+    filler = "The Company designs and sells consumer hardware and software. " * 3
+    html = (
+        "<html><body>"
+        f"<p>ITEM 1 - BUSINESS</p><p>{filler}</p>"
+        "<p>Our segments are described in Item 1. Business above.</p>"
+        f"<p>Item 1A. Risk Factors</p><p>{filler}</p>"
+        "</body></html>"
+    )
+
+    section = tool._extract_section(html, "business")
+
+    assert section.startswith("ITEM 1 - BUSINESS")
+    assert "consumer hardware" in section
+
+
+def test_section_source_text_parsed_once_per_filing():
+    """Test extracting several sections of one filing reuses the parse."""
+    tool = SECFilingTool()
+    filler = "The Company designs and sells consumer hardware and software. " * 3
+    html = (
+        "<html><body>"
+        f"<p>Item 1. Business</p><p>{filler}</p>"
+        f"<p>Item 1A. Risk Factors</p><p>{filler}</p>"
+        "</body></html>"
+    )
+
+    with patch.object(tool, '_parse_html', wraps=tool._parse_html) as parse:
+        business = tool._extract_section(html, "business")
+        risk = tool._extract_section(html, "risk_factors")
+        tool._extract_section(html.replace("Business", "Overview"), "business")
+
+    assert "designs and sells" in business
+    assert "designs and sells" in risk
+    assert parse.call_count == 2
+
+
+def test_full_text_cached_per_filing_url():
+    """Test repeated full-text requests for one filing download it once."""
+    tool = SECFilingTool()
+    url = "https://www.sec.gov/Archives/x.htm"
+
+    with patch.object(tool, '_download_filing_text', return_value="Revenue   grew.") as download:
+        first = tool._get_full_text(url)
+        second = tool._get_full_text(url)
+        tool._get_full_text(url.replace("x.htm", "y.htm"))
+
+    assert first == second == "Revenue grew."
+    assert download.call_count == 2
+
+    # Failed downloads are not cached
+    with patch.object(tool, '_download_filing_text', return_value=None) as download:
+        assert tool._get_full_text("https://www.sec.gov/Archives/z.htm") is None
+        assert tool._get_full_text("https://www.sec.gov/Archives/z.htm") is None
+    assert download.call_count == 2
+
+
 def test_error_response_format():
     """Test error responses have correct format."""
     tool = SECFilingTool()
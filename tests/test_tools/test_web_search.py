@@ -20,6 +20,7 @@ Test Coverage:
 """
 
 import os
+import orjson
 import pytest
 import time
 from unittest.mock import Mock, patch
@@ -37,6 +38,12 @@ def mock_api_key(monkeypatch):
     monkeypatch.setenv("BRAVE_SEARCH_API_KEY", "test_api_key_12345")
 
 
+@pytest.fixture(autouse=True)
+def no_rate_limit(monkeypatch):
+    """Lift the shared search rate limit so mocked calls don't sleep"""
+    monkeypatch.setattr(WebSearchTool, "RATE_LIMIT_QPS", 1000.0)
+
+
 @pytest.fixture
 def tool(mock_api_key):
     """Create Web Search tool instance with mocked API key"""
@@ -167,7 +174,7 @@ def test_general_search_success(mock_get, tool, mock_search_response):
     """Test successful general search (mocked)"""
     mock_response = Mock()
     mock_response.status_code = 200
-    mock_response.json.return_value = mock_search_response
+    mock_response.content = orjson.dumps(mock_search_response)
     mock_get.return_value = mock_response
 
     result = tool.execute(query="Apple business model", count=10)
@@ -189,7 +196,7 @@ def test_company_context_addition(mock_get, tool, mock_search_response):
     """Test that company name is added to query automatically"""
     mock_response = Mock()
     mock_response.status_code = 200
-    mock_response.json.return_value = mock_search_response
+    mock_response.content = orjson.dumps(mock_search_response)
     mock_get.return_value = mock_response
 
     result = tool.execute(
@@ -208,7 +215,7 @@ def test_company_context_no_duplication(mock_get, tool, mock_search_response):
     """Test that company name is not duplicated if already in query"""
     mock_response = Mock()
     mock_response.status_code = 200
-    mock_response.json.return_value = mock_search_response
+    mock_response.content = orjson.dumps(mock_search_response)
     mock_get.return_value = mock_response
 
     result = tool.execute(
@@ -232,7 +239,7 @@ def test_news_search(mock_get, tool):
     """Test news-focused search"""
     mock_response = Mock()
     mock_response.status_code = 200
-    mock_response.json.return_value = {
+    mock_response.content = orjson.dumps({
         "web": {
             "results": [
                 {
@@ -244,7 +251,7 @@ def test_news_search(mock_get, tool):
                 }
             ]
         }
-    }
+    })
     mock_get.return_value = mock_response
 
     result = tool.execute(
@@ -266,7 +273,7 @@ def test_recent_search(mock_get, tool, mock_search_response):
     """Test recent search (last 30 days)"""
     mock_response = Mock()
     mock_response.status_code = 200
-    mock_response.json.return_value = mock_search_response
+    mock_response.content = orjson.dumps(mock_search_response)
     mock_get.return_value = mock_response
 
     result = tool.execute(
@@ -288,7 +295,7 @@ def test_freshness_day(mock_get, tool, mock_search_response):
     """Test freshness filter: day"""
     mock_response = Mock()
     mock_response.status_code = 200
-    mock_response.json.return_value = mock_search_response
+    mock_response.content = orjson.dumps(mock_search_response)
     mock_get.return_value = mock_response
 
     result = tool.execute(query="test", freshness="day")
@@ -304,7 +311,7 @@ def test_freshness_week(mock_get, tool, mock_search_response):
     """Test freshness filter: week"""
     mock_response = Mock()
     mock_response.status_code = 200
-    mock_response.json.return_value = mock_search_response
+    mock_response.content = orjson.dumps(mock_search_response)
     mock_get.return_value = mock_response
 
     result = tool.execute(query="test", freshness="week")
@@ -314,6 +321,163 @@ def test_freshness_week(mock_get, tool, mock_search_response):
     assert call_params["freshness"] == "pw"
 
 
+@patch('requests.Session.get')
+def test_search_type_filters(mock_get, tool, mock_search_response):
+    """Test news and recent searches add their Brave filter params"""
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.content = orjson.dumps(mock_search_response)
+    mock_get.return_value = mock_response
+
+    tool.execute(query="test", search_type="news", freshness="day")
+    call_params = mock_get.call_args[1]["params"]
+    assert call_params["result_filter"] == "news"
+    assert call_params["freshness"] == "pd"
+
+    tool.execute(query="test", search_type="recent")
+    call_params = mock_get.call_args[1]["params"]
+    assert call_params["freshness"] == "pm"
+    assert "result_filter" not in call_params
+
+
+@patch('requests.Session.get')
+def test_identical_searches_cached(mock_get, tool, mock_search_response, monkeypatch):
+    """Test repeated identical searches reuse the response until the TTL expires"""
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.content = orjson.dumps(mock_search_response)
+    mock_get.return_value = mock_response
+
+    first = tool.execute(query="Apple moat")
+    second = tool.execute(query="Apple moat")
+    tool.execute(query="Apple moat", freshness="week")
+
+    assert first["data"]["results"] == second["data"]["results"]
+    assert first["data"]["metadata"]["cached"] is False
+    assert second["data"]["metadata"]["cached"] is True
+    assert mock_get.call_count == 2
+
+    monkeypatch.setitem(WebSearchTool.SEARCH_CACHE_TTL, "general", 0)
+    tool.execute(query="Apple moat")
+    assert mock_get.call_count == 3
+
+    # TTL is per search type
+    tool.execute(query="Apple moat", search_type="news")
+    tool.execute(query="Apple moat", search_type="news")
+    assert mock_get.call_count == 4
+
+
+@patch('requests.Session.get')
+def test_concurrent_identical_searches_share_one_request(mock_get, tool, mock_search_response):
+    """Test a search issued while an identical one is in flight waits for it"""
+    import threading
+
+    entered = threading.Event()
+    release = threading.Event()
+
+    def slow_get(*args, **kwargs):
+        entered.set()
+        release.wait(timeout=5)
+        response = Mock()
+        response.status_code = 200
+        response.content = orjson.dumps(mock_search_response)
+        return response
+
+    mock_get.side_effect = slow_get
+    results = []
+
+    def call():
+        results.append(tool.execute(query="Apple CEO", company="Apple"))
+
+    leader = threading.Thread(target=call)
+    leader.start()
+    assert entered.wait(timeout=5)
+
+    follower = threading.Thread(target=call)
+    follower.start()
+    time.sleep(0.1)  # let the follower join the in-flight request
+    release.set()
+    leader.join(timeout=5)
+    follower.join(timeout=5)
+
+    assert mock_get.call_count == 1
+    assert len(results) == 2
+    assert all(r["success"] for r in results)
+    assert [r["data"]["metadata"]["cached"] for r in results] == [False, True]
+    assert tool._inflight == {}
+
+
+def test_rate_limit_spaces_bursts(monkeypatch):
+    """Test the shared token bucket allows one second's burst, then paces calls"""
+    sleeps = []
+    monkeypatch.setattr("src.tools.web_search_tool.time.sleep", sleeps.append)
+    monkeypatch.setattr(WebSearchTool, "RATE_LIMIT_QPS", 2.0)
+    monkeypatch.setattr(WebSearchTool, "_bucket_tokens", 2.0)
+    monkeypatch.setattr(WebSearchTool, "_bucket_updated", time.monotonic())
+
+    for _ in range(3):
+        WebSearchTool._acquire_rate_limit()
+
+    assert len(sleeps) == 1
+    assert sleeps[0] == pytest.approx(0.5, abs=0.05)
+
+
+def test_rate_limit_qps_from_env(mock_api_key, monkeypatch):
+    """Test WEB_SEARCH_QPS is read at init and invalid values fall back to the default"""
+    monkeypatch.setenv("WEB_SEARCH_QPS", "5")
+    WebSearchTool()
+    assert WebSearchTool.RATE_LIMIT_QPS == 5.0
+
+    for value in ("0", "-1", "abc", "nan", "inf"):
+        monkeypatch.setenv("WEB_SEARCH_QPS", value)
+        WebSearchTool()
+        assert WebSearchTool.RATE_LIMIT_QPS == WebSearchTool.DEFAULT_RATE_LIMIT_QPS
+
+
+def test_rate_limit_headers_drain_bucket(monkeypatch):
+    """Test an exhausted per-second window blocks until Brave's reset"""
+    sleeps = []
+    monkeypatch.setattr("src.tools.web_search_tool.time.sleep", sleeps.append)
+    monkeypatch.setattr(WebSearchTool, "RATE_LIMIT_QPS", 2.0)
+    monkeypatch.setattr(WebSearchTool, "_bucket_tokens", 2.0)
+    monkeypatch.setattr(WebSearchTool, "_bucket_updated", time.monotonic())
+
+    response = Mock()
+    response.headers = {"X-RateLimit-Remaining": "0, 1999", "X-RateLimit-Reset": "1, 2419200"}
+    WebSearchTool._observe_rate_limit(response)
+    WebSearchTool._acquire_rate_limit()
+
+    assert sleeps[0] == pytest.approx(1.0, abs=0.05)
+
+    # Remaining per-second budget leaves the bucket alone
+    response.headers = {"X-RateLimit-Remaining": "1, 1998", "X-RateLimit-Reset": "1, 2419200"}
+    monkeypatch.setattr(WebSearchTool, "_bucket_tokens", 2.0)
+    WebSearchTool._observe_rate_limit(response)
+    assert WebSearchTool._bucket_tokens == 2.0
+
+
+@patch('requests.Session.get')
+def test_execute_batch_preserves_order(mock_get, tool, mock_search_response):
+    """Test batch searches return one response per request, in order"""
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.content = orjson.dumps(mock_search_response)
+    mock_get.return_value = mock_response
+
+    results = tool.execute_batch([
+        {"query": "Apple moat"},
+        {"query": ""},
+        {"query": "Apple management", "search_type": "news"}
+    ])
+
+    assert len(results) == 3
+    assert results[0]["data"]["query"] == "Apple moat"
+    assert results[1]["success"] is False
+    assert results[2]["data"]["query"] == "Apple management"
+    assert mock_get.call_count == 2
+    assert tool.execute_batch([]) == []
+
+
 # ==============================================================================
 # HTML CLEANING TESTS
 # ==============================================================================
@@ -388,11 +552,23 @@ def test_parse_date_years(tool):
     assert result == expected
 
 
+def test_parse_date_reference_time(tool):
+    """Test ages are resolved against a supplied reference time"""
+    now = datetime(2024, 3, 1, 12, 0)
+
+    assert tool._parse_date("1 day ago", now) == "2024-02-29"
+    assert tool._parse_date("13 hours ago", now) == "2024-02-29"
+    assert tool._parse_date("1 year ago", now) == "2023-03-02"
+
+
 def test_parse_date_invalid(tool):
     """Test that invalid date strings return None"""
     assert tool._parse_date("") is None
     assert tool._parse_date("invalid") is None
     assert tool._parse_date("yesterday") is None
+    assert tool._parse_date("2 fortnights ago") is None
+    assert tool._parse_date("two days ago") is None
+    assert tool._parse_date("5 days") is None
 
 
 # ==============================================================================
@@ -416,6 +592,14 @@ def test_extract_domain_empty(tool):
     assert tool._extract_domain("") == ""
 
 
+def test_extract_domain_stops_at_query_and_fragment(tool):
+    """Test netloc ends at the first path, query or fragment delimiter"""
+    assert tool._extract_domain("https://www.sec.gov?action=getcompany") == "sec.gov"
+    assert tool._extract_domain("https://ft.com#top") == "ft.com"
+    assert tool._extract_domain("https://wsj.com/a?next=https://www.x.com/") == "wsj.com"
+    assert tool._extract_domain("apple.com/news") == ""
+
+
 # ==============================================================================
 # ERROR HANDLING TESTS
 # ==============================================================================
@@ -447,6 +631,47 @@ def test_rate_limit_429(mock_get, tool):
     assert "Rate limit" in result["error"]
 
 
+
+@patch('time.sleep')
+@patch('requests.Session.get')
+def test_rate_limit_429_short_retry_after(mock_get, mock_sleep, tool):
+    """Test a 429 asking for a short wait (per-second limit) is retried"""
+    mock_response_limited = Mock()
+    mock_response_limited.status_code = 429
+    mock_response_limited.headers = {"Retry-After": "1"}
+
+    mock_response_success = Mock()
+    mock_response_success.status_code = 200
+    mock_response_success.content = orjson.dumps({"web": {"results": []}})
+
+    mock_get.side_effect = [mock_response_limited, mock_response_success]
+
+    result = tool.execute(query="test")
+
+    assert result["success"] is True
+    mock_sleep.assert_called_once_with(1.0)
+
+
+@patch('time.sleep')
+@patch('requests.Session.get')
+def test_server_error_honours_retry_after(mock_get, mock_sleep, tool):
+    """Test 5xx retries wait as long as Retry-After asks, up to the cap"""
+    mock_response_fail = Mock()
+    mock_response_fail.status_code = 503
+    mock_response_fail.headers = {"Retry-After": "3600"}
+
+    mock_response_success = Mock()
+    mock_response_success.status_code = 200
+    mock_response_success.content = orjson.dumps({"web": {"results": []}})
+
+    mock_get.side_effect = [mock_response_fail, mock_response_success]
+
+    result = tool.execute(query="test")
+
+    assert result["success"] is True
+    mock_sleep.assert_called_once_with(tool.MAX_RETRY_AFTER)
+
+
 @patch('requests.Session.get')
 def test_server_error_500_with_retries(mock_get, tool):
     """Test handling of server error (500) with retries"""
@@ -456,7 +681,7 @@ def test_server_error_500_with_retries(mock_get, tool):
 
     mock_response_success = Mock()
     mock_response_success.status_code = 200
-    mock_response_success.json.return_value = {"web": {"results": []}}
+    mock_response_success.content = orjson.dumps({"web": {"results": []}})
 
     mock_get.side_effect = [mock_response_fail, mock_response_fail, mock_response_success]
 
@@ -475,7 +700,7 @@ def test_timeout_with_retries(mock_get, tool):
     # First attempt times out, second succeeds
     mock_response_success = Mock()
     mock_response_success.status_code = 200
-    mock_response_success.json.return_value = {"web": {"results": []}}
+    mock_response_success.content = orjson.dumps({"web": {"results": []}})
 
     mock_get.side_effect = [
         requests.exceptions.Timeout("Request timeout"),
@@ -498,7 +723,7 @@ def test_response_structure_complete(mock_get, tool, mock_search_response):
     """Test that response has all required fields"""
     mock_response = Mock()
     mock_response.status_code = 200
-    mock_response.json.return_value = mock_search_response
+    mock_response.content = orjson.dumps(mock_search_response)
     mock_get.return_value = mock_response
 
     result = tool.execute(query="test")
@@ -532,7 +757,7 @@ def test_rag_snippets_extracted(mock_get, tool, mock_search_response):
     """Test that RAG-optimized snippets are extracted"""
     mock_response = Mock()
     mock_response.status_code = 200
-    mock_response.json.return_value = mock_search_response
+    mock_response.content = orjson.dumps(mock_search_response)
     mock_get.return_value = mock_response
 
     result = tool.execute(query="test")
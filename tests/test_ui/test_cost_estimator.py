@@ -94,6 +94,38 @@ def test_sharia_screen_estimate():
         print(f"FAILED: {result.get('error', 'Unknown error')}")
         print(f"   Fallback estimate: ${result['total_estimated_cost']:.2f}")
 
+def test_token_counts_cached(monkeypatch):
+    """Test repeat estimates for the same ticker reuse the token count"""
+    from types import SimpleNamespace
+    from unittest.mock import Mock
+
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test_key")
+    estimator = CostEstimator()
+    estimator.client = Mock()
+    estimator.client.messages.count_tokens.return_value = SimpleNamespace(input_tokens=1000)
+
+    agent = Mock(MODEL="model", THINKING_BUDGET=100, system_prompt="system")
+    agent._get_tool_definitions.return_value = []
+
+    first = estimator.estimate_deep_dive_cost("AAPL", 3, agent)
+    second = estimator.estimate_deep_dive_cost("AAPL", 3, agent)
+    estimator.estimate_deep_dive_cost("AAPL", 5, agent)
+    estimator.estimate_quick_screen_cost("AAPL", agent)
+
+    assert first["success"] and first == second
+    assert estimator.client.messages.count_tokens.call_count == 3
+
+
+def test_shared_client_leaves_retries_to_retry_policy(monkeypatch):
+    """Test the shared client doesn't retry on its own (src.utils.retry does)"""
+    from src.llm.clients import get_anthropic_client
+
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test_key")
+    estimator = CostEstimator()
+
+    assert estimator.client is get_anthropic_client("test_key")
+    assert estimator.client.max_retries == 0
+
 if __name__ == "__main__":
     print("\nTesting Cost Estimator")
     print("This will use the Anthropic token counting API to estimate costs")